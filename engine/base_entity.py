@@ -23,6 +23,13 @@ class Entity(pygame.sprite.Sprite):
         self.container = None
 
         self.body = None
+
+        # Pooling (see engine/pool.py). Set by EntityPool.register().
+        self.archetype = None
+        self.pool = None
+        self.pooled = False   # On a free list
+        self.released = False # Handed back (on a free list or discarded) and not reused yet
+        self.pool_gen = 0 # Archetype generation it was built for (see EntityPool.retire)
         
         # --- ENGINE FIX: Default Placeholders ---
         # Initialize empty defaults so Pygame doesn't crash if we draw
@@ -51,4 +58,64 @@ class Entity(pygame.sprite.Sprite):
             self.rect.y = int(self.pos_y)
     
     def cfg_control(self, ctrl):
-        self.control = ctrl
\ No newline at end of file
+        self.control = ctrl
+
+    def place(self, x, y):
+        """Moves the entity to grid coords (x, y), e.g. when reusing a pooled entity."""
+        self.pos_x = x * TILESIZE
+        self.pos_y = y * TILESIZE
+
+    def despawn(self):
+        """
+        Removes the entity from the world for good.
+        Unlike kill() (which only leaves the sprite groups, e.g. when an item is
+        picked up), this hands the entity back to its pool for reuse.
+        """
+        self.kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def catch_up(self, elapsed):
+        """
+        Advances the entity 'elapsed' seconds in one step after it was dormant
+        (see LODSystem). Components opt in with catch_up(owner, game, elapsed);
+        the rest simply resume on the next regular update.
+        """
+        for name, comp in list(vars(self).items()):
+            if name in ("game", "pool"):
+                continue
+            if hasattr(comp, 'catch_up'):
+                comp.catch_up(self, self.game, elapsed)
+        self.refresh_visuals()
+
+    def recycle(self):
+        """
+        Called by the pool on release. Lets components drop per-life state
+        (equipped gear, container contents) so nothing leaks into the next spawn.
+        """
+        for name, comp in list(vars(self).items()):
+            if name in ("game", "pool"):
+                continue
+            if hasattr(comp, 'recycle'):
+                comp.recycle(self)
+
+
+class TrackedGroup(pygame.sprite.Group):
+    """
+    A sprite Group that tells its listeners when sprites join or leave it,
+    so systems (LOD, spatial hash) can keep their own indexes without
+    rescanning. Each listener needs on_add(sprite) and on_remove(sprite).
+    """
+    def __init__(self, *sprites, listeners=()):
+        self.listeners = tuple(listeners)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        for listener in self.listeners:
+            listener.on_add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        for listener in self.listeners:
+            listener.on_remove(sprite)
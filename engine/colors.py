@@ -1,8 +1,20 @@
 import pygame
-import spectra
-import hsluv
 from typing import Union, List, Tuple, Dict, Any, Optional
 
+# spectra (with colormath and networkx under it) takes ~100 ms to import,
+# so it is only imported the first time a color name or a scale needs it.
+# Resolved names and built scales are kept, so that happens once.
+_spectra = None
+
+def _spectra_mod():
+    global _spectra
+    if _spectra is None:
+        import spectra
+        _spectra = spectra
+    return _spectra
+
+_NAMED: Dict[str, pygame.Color] = {} # Resolved color strings
+
 # --- 3. CUSTOM COLOR GENERATORS ---
 
 def gris(v: int) -> pygame.Color:
@@ -46,28 +58,38 @@ def get(value: Union[str, Tuple, List, Dict, pygame.Color]) -> pygame.Color:
     # 4. String? (The magic part)
     if isinstance(value, str):
         value = value.strip().lower()
-        # A. Check Spectra's HTML names
-        try:
-            return pygame.Color(spectra.html(value).values)
-        except ValueError:
-            pass
-        # B. Check Standard Pygame/Hex/HTML names
-        try:
-            return pygame.Color(value)
-        except ValueError:
-            pass
-        try:
-            return pygame.Color("#" + value)
-        except ValueError:
-            pass
-        # C. Handle custom "gris" values
-        if value.startswith("gris"):
-            return pygame.Color(gris(int(value[4:])))
+        color = _NAMED.get(value)
+        if color is None:
+            color = _resolve_name(value)
+            if color is not None:
+                _NAMED[value] = color
+        if color is not None:
+            return pygame.Color(color) # A copy: callers may change it
             
     # 5. Fallback (magenta) to indicate error visibly)
     print(f"[Color] Warning: Could not resolve color '{value}'. returning MAGENTA.")
     return pygame.Color("magenta")
 
+def _resolve_name(value: str) -> Optional[pygame.Color]:
+    # A. Check Spectra's HTML names
+    try:
+        return pygame.Color(_spectra_mod().html(value).values)
+    except ValueError:
+        pass
+    # B. Check Standard Pygame/Hex/HTML names
+    try:
+        return pygame.Color(value)
+    except ValueError:
+        pass
+    try:
+        return pygame.Color("#" + value)
+    except ValueError:
+        pass
+    # C. Handle custom "gris" values
+    if value.startswith("gris"):
+        return pygame.Color(gris(int(value[4:])))
+    return None
+
 # --- 5. SPECTRA INTEGRATION ---
 
 def df_scale(colors_list: List[Any]):
@@ -82,37 +104,54 @@ def df_scale(colors_list: List[Any]):
         # Spectra prefers Hex strings
         sanitized.append("#%02x%02x%02x" % (col.r, col.g, col.b))
             
-    return spectra.scale(sanitized)    
+    return _spectra_mod().scale(sanitized)    
 
 # --- 6. PALETTES & THEMES ---
-
-# Day-Night Cycle
-_cycle = df_scale([
-    "midnightblue", 
-    "lightsalmon",    
-    "white",        
-    "thistle",        
-    "midnightblue"
-])
+# Scales are described here and built by scale() the first time they're used
+
+_SCALES = {
+    # Day-Night Cycle
+    "cycle": (["midnightblue", "lightsalmon", "white", "thistle", "midnightblue"], None),
+    # Terrain / Encumbrance / Heat
+    "veg":  (["slategray", "sienna", "forestgreen"], [0, 10, 100]),
+    "enc":  (["palegreen", "khaki", "lightsalmon"], [0, 100, 200]),
+    "heat": (["skyblue", "palegreen", "khaki", "lightsalmon"], [0, 100, 150, 200]),
+    # Alternatives (see registries below)
+    "enc_high_contrast": (["white", "gray", "black"], [0, 50, 100]),
+    "heat_industrial":   (["GRIS34", "goldenrod", "orangered"], [0, 100, 200]),
+}
+_BUILT_SCALES = {}
+
+def scale(name: str):
+    """The spectra scale called 'name', built on first use."""
+    built = _BUILT_SCALES.get(name)
+    if built is None:
+        colors, domain = _SCALES[name]
+        built = df_scale(colors)
+        if domain is not None:
+            built = built.domain(domain)
+        _BUILT_SCALES[name] = built
+    return built
+
+def warm():
+    """Imports spectra and builds every scale now (e.g. on a startup worker thread)."""
+    for name in _SCALES:
+        scale(name)
+    return len(_BUILT_SCALES)
 
 def get_day_night_cycle(t: float) -> Tuple[int, int, int]:
     """t: 0.0 (midnight) -> 0.5 (noon) -> 1.0 (midnight)."""
-    vals = _cycle(t).to("rgb").values
+    vals = scale("cycle")(t).to("rgb").values
     return tuple(int(c) for c in vals)
 
-# Terrain / Encumbrance / Heat
-_veg = df_scale(["slategray", "sienna", "forestgreen"]).domain([0, 10, 100])
-_enc = df_scale(["palegreen", "khaki", "lightsalmon"]).domain([0, 100, 200])
-_heat = df_scale(["skyblue", "palegreen", "khaki", "lightsalmon"]).domain([0, 100, 150, 200])
-
 def get_terrain_color(pct: float) -> pygame.Color:
-    return pygame.Color(*[int(c) for c in _veg(pct).to("rgb").values])
+    return pygame.Color(*[int(c) for c in scale("veg")(pct).to("rgb").values])
 
 def get_enc_color(pct: float) -> pygame.Color:
-    return pygame.Color(*[int(c) for c in _enc(pct).to("rgb").values])
+    return pygame.Color(*[int(c) for c in scale("enc")(pct).to("rgb").values])
 
 def get_heat_color(pct: float) -> pygame.Color:
-    return pygame.Color(*[int(c) for c in _heat(pct).to("rgb").values])
+    return pygame.Color(*[int(c) for c in scale("heat")(pct).to("rgb").values])
 
 # --- 7. WEATHER & TINTS ---
 
@@ -135,8 +174,8 @@ def apply_weather_tint(original: pygame.Color, weather_type: str) -> pygame.Colo
 # --- 8. CONFIGURATION & STATE ---
 
 _SETTINGS = {} 
-_ACTIVE_ENCUMBRANCE = _enc
-_ACTIVE_THERMAL = _heat
+_ACTIVE_ENCUMBRANCE = "enc"  # Scale names (see scale())
+_ACTIVE_THERMAL = "heat"
 _ACTIVE_UI_THEME = {"text": "whitesmoke", "bg": "black", "highlight": "cornflowerblue"}
 _ACTIVE_CB_MATRIX = None
 
@@ -149,13 +188,13 @@ _CB_MATRICES = {
 # Replaced hex with readable names or GRIS values
 
 _ENCUMBRANCE_SCALES = {
-    "default": _enc,
-    "high_contrast": df_scale(["white", "gray", "black"]).domain([0, 50, 100]),
+    "default": "enc",
+    "high_contrast": "enc_high_contrast",
 }
 
 _THERMAL_SCALES = {
-    "default": _heat,
-    "industrial": df_scale(["GRIS34", "goldenrod", "orangered"]).domain([0, 100, 200]),
+    "default": "heat",
+    "industrial": "heat_industrial",
 }
 
 _UI_THEMES = {
@@ -176,8 +215,7 @@ def configure(settings_data: Dict[str, Any]):
     mode = _SETTINGS.get("colorblind_mode", "off").lower()
     _ACTIVE_CB_MATRIX = _CB_MATRICES.get(mode, None)
 
-# Initialize defaults
-configure({"color": {}}) 
+# Defaults above stand until configure() is called with the game's settings
 
 def _apply_cb_filter(c: pygame.Color) -> pygame.Color:
     if _ACTIVE_CB_MATRIX is None:
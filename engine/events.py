@@ -1,56 +1,128 @@
 import pygame
 import sys
-from typing import List, Optional
+import weakref
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 
 class Signal:
     """
     A specific channel that subscribers can listen to.
+    Subscribers are held strongly. Pass weak=True with a bound method to
+    let it drop out on its own once its object is gone, instead of keeping
+    the object alive. Plain functions and lambdas can't be weak: nothing
+    else holds a closure, so it would vanish silently.
     """
     def __init__(self):
         self._subscribers = []
 
-    def connect(self, func):
+    @staticmethod
+    def _ref(func, weak):
+        if not weak:
+            return lambda: func
+        if not (hasattr(func, '__self__') and hasattr(func, '__func__')):
+            raise TypeError(f"weak=True needs a bound method, got {func!r}")
+        return weakref.WeakMethod(func)
+
+    def connect(self, func, weak=False):
         """Adds a function to be called when this signal emits."""
-        if func not in self._subscribers:
-            self._subscribers.append(func)
+        for ref in self._subscribers:
+            if ref() == func:
+                return
+        self._subscribers.append(self._ref(func, weak))
 
     def disconnect(self, func):
-        if func in self._subscribers:
-            self._subscribers.remove(func)
+        self._subscribers = [ref for ref in self._subscribers if ref() not in (func, None)]
 
     def emit(self, data=None):
         """Calls all connected subscribers with the provided data."""
-        for func in self._subscribers:
+        dead = False
+        for ref in tuple(self._subscribers):
+            func = ref()
+            if func is None:
+                dead = True
+                continue
             func(data)
+        if dead:
+            self._subscribers = [ref for ref in self._subscribers if ref() is not None]
 
 class EventBus:
     """
     The central hub for global game events.
-    """
-    def __init__(self):
-        self.signals = {}
 
-    def subscribe(self, topic: str, func):
+    Topics are interned to small integer IDs (see topic_id()); hot emitters can
+    cache the ID and pass it instead of the string.
+
+    In queued mode, emit() only appends to a queue and subscribers run when
+    flush() is called (once per tick, after the systems have finished
+    iterating). Events emitted by subscribers during a flush wait for the next.
+
+    Tracing is off unless trace_size > 0, in which case the last trace_size
+    events are kept in an in-memory ring buffer (self.trace).
+    """
+    def __init__(self, queued: bool = False, trace_size: int = 0):
+        self.queued = queued
+        self._topic_ids: Dict[str, int] = {}
+        self.topics: List[str] = []       # ID -> name
+        self.signals: List[Signal] = []   # ID -> Signal
+        self._queue = []
+        self.trace = deque(maxlen=trace_size) if trace_size > 0 else None
+
+    def topic_id(self, topic) -> int:
+        """Returns the interned ID for 'topic' (string or existing ID)."""
+        if isinstance(topic, int):
+            return topic
+        tid = self._topic_ids.get(topic)
+        if tid is None:
+            tid = len(self.topics)
+            self._topic_ids[sys.intern(topic)] = tid
+            self.topics.append(topic)
+            self.signals.append(Signal())
+        return tid
+
+    def subscribe(self, topic, func, weak=False):
         """
-        Listens for a specific topic string (e.g., "mob_killed").
+        Listens for a specific topic (e.g., "mob_killed").
         Creates the Signal automatically if it doesn't exist.
+        weak=True (bound methods only) drops it once its object is gone.
         """
-        if topic not in self.signals:
-            self.signals[topic] = Signal()
-        self.signals[topic].connect(func)
+        self.signals[self.topic_id(topic)].connect(func, weak)
 
-    def unsubscribe(self, topic: str, func):
-        if topic in self.signals:
-            self.signals[topic].disconnect(func)
+    def unsubscribe(self, topic, func):
+        tid = self._topic_ids.get(topic, topic)
+        if isinstance(tid, int) and tid < len(self.signals):
+            self.signals[tid].disconnect(func)
 
-    def emit(self, topic: str, data=None):
+    def emit(self, topic, data=None):
         """
-        Broadcasts an event to all subscribers of 'topic'.
+        Broadcasts an event to all subscribers of 'topic'
+        (deferred until flush() in queued mode).
         """
-        if topic in self.signals:
-            self.signals[topic].emit(data)
-        # Optional: Debug log
-        print(f"[EventBus] Emitted '{topic}' with payload: {data}")
+        tid = self.topic_id(topic)
+        if self.trace is not None:
+            self.trace.append((tid, data))
+        if self.queued:
+            self._queue.append((tid, data))
+        else:
+            self.signals[tid].emit(data)
+
+    def flush(self) -> int:
+        """Dispatches every queued event in emit order. Returns how many ran."""
+        if not self._queue:
+            return 0
+        batch, self._queue = self._queue, []
+        signals = self.signals
+        for tid, data in batch:
+            signals[tid].emit(data)
+        return len(batch)
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def dump_trace(self) -> List[Tuple[str, object]]:
+        """Returns the traced events with topic names resolved, oldest first."""
+        if self.trace is None:
+            return []
+        return [(self.topics[tid], data) for tid, data in self.trace]
 
 class GameState:
     """
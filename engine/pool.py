@@ -0,0 +1,135 @@
+import logging
+from typing import Any, Dict, Hashable, List, Optional
+
+from game.deebee import POOL_MAX_RETAINED
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """
+    Counters for a single archetype's pool.
+    """
+    __slots__ = ("created", "reused", "released", "discarded", "live", "peak_live")
+
+    def __init__(self):
+        self.created = 0    # Fresh entities built because the pool was empty
+        self.reused = 0     # Acquisitions served from the free list
+        self.released = 0   # Entities handed back via despawn()
+        self.discarded = 0  # Releases dropped because the pool was at capacity
+        self.live = 0       # Entities currently out in the world
+        self.peak_live = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class EntityPool:
+    """
+    Per-archetype free lists for recycling entities.
+
+    An archetype is any hashable key, e.g. ("mob", "goblin") or ("item", "apple").
+    Factories call acquire() first and only build a new entity on a miss;
+    Entity.despawn() hands the entity back through release().
+    """
+    def __init__(self, max_retained: int = POOL_MAX_RETAINED):
+        self.max_retained = max_retained
+        self._free: Dict[Hashable, List[Any]] = {}
+        self._stats: Dict[Hashable, PoolStats] = {}
+        self._gen: Dict[Hashable, int] = {} # Bumped by retire()
+
+    def _stats_for(self, archetype: Hashable) -> PoolStats:
+        stats = self._stats.get(archetype)
+        if stats is None:
+            stats = self._stats[archetype] = PoolStats()
+        return stats
+
+    def acquire(self, archetype: Hashable) -> Optional[Any]:
+        """
+        Pops a recycled entity for 'archetype', or returns None on a miss.
+        The caller is responsible for resetting per-life state.
+        """
+        free = self._free.get(archetype)
+        if not free:
+            return None
+        entity = free.pop()
+        entity.pooled = False
+        entity.released = False
+
+        stats = self._stats_for(archetype)
+        stats.reused += 1
+        stats.live += 1
+        if stats.live > stats.peak_live:
+            stats.peak_live = stats.live
+        return entity
+
+    def register(self, entity, archetype: Hashable):
+        """Tags a freshly built entity so it returns here when despawned."""
+        entity.archetype = archetype
+        entity.pool = self
+        entity.pooled = False
+        entity.released = False
+        entity.pool_gen = self._gen.get(archetype, 0)
+
+        stats = self._stats_for(archetype)
+        stats.created += 1
+        stats.live += 1
+        if stats.live > stats.peak_live:
+            stats.peak_live = stats.live
+        return entity
+
+    def release(self, entity):
+        """
+        Takes back an entity that has left the world.
+        Entities beyond 'max_retained' per archetype are left for the GC.
+        """
+        if entity.released:
+            return # Double despawn (e.g. two hits in one frame), already handled
+        entity.released = True
+
+        stats = self._stats_for(entity.archetype)
+        stats.released += 1
+        stats.live = max(0, stats.live - 1)
+
+        # Decided before recycle(): components may keep things attached
+        # (e.g. a mob's stock gear) only on an entity that is coming back
+        free = self._free.setdefault(entity.archetype, [])
+        entity.pooled = len(free) < self.max_retained and self.is_current(entity)
+        entity.recycle()
+
+        if not entity.pooled:
+            stats.discarded += 1
+            return
+        free.append(entity)
+
+    def retire(self, archetype: Hashable):
+        """
+        The archetype's definition changed (e.g. data hot-reload): retained
+        entities are dropped, and ones still out in the world are not taken
+        back when they despawn, so every new one is built fresh.
+        """
+        self._gen[archetype] = self._gen.get(archetype, 0) + 1
+        self._free.pop(archetype, None)
+
+    def is_current(self, entity) -> bool:
+        """False if the entity's archetype was retired after it was built."""
+        return entity.pool_gen == self._gen.get(entity.archetype, 0)
+
+    def retained(self, archetype: Hashable) -> int:
+        return len(self._free.get(archetype, ()))
+
+    def stats(self) -> Dict[Hashable, Dict[str, int]]:
+        """Returns a snapshot of the counters plus the free-list size per archetype."""
+        report = {}
+        for archetype, stats in self._stats.items():
+            entry = stats.as_dict()
+            entry["retained"] = self.retained(archetype)
+            report[archetype] = entry
+        return report
+
+    def clear(self):
+        """Drops every retained entity (e.g. on a new game or load)."""
+        self._free.clear()
+        for stats in self._stats.values():
+            stats.live = 0
+        logger.debug("EntityPool cleared.")
@@ -0,0 +1,121 @@
+import time
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledSystem:
+    """
+    Bookkeeping for one system registered with the SystemScheduler.
+    """
+    __slots__ = ("name", "func", "order", "rate_hz", "interval", "deferrable",
+                 "accumulator", "last_ms", "avg_ms", "runs", "deferrals", "deferred_frames")
+
+    def __init__(self, name: str, func: Callable[[float], None], order: int,
+                 rate_hz: Optional[float], deferrable: bool):
+        self.name = name
+        self.func = func
+        self.order = order
+        self.rate_hz = rate_hz
+        self.interval = 1.0 / rate_hz if rate_hz else 0.0 # 0 = every tick
+        self.deferrable = deferrable
+
+        self.accumulator = 0.0   # Sim time since this system last ran
+        self.last_ms = 0.0
+        self.avg_ms = 0.0        # Exponential moving average
+        self.runs = 0
+        self.deferrals = 0
+        self.deferred_frames = 0 # Consecutive frames skipped for budget
+
+
+class SystemScheduler:
+    """
+    Runs simulation systems in a fixed order, each at its own rate,
+    inside a per-frame time budget.
+
+    - order: lower runs first.
+    - rate_hz: None runs every tick; otherwise the system runs once enough
+      sim time has accumulated and receives that whole span as its dt.
+    - deferrable: when the frame's budget is spent (or the system's average
+      cost would overrun it), deferrable systems are pushed to a later
+      frame (their dt keeps accumulating). After max_defer_frames
+      consecutive deferrals a system runs anyway.
+    """
+    def __init__(self, budget_ms: float = 4.0, max_defer_frames: int = 10):
+        self.budget_ms = budget_ms
+        self.max_defer_frames = max_defer_frames
+        self._systems: List[ScheduledSystem] = []
+        self.time = 0.0 # Sim seconds since start; a clock for lazy state (e.g. material decay)
+        self.frame_ms = 0.0
+        self.frames = 0
+        self.over_budget_frames = 0
+
+    def add(self, name: str, func: Callable[[float], None], order: int = 0,
+            rate_hz: Optional[float] = None, deferrable: bool = False) -> ScheduledSystem:
+        """Registers func(dt) under 'name'. Re-adding a name replaces it."""
+        self.remove(name)
+        system = ScheduledSystem(name, func, order, rate_hz, deferrable)
+        self._systems.append(system)
+        # Stable sort keeps registration order among equal 'order' values
+        self._systems.sort(key=lambda s: s.order)
+        return system
+
+    def remove(self, name: str):
+        self._systems = [s for s in self._systems if s.name != name]
+
+    def get(self, name: str) -> Optional[ScheduledSystem]:
+        for system in self._systems:
+            if system.name == name:
+                return system
+        return None
+
+    def update(self, dt: float):
+        """Runs every system that is due this frame."""
+        perf = time.perf_counter
+        budget = self.budget_ms
+        spent = 0.0
+        self.time += dt
+
+        for system in self._systems:
+            system.accumulator += dt
+            if system.accumulator < system.interval:
+                continue
+
+            # Defer if the budget is spent, or this system's typical cost would blow it
+            if (system.deferrable and spent + system.avg_ms > budget
+                    and system.deferred_frames < self.max_defer_frames):
+                system.deferrals += 1
+                system.deferred_frames += 1
+                continue
+
+            start = perf()
+            system.func(system.accumulator)
+            ms = (perf() - start) * 1000.0
+
+            system.last_ms = ms
+            system.avg_ms = ms if system.runs == 0 else system.avg_ms * 0.9 + ms * 0.1
+            system.runs += 1
+            system.deferred_frames = 0
+            # The whole span was handed over as dt, so nothing carries over
+            system.accumulator = 0.0
+            spent += ms
+
+        self.frame_ms = spent
+        self.frames += 1
+        if spent > budget:
+            self.over_budget_frames += 1
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Per-system timings, in execution order."""
+        return {
+            s.name: {
+                "order": s.order,
+                "rate_hz": s.rate_hz or 0,
+                "last_ms": s.last_ms,
+                "avg_ms": s.avg_ms,
+                "runs": s.runs,
+                "deferrals": s.deferrals,
+            }
+            for s in self._systems
+        }
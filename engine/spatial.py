@@ -0,0 +1,85 @@
+import math
+from typing import Dict, List, Set, Tuple
+
+from game.deebee import TILESIZE
+
+
+class SpatialHash:
+    """
+    Uniform grid of buckets for radius queries over entities.
+    Coordinates are in tiles (entity pos_x / TILESIZE).
+
+    Works as a TrackedGroup listener (on_add/on_remove). Entities that move
+    must be re-bucketed with move(); it is a no-op unless the cell changed.
+    """
+    def __init__(self, cell_tiles: int = 8):
+        self.cell_px = cell_tiles * TILESIZE
+        self.cell_tiles = cell_tiles
+        self._cells: Dict[Tuple[int, int], Set] = {}
+        self._where: Dict[object, Tuple[int, int]] = {}
+
+    def _key(self, entity):
+        return (int(entity.pos_x) // self.cell_px, int(entity.pos_y) // self.cell_px)
+
+    def on_add(self, entity):
+        key = self._key(entity)
+        self._where[entity] = key
+        self._cells.setdefault(key, set()).add(entity)
+
+    def on_remove(self, entity):
+        key = self._where.pop(entity, None)
+        if key is None:
+            return
+        bucket = self._cells.get(key)
+        if bucket is not None:
+            bucket.discard(entity)
+            if not bucket:
+                del self._cells[key]
+
+    def move(self, entity):
+        old = self._where.get(entity)
+        if old is None:
+            return
+        key = self._key(entity)
+        if key == old:
+            return
+        bucket = self._cells[old]
+        bucket.discard(entity)
+        if not bucket:
+            del self._cells[old]
+        self._where[entity] = key
+        self._cells.setdefault(key, set()).add(entity)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List:
+        """Entities within 'radius' tiles of tile point (x, y)."""
+        ct = self.cell_tiles
+        x0, x1 = int(math.floor((x - radius) / ct)), int(math.floor((x + radius) / ct))
+        y0, y1 = int(math.floor((y - radius) / ct)), int(math.floor((y + radius) / ct))
+        r2 = radius * radius
+        found = []
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    dx = entity.pos_x / TILESIZE - x
+                    dy = entity.pos_y / TILESIZE - y
+                    if dx * dx + dy * dy <= r2:
+                        found.append(entity)
+        return found
+
+    def in_cells(self, cx0: int, cy0: int, cx1: int, cy1: int) -> List:
+        """Every entity bucketed in the cell range [cx0..cx1] x [cy0..cy1] (no distance test)."""
+        found = []
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def __len__(self):
+        return len(self._where)
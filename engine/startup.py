@@ -0,0 +1,108 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+    """
+    Wall time of every startup phase, measured from 'origin' (normally the
+    top of main.py, so imports count), plus time-to-first-frame.
+    """
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases = [] # (name, start_ms, end_ms, thread)
+        self.first_frame_ms: Optional[float] = None
+        self._lock = threading.Lock() # Phases finish on worker threads too
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def record(self, name: str, start_ms: float, end_ms: float):
+        with self._lock:
+            self.phases.append((name, start_ms, end_ms, threading.current_thread().name))
+
+    def phase(self, name: str, fn: Callable, *args):
+        """Runs fn(*args) and records it as a phase. Returns its result."""
+        start = self.now_ms()
+        try:
+            return fn(*args)
+        finally:
+            self.record(name, start, self.now_ms())
+
+    def first_frame(self):
+        """Called once the first frame is on screen."""
+        if self.first_frame_ms is None:
+            self.first_frame_ms = self.now_ms()
+            logger.info(f"Time to first frame: {self.first_frame_ms:.1f} ms\n{self.report()}")
+
+    def report(self) -> str:
+        lines = ["Startup timeline (ms since process start):"]
+        for name, start, end, thread in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"  {name:<12} {start:8.1f} -> {end:8.1f}  {end - start:8.1f}  [{thread}]")
+        if self.first_frame_ms is not None:
+            lines.append(f"  {'first frame':<12} {self.first_frame_ms:8.1f}")
+        return "\n".join(lines)
+
+
+class StartupGraph:
+    """
+    Startup as a dependency graph: each task runs once everything in its
+    'after' list is done. Tasks run on a small thread pool unless marked
+    main_thread (window/display work must stay on the main thread); the
+    main thread runs its own tasks while the workers get on with theirs.
+
+    Results are handed to dependents by name: run() returns {name: result}.
+    An exception in any task is re-raised from run().
+    """
+    def __init__(self, timeline: StartupTimeline, workers: int = 4):
+        self.timeline = timeline
+        self.workers = workers
+        self._tasks: Dict[str, tuple] = {} # name -> (fn, after, main_thread)
+
+    def add(self, name: str, fn: Callable[[], object], after: Iterable[str] = (), main_thread=False):
+        self._tasks[name] = (fn, tuple(after), main_thread)
+
+    def run(self) -> Dict[str, object]:
+        for name, (_, after, _) in self._tasks.items():
+            for dep in after:
+                if dep not in self._tasks:
+                    raise ValueError(f"Startup task '{name}' waits on unknown task '{dep}'")
+
+        results: Dict[str, object] = {}
+        pending = dict(self._tasks)
+        running = {} # future -> name
+
+        def ready(main_thread):
+            return [name for name, (_, after, on_main) in pending.items()
+                    if on_main == main_thread and all(dep in results for dep in after)]
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="startup") as pool:
+            while pending or running:
+                for future in [f for f in running if f.done()]:
+                    results[running.pop(future)] = future.result()
+
+                # 1. Hand every task that can run now to the pool
+                for name in ready(False):
+                    fn = pending.pop(name)[0]
+                    running[pool.submit(self.timeline.phase, name, fn)] = name
+
+                # 2. One main-thread task, then look again (it may unblock workers)
+                main = ready(True)
+                if main:
+                    name = main[0]
+                    results[name] = self.timeline.phase(name, pending.pop(name)[0])
+                    continue
+
+                # 3. Nothing to do here; wait for a worker
+                if not running:
+                    if not pending:
+                        break # The last worker finished before the last main-thread task
+                    raise ValueError(f"Startup tasks can never run (dependency cycle): {list(pending)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        return results
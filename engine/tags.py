@@ -0,0 +1,50 @@
+from typing import Dict, Iterable, List, Tuple
+
+# --- TAG INTERNING ---
+# Every tag string gets a bit, the first time it is seen. A set of tags is
+# then one int, and "has tag X" / "has any of these" is a single AND.
+# Python ints are unbounded, so there is no limit on the number of tags.
+
+class TagRegistry:
+    def __init__(self):
+        self.names: List[str] = []    # Bit index -> tag
+        self.bits: Dict[str, int] = {} # Tag -> bit value (1 << index)
+
+    def bit(self, tag: str) -> int:
+        b = self.bits.get(tag)
+        if b is None:
+            b = self.bits[tag] = 1 << len(self.names)
+            self.names.append(tag)
+        return b
+
+    def mask(self, tags: Iterable[str]) -> int:
+        m = 0
+        for tag in tags:
+            m |= self.bit(tag)
+        return m
+
+    def names_of(self, mask: int) -> Tuple[str, ...]:
+        """Back to tag strings (debugging, UI)."""
+        return tuple(name for i, name in enumerate(self.names) if mask >> i & 1)
+
+    def restore(self, names: Iterable[str]) -> bool:
+        """
+        Re-interns a saved list of tags in its original order, so masks
+        stored alongside it (e.g. in the data bundle) keep their meaning.
+        Returns False if a tag already has a different bit.
+        """
+        for i, name in enumerate(names):
+            if i < len(self.names):
+                if self.names[i] != name:
+                    return False
+            elif self.bit(name) != 1 << i:
+                return False # Interned out of order (was already known at a later index)
+        return True
+
+TAGS = TagRegistry()
+
+def tag_bit(tag: str) -> int:
+    return TAGS.bit(tag)
+
+def tag_mask(tags: Iterable[str]) -> int:
+    return TAGS.mask(tags)
@@ -1,9 +1,35 @@
+import threading
+
 import pygame
 from engine import colors as cn
 
 # UI now relies on logical actions, not specific keys
 # We pass the 'input_manager' to the handle_input methods
 
+# --- FONTS ---
+# SysFont looks the font up (and on first use scans the system fonts) every
+# time it is called, so every font is built once and shared from here.
+# preload_fonts runs on a startup worker while the main thread may already
+# ask for fonts, so building one is guarded by a lock.
+_FONTS = {}
+_FONTS_LOCK = threading.Lock()
+
+def get_font(name, size, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = _FONTS.get(key)
+    if font is None:
+        with _FONTS_LOCK:
+            font = _FONTS.get(key) # Another thread may have just built it
+            if font is None:
+                font = _FONTS[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return font
+
+def preload_fonts(specs):
+    """Builds fonts ahead of time: specs are (name, size[, bold[, italic]]) tuples."""
+    for spec in specs:
+        get_font(*spec)
+    return len(_FONTS)
+
 class Widget:
     def __init__(self, x, y, w, h):
         self.rect = pygame.Rect(x, y, w, h)
@@ -144,4 +170,171 @@ class Label(Widget):
         super().__init__(x, y, surf.get_width(), surf.get_height())
         self.text, self.font, self.color = text, font, color
     def draw(self, surface):
-        surface.blit(self.font.render(self.text, True, self.color), self.rect)
\ No newline at end of file
+        surface.blit(self.font.render(self.text, True, self.color), self.rect)
+# --- LIST VIEW ---
+
+class ListModel:
+    """
+    Observable list of rows. Changes go through insert/remove/update/reset,
+    and every listener is told the diff: listener(op, index, row) with op in
+    'insert', 'remove', 'update', or ('reset', -1, None).
+    """
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def _notify(self, op, index, row):
+        for listener in self._listeners:
+            listener(op, index, row)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def insert(self, index, row):
+        self.rows.insert(index, row)
+        self._notify("insert", index, row)
+
+    def append(self, row):
+        self.insert(len(self.rows), row)
+
+    def remove(self, index):
+        row = self.rows.pop(index)
+        self._notify("remove", index, row)
+        return row
+
+    def update(self, index, row=None):
+        """Row 'index' changed (or is replaced by 'row'); views redraw just that row."""
+        if row is not None:
+            self.rows[index] = row
+        self._notify("update", index, self.rows[index])
+
+    def reset(self, rows):
+        self.rows = list(rows)
+        self._notify("reset", -1, None)
+
+class ListView(Widget):
+    """
+    Scrolling list over a ListModel. Only the rows inside the widget's rect
+    are drawn, and each row's surface is rendered once and cached until the
+    model says that row changed, so a long list costs the same per frame as
+    a short one.
+
+    render_row(row) -> Surface draws one row; selectable(row) says whether
+    the cursor may stop on it (e.g. not on section headers).
+    """
+    def __init__(self, x, y, w, h, model, render_row, row_height=25, selectable=None,
+                 highlight=None):
+        super().__init__(x, y, w, h)
+        self.row_height = row_height
+        self.render_row = render_row
+        self.selectable = selectable or (lambda row: True)
+        self.highlight = highlight or cn.get((60, 60, 70))
+        self.selection_index = 0
+        self.top = 0 # First visible row
+        self.set_model(model)
+
+    def set_model(self, model):
+        self.model = model
+        self._cache = [None] * len(model) # Row surfaces, parallel to model.rows
+        model.subscribe(self._on_change)
+        self.selection_index = 0
+        self.top = 0
+        self._settle()
+
+    @property
+    def page_size(self):
+        return max(1, self.rect.height // self.row_height)
+
+    @property
+    def selected_row(self):
+        if 0 <= self.selection_index < len(self.model) and self.selectable(self.model[self.selection_index]):
+            return self.model[self.selection_index]
+        return None
+
+    # --- MODEL DIFFS ---
+
+    def _on_change(self, op, index, row):
+        if op == "insert":
+            self._cache.insert(index, None)
+            if index <= self.selection_index and len(self.model) > 1:
+                self.selection_index += 1
+        elif op == "remove":
+            del self._cache[index]
+            if index < self.selection_index:
+                self.selection_index -= 1
+        elif op == "update":
+            self._cache[index] = None
+        else: # reset
+            self._cache = [None] * len(self.model)
+            self.selection_index = 0
+            self.top = 0
+        self._settle()
+
+    def _settle(self):
+        """Keeps the cursor on a selectable row and inside the visible window."""
+        n = len(self.model)
+        if n == 0:
+            self.selection_index = self.top = 0
+            return
+        self.selection_index = min(max(self.selection_index, 0), n - 1)
+        if not self.selectable(self.model[self.selection_index]):
+            self.move(1) or self.move(-1)
+        self.scroll_to(self.selection_index)
+
+    # --- NAVIGATION ---
+
+    def move(self, delta) -> bool:
+        """Moves the cursor by 'delta' selectable rows (wrapping). Returns False if there is none."""
+        n = len(self.model)
+        if n == 0:
+            return False
+        step = 1 if delta > 0 else -1
+        i = self.selection_index
+        for _ in range(abs(delta)):
+            for _ in range(n):
+                i = (i + step) % n
+                if self.selectable(self.model[i]):
+                    break
+            else:
+                return False
+        self.selection_index = i
+        self.scroll_to(i)
+        return True
+
+    def scroll_to(self, index):
+        page = self.page_size
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + page:
+            self.top = index - page + 1
+        self.top = max(0, min(self.top, max(0, len(self.model) - page)))
+
+    def handle_input(self, input_mgr):
+        if not self.visible: return False
+        if input_mgr.is_just_pressed("DOWN"):
+            return self.move(1)
+        elif input_mgr.is_just_pressed("UP"):
+            return self.move(-1)
+        return False
+
+    # --- RENDERING ---
+
+    def draw(self, surface):
+        if not self.visible: return
+        rows, cache, h = self.model.rows, self._cache, self.row_height
+        end = min(len(rows), self.top + self.page_size)
+        y = self.rect.y
+        for i in range(self.top, end):
+            if i == self.selection_index and self.selectable(rows[i]):
+                pygame.draw.rect(surface, self.highlight, (self.rect.x, y, self.rect.width, h))
+            surf = cache[i]
+            if surf is None:
+                surf = cache[i] = self.render_row(rows[i])
+            surface.blit(surf, (self.rect.x, y))
+            y += h
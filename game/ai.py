@@ -0,0 +1,264 @@
+import math
+import operator
+import logging
+from typing import List, Tuple, Union
+
+from game.components import Component
+
+logger = logging.getLogger(__name__)
+
+# --- BEHAVIOR DEFINITIONS ---
+# A mob's "ai" in mobs.json is either the name of a built-in behavior or an
+# inline definition: a priority list of rules, evaluated top to bottom.
+# The first rule whose conditions all pass picks the action.
+#
+#   "ai": {
+#       "rules": [
+#           {"if": [["target_dist", "<", 4]], "do": "flee"},
+#           {"if": [["target_dist", "<", 9], ["target_visible", "==", 1]], "do": "hold"},
+#           {"do": "chase"}
+#       ]
+#   }
+#
+# Sensors: target_dist, target_visible, home_dist, hp_frac
+# Mobs with a PerceptionComponent only know what they perceived: the target
+# is their last known player position, and only once they are aware.
+# Actions: chase, flee, hold, home, shoot (hold still and fire the held
+# ranged weapon at the target, see game/projectiles.py)
+#
+# This is a behavior tree of depth two (a selector of sequences). It is
+# compiled once at load into flat parallel arrays, so evaluating a decision is a
+# loop over small ints and floats with no dict lookups or string compares.
+
+BUILTIN_BEHAVIORS = {
+    "player_chase": {"rules": [{"do": "chase"}]},
+}
+
+SENSORS = ("target_dist", "target_visible", "home_dist", "hp_frac")
+SENSOR_IDS = {name: i for i, name in enumerate(SENSORS)}
+S_TARGET_DIST, S_TARGET_VISIBLE, S_HOME_DIST, S_HP_FRAC = range(len(SENSORS))
+
+ACTIONS = ("chase", "flee", "hold", "home", "shoot")
+ACTION_IDS = {name: i for i, name in enumerate(ACTIONS)}
+A_CHASE, A_FLEE, A_HOLD, A_HOME, A_SHOOT = range(len(ACTIONS))
+
+OPERATORS = {
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+class BehaviorError(ValueError):
+    pass
+
+
+class CompiledBehavior:
+    """
+    Flat, immutable form of a behavior, shared by every mob of a type.
+    Rule r owns conditions cond_start[r] <= i < cond_end[r].
+    """
+    __slots__ = ("name", "cond_sensor", "cond_op", "cond_value",
+                 "cond_start", "cond_end", "rule_action", "sensor_mask")
+
+    def __init__(self, name: str, rules: List[Tuple[List[Tuple[int, object, float]], int]]):
+        self.name = name
+        sensors, ops, values, starts, ends, actions = [], [], [], [], [], []
+        mask = 0
+        for conds, action in rules:
+            starts.append(len(sensors))
+            for sensor, op, value in conds:
+                sensors.append(sensor)
+                ops.append(op)
+                values.append(value)
+                mask |= 1 << sensor
+            ends.append(len(sensors))
+            actions.append(action)
+        self.cond_sensor = tuple(sensors)
+        self.cond_op = tuple(ops)
+        self.cond_value = tuple(values)
+        self.cond_start = tuple(starts)
+        self.cond_end = tuple(ends)
+        self.rule_action = tuple(actions)
+        self.sensor_mask = mask # Which sensors this behavior ever reads
+
+    def decide(self, read_sensor) -> int:
+        """Returns the action ID of the first rule whose conditions all pass."""
+        sensors, ops, values = self.cond_sensor, self.cond_op, self.cond_value
+        ends = self.cond_end
+        for r, start in enumerate(self.cond_start):
+            for i in range(start, ends[r]):
+                if not ops[i](read_sensor(sensors[i]), values[i]):
+                    break
+            else:
+                return self.rule_action[r]
+        return A_HOLD # No rule matched
+
+
+def compile_behavior(owner_id: str, spec: Union[str, dict, None]) -> CompiledBehavior:
+    """
+    Compiles a behavior spec (built-in name or inline dict) once at load.
+    Raises BehaviorError with the mob ID on unknown sensors/actions/operators.
+    """
+    name = owner_id
+    if spec is None:
+        spec = "player_chase"
+    if isinstance(spec, str):
+        if spec not in BUILTIN_BEHAVIORS:
+            raise BehaviorError(f"'{owner_id}': unknown behavior '{spec}'")
+        name, spec = spec, BUILTIN_BEHAVIORS[spec]
+
+    rules = []
+    for n, rule in enumerate(spec.get("rules", [])):
+        action = ACTION_IDS.get(rule.get("do"))
+        if action is None:
+            raise BehaviorError(f"'{owner_id}' rule {n}: unknown action '{rule.get('do')}'")
+        conds = []
+        for cond in rule.get("if", []):
+            if len(cond) != 3:
+                raise BehaviorError(f"'{owner_id}' rule {n}: condition {cond} must be [sensor, op, value]")
+            sensor, op, value = cond
+            if sensor not in SENSOR_IDS:
+                raise BehaviorError(f"'{owner_id}' rule {n}: unknown sensor '{sensor}'")
+            if op not in OPERATORS:
+                raise BehaviorError(f"'{owner_id}' rule {n}: unknown operator '{op}'")
+            conds.append((SENSOR_IDS[sensor], OPERATORS[op], float(value)))
+        rules.append((conds, action))
+
+    if not rules:
+        raise BehaviorError(f"'{owner_id}': behavior has no rules")
+    return CompiledBehavior(name, rules)
+
+# --- BLACKBOARD ---
+
+class Blackboard:
+    """
+    Shared per-tick facts every mob reads (target position, tick stamp).
+    Refreshed once per tick by the scheduler before entities update.
+    """
+    def __init__(self):
+        self.tick = 0
+        self.target = None
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.map = None
+
+    def refresh(self, game):
+        self.tick += 1
+        self.map = game.map
+        player = game.player
+        if player is not None and getattr(player, 'physics', None):
+            self.target = player
+            self.target_x = player.physics.x
+            self.target_y = player.physics.y
+        else:
+            self.target = None
+
+# --- CONTROLLER ---
+
+class BehaviorControlComponent(Component):
+    """
+    Drives a mob from a CompiledBehavior. Sensor values are computed lazily
+    (only the ones a rule actually reaches) and cached for the current tick.
+    """
+    def __init__(self, behavior: CompiledBehavior):
+        self.behavior = behavior
+        self.home = None # Spawn point, captured on first update
+        self.action = A_HOLD
+        self._cache = [0.0] * len(SENSORS)
+        self._stamp = [-1] * len(SENSORS)
+        self._owner = None
+        self._bb = None
+        self._tx = self._ty = None # Where this mob believes the target is
+
+    def recycle(self, owner):
+        self.home = None
+        self.action = A_HOLD
+        self._stamp = [-1] * len(SENSORS)
+
+    def catch_up(self, owner, game, elapsed):
+        """
+        Woken from the dormant LOD tier: the heading, target belief and
+        sensor cache are from before it fell asleep. Nothing here builds up
+        over time, so deciding again from the current world puts it where
+        a mob that stayed awake would be.
+        """
+        self._stamp = [-1] * len(SENSORS)
+        self.update(owner, game, 0.0)
+
+    def _read(self, sensor):
+        bb = self._bb
+        if self._stamp[sensor] == bb.tick:
+            return self._cache[sensor]
+
+        phys = self._owner.physics
+        if sensor == S_TARGET_DIST:
+            if self._tx is None:
+                value = math.inf
+            else:
+                value = math.hypot(self._tx - phys.x, self._ty - phys.y)
+        elif sensor == S_TARGET_VISIBLE:
+            value = 0.0
+            perception = getattr(self._owner, 'perception', None)
+            if perception is not None:
+                value = 1.0 if perception.can_see else 0.0
+            elif bb.target is not None and bb.map is not None:
+                value = 1.0 if bb.map.line_of_sight(phys.x, phys.y, bb.target_x, bb.target_y) else 0.0
+        elif sensor == S_HOME_DIST:
+            value = math.hypot(self.home[0] - phys.x, self.home[1] - phys.y)
+        else: # S_HP_FRAC
+            stats = self._owner.stats
+            value = stats.hp / stats.max_hp if stats and stats.max_hp else 1.0
+
+        self._cache[sensor] = value
+        self._stamp[sensor] = bb.tick
+        return value
+
+    def update(self, owner, game, dt):
+        phys = owner.physics
+        bb = getattr(game, 'blackboard', None)
+        if phys is None or bb is None:
+            return
+        if self.home is None:
+            self.home = (phys.x, phys.y)
+
+        self._owner, self._bb = owner, bb
+        perception = getattr(owner, 'perception', None)
+        if perception is None:
+            self._tx, self._ty = (bb.target_x, bb.target_y) if bb.target is not None else (None, None)
+        elif perception.aware and perception.last_known is not None:
+            self._tx, self._ty = perception.last_known
+        else:
+            self._tx = self._ty = None
+        self.action = action = self.behavior.decide(self._read)
+
+        # Resolve the action to a heading
+        tx, ty = self._tx, self._ty
+        if action == A_CHASE and tx is not None:
+            dx, dy = tx - phys.x, ty - phys.y
+        elif action == A_FLEE and tx is not None:
+            dx, dy = phys.x - tx, phys.y - ty
+        elif action == A_HOME:
+            dx, dy = self.home[0] - phys.x, self.home[1] - phys.y
+        elif action == A_SHOOT and tx is not None:
+            self._shoot(owner, game, tx, ty) # Stands still while shooting
+            dx = dy = 0.0
+        else:
+            dx = dy = 0.0
+
+        dist = math.hypot(dx, dy)
+        # Stop if close enough (attack range / arrived)
+        if dist > 0.5:
+            speed = getattr(phys, 'speed_mps', 1.0)
+            phys.vx = dx / dist * speed
+            phys.vy = dy / dist * speed
+        else:
+            phys.vx = 0
+            phys.vy = 0
+
+    def _shoot(self, owner, game, tx, ty):
+        body = getattr(owner, 'body', None)
+        weapon = body.active_weapon if body is not None else None
+        ranged = getattr(weapon, 'ranged', None)
+        projectiles = getattr(game, 'projectile_system', None)
+        if ranged is not None and projectiles is not None:
+            projectiles.fire(game, owner, ranged, tx, ty)
@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import pickle
+import hashlib
+import logging
+from types import SimpleNamespace
+
+from engine.tags import TAGS
+from game.deebee import DATA_DIR, BASE_DIR
+from game.loader import (
+    load_items, load_body_plans, load_loadouts, validate_loadouts, load_materials, load_mobs,
+    BODY_PLAN_FILES,
+)
+from game.prototypes import compile_items, compile_mobs
+from game.materials import compile_materials
+
+logger = logging.getLogger(__name__)
+
+# --- PRECOMPILED DATA BUNDLE ---
+# Every definition the game needs, loaded from JSON, validated, flattened
+# and compiled into prototypes/tables, pickled into one file. Startup reads
+# that file when nothing it was built from has changed, and rebuilds it
+# (once) when something has.
+
+BUNDLE_VERSION = 3
+BUNDLE_PATH = os.path.join(DATA_DIR, "cache", "defs.bundle")
+_MAGIC = b"BLAYDDEFS"
+
+# What the bundle is built from: the data files, and the code that turns
+# them into prototypes (a change there changes the pickled objects too)
+BUNDLE_SOURCES = (
+    os.path.join(DATA_DIR, "items.json"),
+    os.path.join(DATA_DIR, "loadouts.json"),
+    os.path.join(DATA_DIR, "materials.json"),
+    os.path.join(DATA_DIR, "mobs.json"),
+    *BODY_PLAN_FILES, # Indexed by offset, so any edit moves the spans
+    os.path.join(BASE_DIR, "game", "loader.py"),
+    os.path.join(BASE_DIR, "game", "prototypes.py"),
+    os.path.join(BASE_DIR, "game", "components.py"),
+    os.path.join(BASE_DIR, "game", "materials.py"),
+    os.path.join(BASE_DIR, "game", "injury.py"),
+    os.path.join(BASE_DIR, "game", "ai.py"),
+    os.path.join(BASE_DIR, "game", "bundle.py"),
+    os.path.join(BASE_DIR, "engine", "tags.py"),
+)
+
+
+def compile_game_data() -> SimpleNamespace:
+    """The slow path: parse every JSON file and compile it."""
+    data = SimpleNamespace()
+    data.item_defs = load_items()
+    data.body_plans = load_body_plans()
+    data.loadout_defs = validate_loadouts(load_loadouts(), data.item_defs)
+    data.material_defs = load_materials()
+    data.mob_defs = load_mobs()
+
+    data.material_table = compile_materials(data.material_defs)
+    data.item_protos = compile_items(data.item_defs, data.material_table)
+    # Lazy: species are parsed and compiled the first time they spawn
+    data.body_templates = data.body_plans.templates
+    data.part_tables = data.body_plans.part_tables
+    data.mob_protos = compile_mobs(data.mob_defs, data.body_templates, data.item_protos,
+                                   data.part_tables)
+    # Tag bits are handed out as tags are first seen; the pickled masks only
+    # mean something with the same assignment, so it travels with them
+    data.tag_names = list(TAGS.names)
+    return data
+
+# --- STALENESS ---
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+def _hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def _key(path):
+    return os.path.relpath(path, BASE_DIR)
+
+def _fresh(header, sources):
+    """
+    Returns (fresh, restamp). mtime/size are checked first (no reading);
+    a source whose stamp moved but whose content hash didn't (touched,
+    checked out again) still counts as fresh, and the bundle should be
+    restamped so the next start doesn't hash it again.
+    """
+    if header.get("version") != BUNDLE_VERSION or header.get("python") != sys.version_info[:2]:
+        return False, False
+    stamps, hashes = header.get("stamps", {}), header.get("hashes", {})
+    if set(stamps) != {_key(p) for p in sources}:
+        return False, False
+    restamp = False
+    for path in sources:
+        key = _key(path)
+        if stamps[key] != _stat(path):
+            if hashes.get(key) != _hash(path):
+                return False, False
+            restamp = True
+    return True, restamp
+
+# --- READ / WRITE ---
+
+def _read_header(f):
+    if f.read(len(_MAGIC)) != _MAGIC:
+        return None
+    return pickle.load(f)
+
+def write_bundle(data, path=BUNDLE_PATH, sources=BUNDLE_SOURCES):
+    header = {
+        "version": BUNDLE_VERSION,
+        "python": sys.version_info[:2],
+        "stamps": {_key(p): _stat(p) for p in sources},
+        "hashes": {_key(p): _hash(p) for p in sources},
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(_MAGIC)
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(vars(data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path) # Never leave a half-written bundle behind
+
+def read_bundle(path=BUNDLE_PATH, sources=BUNDLE_SOURCES):
+    """The bundled data, or None if missing, unreadable or stale."""
+    try:
+        with open(path, 'rb') as f:
+            header = _read_header(f)
+            fresh, restamp = _fresh(header, sources) if header is not None else (False, False)
+            if not fresh:
+                return None
+            data = SimpleNamespace(**pickle.load(f))
+        if not TAGS.restore(data.tag_names):
+            logger.warning("Data bundle tag bits clash with tags already in use. Rebuilding.")
+            return None
+        if restamp:
+            write_bundle(data, path, sources)
+        return data
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Data bundle unreadable ({e}). Rebuilding.")
+        return None
+
+def load_game_data(path=BUNDLE_PATH, use_bundle=True) -> SimpleNamespace:
+    """
+    All game definitions: from the bundle if it is up to date, otherwise
+    compiled from JSON and written back as the new bundle.
+    """
+    start = time.perf_counter()
+    data = read_bundle(path) if use_bundle else None
+    if data is not None:
+        logger.info(f"Data loaded from bundle in {(time.perf_counter() - start) * 1000:.1f} ms.")
+        return data
+
+    data = compile_game_data()
+    elapsed = (time.perf_counter() - start) * 1000
+    if use_bundle:
+        try:
+            write_bundle(data, path)
+        except Exception as e:
+            logger.warning(f"Could not write data bundle: {e}")
+    logger.info(f"Data compiled from JSON in {elapsed:.1f} ms.")
+    return data
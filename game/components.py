@@ -1,5 +1,14 @@
+import math
 import pygame
+from typing import Dict, List, Tuple
 from game import deebee as db
+from engine.tags import tag_bit, tag_mask
+
+# Tags checked on hot paths, interned once (see engine/tags.py)
+T_GRASP = tag_bit("grasp")
+T_WEAPON = tag_bit("weapon")
+T_ARMOR = tag_bit("armor")
+T_CONTAINER = tag_bit("container")
 
 # --- CORE COMPONENT ---
 class Component:
@@ -25,6 +34,12 @@ class VisualComponent(Component):
         
         self._draw_internal()
 
+    def set_color(self, color):
+        """Recolors the sprite, redrawing only if the color actually changed."""
+        if color != self.color:
+            self.color = color
+            self._draw_internal()
+
     def _draw_internal(self):
         """Draws the shape onto the local image surface."""
         self.image.fill((0, 0, 0, 0)) # Clear with transparency
@@ -57,6 +72,11 @@ class StatsComponent(Component):
         # Backwards compatibility for the CombatSystem
         self.base_equipment_data = self.equipment 
 
+    def reset(self, hp, max_hp=None):
+        """Restores a pooled entity's stats for a new life."""
+        self.hp = hp
+        self.max_hp = hp if max_hp is None else max_hp
+
 # --- CONTROLLER COMPONENTS ---
 class PlayerControlComponent(Component):
     """
@@ -137,36 +157,100 @@ class ItemComponent(Component):
     Represents an object that can be stored in an inventory.
     Does NOT handle what the item *does* (eat, shoot, wear), only its logistics.
     """
-    def __init__(self, name="Unknown", weight=0.1, volume=0.1, value=0, material=None):
+    def __init__(self, name="Unknown", weight=0.1, volume=0.1, value=0, material=None,
+                 item_id=None, tags=(), ammo_type=None, tag_mask_=None):
+        self.item_id = item_id
         self.name = name
+        self.tags = tags # Shared tuple from the prototype, never mutated
+        self.tag_mask = tag_mask(tags) if tag_mask_ is None else tag_mask_ # Same tags as bits
         self.base_weight = weight
         self.base_volume = volume
         self.value = value
         self.material = material
         self.condition = 100.0 # 0 to 100% durability
         self.is_equipped = False
+        self.ammo_type = ammo_type # This item is ammo for RangedComponents with the same ammo_type
+        self.inside = None  # ContainerComponent holding this item (see ContainerComponent)
+        self.carrier = None # InventoryIndex of whoever has it on them, worn or stored
 
     def update(self, owner, game, dt):
         pass
 
+    def recycle(self, owner):
+        if self.inside is not None:
+            self.inside.remove_item(owner) # Keep the bag's totals right
+        elif self.carrier is not None:
+            self.carrier.remove_tree(owner)
+        self.condition = 100.0
+        self.is_equipped = False
+
 class StackableComponent(Component):
     """
     For Gold, Bullets, Seeds, Nails.
     Allows merging multiple entities into one logic object.
+    Stacks of the same item merge when they go into a container
+    (ContainerComponent.add_item); see game/systems.py for split/transfer.
     """
     def __init__(self, count=1, max_stack=999):
         self.count = count
         self.max_stack = max_stack
 
+    @property
+    def room(self):
+        return self.max_stack - self.count
+
+    def recycle(self, owner):
+        self.count = 1
+
+def set_stack_count(entity, count):
+    """Changes a stack's size, keeping the totals of the bags it is in right."""
+    container = entity.item.inside
+    if container is None:
+        entity.stack.count = count
+        return
+    old_w, old_v = item_weight(entity), item_volume(entity)
+    entity.stack.count = count
+    container.contents_volume += item_volume(entity) - old_v
+    container._propagate(item_weight(entity) - old_w)
+
+def item_weight(entity) -> float:
+    """Weight of an item entity: itself (times its stack) plus whatever it holds."""
+    item = entity.item
+    w = item.base_weight
+    stack = getattr(entity, 'stack', None)
+    if stack is not None:
+        w *= stack.count
+    container = getattr(entity, 'container', None)
+    if container is not None:
+        w += container.contents_weight
+    return w
+
+def item_volume(entity) -> float:
+    """Room an item takes in a container (bags don't swell with their contents)."""
+    item = entity.item
+    stack = getattr(entity, 'stack', None)
+    return item.base_volume * (stack.count if stack is not None else 1)
+
+
 class ContainerComponent(Component):
     """
     Allows an entity to hold other entities.
     Used for: Backpacks, Chests, Safes, Cars (trunk), Dressers.
+
+    Totals are cached: contents_weight is everything inside, nested bags
+    included; contents_volume is the room used by the direct contents.
+    Each stored item points back at its container (item.inside), so a change
+    walks up the chain of bags (O(depth)) instead of every reader walking
+    down the whole tree.
     """
-    def __init__(self, capacity_vol=10, capacity_weight=50, is_locked=False, key_id=None):
+    def __init__(self, capacity_vol=10, capacity_weight=50, is_locked=False, key_id=None, owner=None):
         self.capacity_vol = capacity_vol
         self.capacity_weight = capacity_weight
+        self.owner = owner # The entity this component belongs to (set by the prototype)
         self.content = [] # List of Entity objects
+        self._stacks = {} # item_id -> stack entities in 'content' (merge candidates)
+        self.contents_weight = 0.0
+        self.contents_volume = 0.0
         
         # Locking Mechanics
         self.is_locked = is_locked
@@ -175,27 +259,126 @@ class ContainerComponent(Component):
 
     @property
     def total_weight(self):
-        # Recursive weight: The container weighs its contents
-        w = 0
-        for entity in self.content:
-            if hasattr(entity, 'item'):
-                w += entity.item.base_weight
-                # If the item inside is ALSO a container (nested), add its contents
-                if hasattr(entity, 'container'):
-                    w += entity.container.total_weight
-            
-            # Handle Stacks (Gold coins weight)
-            if hasattr(entity, 'stack'):
-                 w += (entity.item.base_weight * (entity.stack.count - 1))
-        return w
+        # The container weighs its contents (cached, see _propagate)
+        return self.contents_weight
 
-    def add_item(self, item_entity):
+    @property
+    def free_volume(self):
+        return self.capacity_vol - self.contents_volume
+
+    def can_hold(self, item_entity):
+        """
+        Capacity check only (O(depth) thanks to the cached totals). Returns (ok, reason).
+        The weight lands on every bag up the chain, so each of them must take it too.
+        """
         if self.is_locked:
             return False, "Locked"
-        # Volume/Weight checks would go here
+        if item_volume(item_entity) > self.free_volume:
+            return False, "Not enough room"
+        weight = item_weight(item_entity)
+        c = self
+        while c is not None:
+            if c.contents_weight + weight > c.capacity_weight:
+                return False, "Too heavy" if c is self else f"Too heavy for the {c.owner.item.name}"
+            c = c.parent
+        return True, "Fits"
+
+    def add_item(self, item_entity):
+        ok, msg = self.can_hold(item_entity)
+        if not ok:
+            return False, msg
+        if item_entity.item.inside is not None:
+            return False, "Already stored"
+        # A bag can't go inside itself, or inside anything it holds
+        if getattr(item_entity, 'container', None) is not None:
+            c = self
+            while c is not None:
+                if c is item_entity.container:
+                    return False, "Can't put a container inside itself"
+                c = c.parent
+        stack = getattr(item_entity, 'stack', None)
+        if stack is not None:
+            # Top up the stacks already here; whatever is left goes in as its own stack
+            for other in self._stacks.get(item_entity.item.item_id, ()):
+                n = min(other.stack.room, stack.count)
+                if n > 0:
+                    set_stack_count(other, other.stack.count + n)
+                    stack.count -= n
+                if stack.count == 0:
+                    item_entity.despawn() # Fully absorbed
+                    return True, "Merged"
+            self._stacks.setdefault(item_entity.item.item_id, []).append(item_entity)
+
         self.content.append(item_entity)
+        item_entity.item.inside = self
+        self.contents_volume += item_volume(item_entity)
+        self._propagate(item_weight(item_entity))
+        carrier = self.carrier
+        if carrier is not None:
+            carrier.add_tree(item_entity)
         return True, "Added"
 
+    def remove_item(self, item_entity) -> bool:
+        if item_entity.item.inside is not self:
+            return False
+        self.content.remove(item_entity)
+        if getattr(item_entity, 'stack', None) is not None:
+            self._stacks[item_entity.item.item_id].remove(item_entity)
+        item_entity.item.inside = None
+        self.contents_volume -= item_volume(item_entity)
+        self._propagate(-item_weight(item_entity))
+        if item_entity.item.carrier is not None:
+            item_entity.item.carrier.remove_tree(item_entity)
+        return True
+
+    def restore(self, item_entity, index=None):
+        """
+        Puts an item back exactly as it was stored (loading a save, undoing
+        a failed move): no capacity/lock checks and no stack merging, totals
+        kept right. 'index' is its place in 'content' (default: the end).
+        """
+        if getattr(item_entity, 'stack', None) is not None:
+            self._stacks.setdefault(item_entity.item.item_id, []).append(item_entity)
+        if index is None:
+            self.content.append(item_entity)
+        else:
+            self.content.insert(index, item_entity)
+        item_entity.item.inside = self
+        self.contents_volume += item_volume(item_entity)
+        self._propagate(item_weight(item_entity))
+        carrier = self.carrier
+        if carrier is not None:
+            carrier.add_tree(item_entity)
+
+    @property
+    def parent(self):
+        """The container this one is stored in, if any."""
+        item = self.owner.item if self.owner is not None else None
+        return item.inside if item is not None else None
+
+    @property
+    def carrier(self):
+        """InventoryIndex of whoever carries this container (None on the ground)."""
+        item = self.owner.item if self.owner is not None else None
+        return item.carrier if item is not None else None
+
+    def _propagate(self, dw):
+        """Applies a weight change here and in every bag up the chain."""
+        c = self
+        while c is not None:
+            c.contents_weight += dw
+            c = c.parent
+
+    def recycle(self, owner):
+        # Contents die with the container
+        for entity in self.content:
+            entity.item.inside = None
+            entity.despawn()
+        self.content = []
+        self._stacks = {}
+        self.contents_weight = 0.0
+        self.contents_volume = 0.0
+
 # --- FUNCTIONAL COMPONENTS (What items DO) ---
 
 class EdibleComponent(Component):
@@ -210,18 +393,104 @@ class EdibleComponent(Component):
 
 # components.py
 
+class _MaterialState:
+    """
+    Attribute of MaterialComponent stored in the MaterialSystem's arrays while
+    the entity is in the world, and on the component itself otherwise
+    (brought up to date lazily on access, see MaterialComponent.settle).
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, comp, objtype=None):
+        if comp is None:
+            return self
+        if comp.store is not None:
+            return float(getattr(comp.store, self.name)[comp.slot])
+        comp.settle()
+        return getattr(comp, self.local)
+
+    def __set__(self, comp, value):
+        if comp.store is not None:
+            getattr(comp.store, self.name)[comp.slot] = value
+        else:
+            comp.settle()
+            setattr(comp, self.local, value)
+
 class MaterialComponent(Component):
-    def __init__(self, material_id: str, mass_kg: float):
+    """
+    What an item is made of, and its physical state.
+
+    In the world, the MaterialSystem steps the state every tick (rain, sun).
+    Anywhere else (in a pack, in a chest, worn) conditions are sheltered and
+    constant, so the state is kept as a snapshot plus the time it was taken
+    and advanced in closed form only when someone reads it. A thousand items
+    in storage cost nothing per tick.
+    """
+    STATE = ("temperature", "wetness", "corrosion", "integrity")
+
+    # Current Physical State (see _MaterialState)
+    temperature = _MaterialState()  # Celsius
+    wetness = _MaterialState()      # 0.0 to 1.0
+    corrosion = _MaterialState()    # 0.0 to 1.0 (Rust/Rot)
+    integrity = _MaterialState()    # 1.0 = Perfect, 0.0 = Destroyed
+
+    def __init__(self, material_id: str, mass_kg: float, decay: int = 0, clock=None):
         self.material_id = material_id # "oak", "steel", "flesh", "glass"
         self.mass = mass_kg
+        self.decay = decay  # Index into db.MATERIAL_DECAY_TYPES
+        self.clock = clock  # Anything with a sim 'time' (the SystemScheduler)
+        self.store = None   # MaterialSystem holding the state, set while in the world
+        self.slot = -1
+        self.recycle(None)
         
-        # Current Physical State
-        self.temperature = 20.0  # Celsius
-        self.wetness = 0.0       # 0.0 to 1.0
-        self.corrosion = 0.0     # 0.0 to 1.0 (Rust/Rot)
-        self.integrity = 1.0     # 1.0 = Perfect, 0.0 = Destroyed
+    def recycle(self, owner):
+        self._temperature = 20.0
+        self._wetness = 0.0
+        self._corrosion = 0.0
+        self._integrity = 1.0
         self.is_burning = False
-        
+        self.stamp(db.MATERIAL_AMBIENT_C)
+
+    def stamp(self, air):
+        """Snapshot taken now, settling toward 'air' degrees from here on."""
+        self._air = air
+        self._since = self.clock.time if self.clock is not None else None
+
+    def settle(self):
+        """
+        Advances the snapshot to the current time: the sheltered case of the
+        MaterialSystem's rules, integrated exactly. Drying is linear, so the
+        time spent soaked (when rust runs and rot doubles) is known up front.
+        """
+        if self.clock is None or self._since is None:
+            return
+        now = self.clock.time
+        dt = now - self._since
+        if dt <= 0:
+            return
+        self._since = now
+
+        wet = self._wetness
+        soaked = min(max((wet - db.MATERIAL_SOAKED) / db.MATERIAL_DRY_RATE, 0.0), dt)
+        self._wetness = max(0.0, wet - db.MATERIAL_DRY_RATE * dt)
+
+        kind = db.MATERIAL_DECAY_TYPES[self.decay]
+        if kind == "rust":
+            loss = db.MATERIAL_RUST_RATE * soaked
+        elif kind in ("rot", "decompose"):
+            rate = db.MATERIAL_ROT_RATE * (2.0 if self._air > db.MATERIAL_HOT_C else 1.0)
+            loss = rate * (dt + soaked)
+        else:
+            loss = 0.0
+        if loss:
+            self._integrity = max(0.0, self._integrity - loss)
+            self._corrosion = min(1.0, self._corrosion + loss)
+
+        air = self._air
+        self._temperature = air + (self._temperature - air) * math.exp(-db.MATERIAL_HEAT_RATE * dt)
+
     def get_density(self):
         # Look up generic properties from the Material Database (see below)
         return self.weight / self.volume
@@ -243,7 +512,10 @@ class MeleeComponent(Component):
         self.parry_window = 0.2       # Time window to block
 
 class RangedComponent(Component):
-    def __init__(self, damage=20, range_m=50, ammo_type="9mm", clip_size=12, noise_radius=20):
+    def __init__(self, damage=20, range_m=50, ammo_type="9mm", clip_size=12, noise_radius=20,
+                 speed_mps=300, cycle_s=0.5, reload_s=2.0,
+                 projectile_mass=0.008, projectile_area=0.000064, drag_coefficient=0.3,
+                 incendiary=False):
         self.damage = damage          # Base damage (bullet might override this)
         self.range = range_m
         self.ammo_type = ammo_type    # Tag to match with StackableComponent names
@@ -253,14 +525,29 @@ class RangedComponent(Component):
         self.fire_mode = "semi"       # auto, semi, bolt
         self.recoil = 2.0
 
+        # Ballistics (see game/projectiles.py)
+        self.speed_mps = speed_mps    # Muzzle velocity
+        self.cycle_s = cycle_s        # Between shots
+        self.reload_s = reload_s      # When the clip runs dry
+        # Quadratic drag constant, 0.5 * rho * Cd * A / m, per meter
+        self.drag = 0.5 * db.AIR_ro * drag_coefficient * projectile_area / projectile_mass
+        self.next_shot = 0.0          # Sim time the weapon is ready again
+        self.incendiary = incendiary  # Sets whatever it hits alight (see game/fire.py)
+
+    def recycle(self, owner):
+        self.current_ammo = self.clip_size
+        self.next_shot = 0.0
+
 class WearableComponent(Component):
     """
     For Clothing, Armor, Accessories.
     Replaces/Augments the 'equip_tags' logic.
     """
-    def __init__(self, layer: int, slots: list, warmth=0, stealth_penalty=0):
+    def __init__(self, layer: int, slots: list, warmth=0, stealth_penalty=0, slot_bits=None):
         self.layer = layer         # UNDERWEAR, OUTER, an int
         self.slots = slots         # ["head"], ["torso", "arms"], ["feet"]
+        # One tag bit per required slot (shared tuple from the prototype)
+        self.slot_bits = tuple(tag_bit(t) for t in slots) if slot_bits is None else slot_bits
         self.warmth = warmth       # For winter seasons
         self.stealth_penalty = stealth_penalty
 
@@ -294,17 +581,27 @@ class PhysicsComponent(Component):
     """
     Updated to handle layer collision (flying, swimming, ground).
     """
-    def __init__(self, x, y, is_static=False):
+    def __init__(self, x, y, is_static=False, speed_mps=1.0):
         self.x = x
         self.y = y
         self.vx = 0
         self.vy = 0
         self.is_static = is_static # Furniture/Walls don't move
+        self.speed_mps = speed_mps # Read by the control components
         
         # Movement Capabilities
         self.can_swim = False
         self.can_fly = False
 
+    def reset(self, x, y, speed_mps=None):
+        """Re-places a pooled entity and zeroes its momentum."""
+        self.x = x
+        self.y = y
+        self.vx = 0
+        self.vy = 0
+        if speed_mps is not None:
+            self.speed_mps = speed_mps
+
     def update(self, owner, game, dt):
         if self.is_static: return
         
@@ -314,21 +611,189 @@ class PhysicsComponent(Component):
         # if tile_type == "water" and not self.can_swim:
         #     self.sink_or_drown()
 
+# --- INVENTORY INDEX ---
+
+class InventoryIndex:
+    """
+    Everything one creature carries (worn, held, or in any bag on them),
+    keyed by item tag, component type and ammo type, so 'any food' or
+    'all 9mm' is a dict lookup however deep the bags go.
+
+    Kept up to date by BodyComponent (equip/hold/unequip) and
+    ContainerComponent (add_item/remove_item); each item points back at
+    the index it is in (item.carrier).
+    """
+    COMPONENTS = ("edible", "tool", "melee", "ranged", "container", "wearable", "stack")
+
+    def __init__(self):
+        self._by = {} # Key -> {item entity: None} (an ordered set)
+
+    def _keys(self, item_entity):
+        item = item_entity.item
+        keys = [("tag", t) for t in item.tags]
+        keys.extend(("component", c) for c in self.COMPONENTS if getattr(item_entity, c, None) is not None)
+        if item.ammo_type is not None:
+            keys.append(("ammo", item.ammo_type))
+        return keys
+
+    def add_tree(self, item_entity):
+        """Indexes an item and, if it is a bag, everything inside it."""
+        item_entity.item.carrier = self
+        for key in self._keys(item_entity):
+            self._by.setdefault(key, {})[item_entity] = None
+        container = getattr(item_entity, 'container', None)
+        if container is not None:
+            for inner in container.content:
+                self.add_tree(inner)
+
+    def remove_tree(self, item_entity):
+        item_entity.item.carrier = None
+        for key in self._keys(item_entity):
+            bucket = self._by.get(key)
+            if bucket is not None:
+                bucket.pop(item_entity, None)
+                if not bucket:
+                    del self._by[key]
+        container = getattr(item_entity, 'container', None)
+        if container is not None:
+            for inner in container.content:
+                self.remove_tree(inner)
+
+    # --- LOOKUPS ---
+
+    def tagged(self, tag):
+        return list(self._by.get(("tag", tag), ()))
+
+    def with_component(self, name):
+        return list(self._by.get(("component", name), ()))
+
+    def ammo(self, ammo_type):
+        return list(self._by.get(("ammo", ammo_type), ()))
+
+    def first(self, kind, value):
+        """First match for ('tag'|'component'|'ammo', value), or None. O(1)."""
+        bucket = self._by.get((kind, value))
+        return next(iter(bucket)) if bucket else None
+
+    def clear(self):
+        self._by = {}
+
 # --- BODY (Updated Equipping Logic) ---
 
+class BodyTemplate:
+    """
+    Read-only slot layout for one body plan, shared by every creature using it.
+    BodyComponent only copies it when a creature's anatomy actually changes.
+    """
+    __slots__ = ("key", "slot_order", "slot_tags", "slot_masks")
+
+    def __init__(self, key: str, flat_plan: List[dict]):
+        self.key = key
+        order = []
+        tags = {}
+        for part in flat_plan:
+            name = part.get("name", "unknown")
+            if name not in tags:
+                order.append(name)
+            tags[name] = tuple(part.get("tags", []))
+        self.slot_order: Tuple[str, ...] = tuple(order)
+        self.slot_tags: Dict[str, Tuple[str, ...]] = tags
+        self.slot_masks: Dict[str, int] = {name: tag_mask(t) for name, t in tags.items()}
+
 class BodyComponent(Component):
     def __init__(self, body_plan_data):
-        self.slots = {}     
-        self.slot_tags = {} 
-        self.slot_order = []
-        
-        # Initialize slots (same as before)
-        for part in body_plan_data:
-            name = part.get("name", "unknown")
-            tags = part.get("tags", [])
-            self.slots[name] = None
-            self.slot_tags[name] = tags
-            self.slot_order.append(name)
+        # Accept a shared BodyTemplate or a raw flattened plan (list of parts)
+        if not isinstance(body_plan_data, BodyTemplate):
+            body_plan_data = BodyTemplate(None, body_plan_data)
+        self._template = body_plan_data
+        self._owns_layout = False
+
+        # Shared with every other body using the same template (copy-on-write)
+        self.slot_tags = body_plan_data.slot_tags
+        self.slot_masks = body_plan_data.slot_masks # Same tags as bits; what the hot paths read
+        self.slot_order = body_plan_data.slot_order
+
+        # Per-creature state
+        self.slots = dict.fromkeys(self.slot_order)
+        self.inventory = InventoryIndex() # Everything on this body, bags included
+        self.stock = () # Gear it was spawned with (see create_mob), kept on through pooling
+        self._reset_index()
+
+    # --- CAPABILITIES INDEX ---
+    # Derived from 'slots' and kept in sync by equip/hold/unequip, so combat,
+    # the HUD and perception read these directly instead of walking the body.
+
+    def _reset_index(self):
+        self.grasped = []          # Items held in grasping parts, in the order they were taken
+        self.active_weapon = None  # First grasped 'weapon' item, else the first grasped item
+        self.armor = {}            # Part -> armor item covering it
+        self.warmth = 0
+        self.stealth_penalty = 0
+        self._worn = {}            # Item -> tuple of parts it occupies
+
+    def _index_add(self, item_entity, parts):
+        self._worn[item_entity] = parts
+        masks = self.slot_masks
+        if any(masks.get(p, 0) & T_GRASP for p in parts):
+            self.grasped.append(item_entity)
+        if item_entity.item.tag_mask & T_ARMOR:
+            for p in parts:
+                self.armor[p] = item_entity
+        wearable = getattr(item_entity, "wearable", None)
+        if wearable is not None:
+            self.warmth += wearable.warmth
+            self.stealth_penalty += wearable.stealth_penalty
+        self._pick_weapon()
+
+    def _index_remove(self, item_entity, parts):
+        if item_entity in self.grasped:
+            self.grasped.remove(item_entity)
+        for p in parts:
+            if self.armor.get(p) is item_entity:
+                del self.armor[p]
+        wearable = getattr(item_entity, "wearable", None)
+        if wearable is not None:
+            self.warmth -= wearable.warmth
+            self.stealth_penalty -= wearable.stealth_penalty
+        self._pick_weapon()
+
+    def _pick_weapon(self):
+        self.active_weapon = self.grasped[0] if self.grasped else None
+        for item_entity in self.grasped:
+            if item_entity.item.tag_mask & T_WEAPON:
+                self.active_weapon = item_entity
+                break
+
+    def _reindex(self):
+        """Full rebuild, only needed when the layout itself changes."""
+        worn = self._worn
+        self._reset_index()
+        for item_entity, parts in worn.items():
+            self._index_add(item_entity, parts)
+
+    def set_slot_tags(self, slot, tags):
+        """
+        Changes one part's tags (e.g. a severed hand loses 'grasp').
+        The shared template is copied first so other creatures are unaffected.
+        """
+        if not self._owns_layout:
+            self.slot_tags = dict(self.slot_tags)
+            self.slot_masks = dict(self.slot_masks)
+            self.slot_order = tuple(self.slot_order)
+            self._owns_layout = True
+        if slot not in self.slot_tags:
+            self.slot_order = self.slot_order + (slot,)
+            self.slots[slot] = None
+        self.slot_tags[slot] = tuple(tags)
+        self.slot_masks[slot] = tag_mask(tags)
+        self._reindex()
+
+    def _occupy(self, item_entity, parts):
+        for p in parts:
+            self.slots[p] = item_entity
+        item_entity.item.is_equipped = True
+        self._index_add(item_entity, tuple(parts))
+        self.inventory.add_tree(item_entity)
 
     def equip(self, item_entity):
         """
@@ -339,6 +804,8 @@ class BodyComponent(Component):
              if hasattr(item_entity, "item"):
                  print("Item is not wearable.")
              return False
+        if item_entity in self._worn:
+            return False # Already on
              
         wearable = item_entity.wearable
         
@@ -346,20 +813,97 @@ class BodyComponent(Component):
         # In a real game, you'd check Layer overlap here 
         # (Can't wear Plate Armor over a Parka, etc.)
         
-        for slot_req in wearable.slots:
-            found_slot = False
-            for body_slot, occupied in self.slots.items():
-                if slot_req in self.slot_tags.get(body_slot, []):
-                    if occupied is None:
-                        self.slots[body_slot] = item_entity
-                        found_slot = True
-                        break
-            if not found_slot:
+        # Find a free part for every requirement before touching anything,
+        # so a failed equip leaves the body as it was
+        parts = []
+        masks = self.slot_masks
+        for req_bit in wearable.slot_bits:
+            for body_slot in self.slot_order:
+                if (self.slots[body_slot] is None and body_slot not in parts
+                        and masks.get(body_slot, 0) & req_bit):
+                    parts.append(body_slot)
+                    break
+            else:
                 return False # Couldn't fit all required slots
 
-        item_entity.item.is_equipped = True
+        self._occupy(item_entity, parts)
+        return True
+
+    def hold(self, item_entity):
+        """Puts any item in a free grasping part. Returns False if the hands are full."""
+        if item_entity in self._worn:
+            return False
+        for body_slot in self.slot_order:
+            if self.slots[body_slot] is None and self.slot_masks.get(body_slot, 0) & T_GRASP:
+                self._occupy(item_entity, [body_slot])
+                return True
+        return False
+
+    def unequip(self, item_entity):
+        """Takes the item off every part it occupies. Returns False if it wasn't on."""
+        parts = self._worn.pop(item_entity, None)
+        if parts is None:
+            return False
+        for p in parts:
+            self.slots[p] = None
+        item_entity.item.is_equipped = False
+        self._index_remove(item_entity, parts)
+        self.inventory.remove_tree(item_entity)
+        return True
+
+    def _stock_intact(self, owner):
+        """Going back to the pool still wearing exactly its stock gear, on the template layout?"""
+        if not getattr(owner, 'pooled', False) or not self.stock:
+            return False
+        if self._owns_layout or len(self._worn) != len(self.stock):
+            return False
+        for item_entity in self.stock:
+            if item_entity not in self._worn or getattr(item_entity, 'released', False):
+                return False
+            container = getattr(item_entity, 'container', None)
+            if container is not None and container.content:
+                return False # Picked things up; emptying it would stale the inventory index
+            pool = getattr(item_entity, 'pool', None)
+            if pool is not None and not pool.is_current(item_entity):
+                return False # Its definition was hot-reloaded
         return True
 
+    def recycle(self, owner):
+        # Untouched stock gear stays on, refreshed, so a recycled mob comes
+        # back dressed without equipping anything (the slot search and the
+        # inventory index are most of a warm spawn)
+        if self._stock_intact(owner):
+            for item_entity in self.stock:
+                refresh_item(item_entity)
+            return
+
+        # Otherwise gear goes back to its own pools along with the wearer
+        self.stock = ()
+        for item_entity in self._worn:
+            item_entity.item.carrier = None
+            item_entity.despawn()
+        self.inventory.clear()
+
+        # Back to the pristine shared layout
+        if self._owns_layout:
+            self.slot_tags = self._template.slot_tags
+            self.slot_masks = self._template.slot_masks
+            self.slot_order = self._template.slot_order
+            self._owns_layout = False
+        self.slots = dict.fromkeys(self.slot_order)
+        self._reset_index()
+
+def refresh_item(item_entity):
+    """
+    Resets an item's per-life state in place (condition, ammo, material,
+    contents) without taking it off whoever wears it.
+    """
+    item_entity.item.condition = 100.0
+    for name, comp in list(vars(item_entity).items()):
+        # ItemComponent.recycle would take it out of the wearer's index
+        if name not in ("item", "game", "pool") and hasattr(comp, 'recycle'):
+            comp.recycle(item_entity)
+
 class PickupComponent(Component):
     """
     Attached to an Entity to mark it as an item on the ground.
@@ -2,6 +2,7 @@ import pygame
 
 # --- META SETTINGS ---
 TITLE = "Blayd"
+STARTUP_WORKERS = 4 # Threads for independent startup work (data, fonts, map)
 
 # --- VISUAL SCALE ---
 TILESIZE = 16
@@ -23,10 +24,103 @@ GRAVITY = 9.81 # meters per second squared
 T_stp = 15.0 # degrees Celsius
 P_stp = 101325 # kilopascals, 1 atmosphere
 AIR_ro = 1.225 # kilograms per cubic meter at sea level and 15 degrees Celsius and 101325 kilopascals
+PROJECTILE_CAPACITY = 1024      # In-flight arrows/bullets; shots beyond this are dropped
+PROJECTILE_LAUNCH_HEIGHT = 1.5  # meters above ground
+PROJECTILE_TARGET_HEIGHT = 1.0  # meters; where shooters aim on the target
+PROJECTILE_ENTITY_HEIGHT = 2.0  # meters; anything flying lower can hit a creature
+PROJECTILE_HIT_RADIUS = 0.5     # tiles from a creature's center
+PROJECTILE_SPREAD = 2.0         # degrees, standard deviation of aim error
+PROJECTILE_IMPACT_NOISE = 2     # tiles; thud of a missed shot
+PROJECTILE_MAX_FLIGHT_S = 5.0
+
+# --- SIMULATION: SCHEDULING ---
+SIM_BUDGET_MS = 4.0   # Per-frame simulation budget (design bible, section 11)
+MATERIAL_RATE_HZ = 2  # Decay/wetness changes slowly; no need to run every tick
+
+# --- SIMULATION: LEVEL OF DETAIL ---
+LOD_CHUNK_TILES = 8      # Entities are tiered per chunk of 8x8 tiles
+LOD_FULL_RADIUS = 2      # Chunks around the player updated every tick
+LOD_COARSE_RADIUS = 5    # Chunks updated every LOD_COARSE_INTERVAL ticks; beyond is dormant
+LOD_COARSE_INTERVAL = 4
+
+# --- SIMULATION: PERCEPTION ---
+PERCEPTION_RATE_HZ = 10       # Sight/hearing re-evaluation rate
+PERCEPTION_MAX_SIGHT = 16     # Tiles; no mob sees further than this
+PERCEPTION_LOSE_TRACK_S = 5.0 # Seconds without sight/sound before a mob gives up
+PLAYER_STEP_NOISE = 3         # Tiles; footsteps, plus worn stealth penalties
+
+# --- SIMULATION: WEATHER ---
+WEATHER_RATE_HZ = 1        # Coarse fields change slowly
+WEATHER_CELL_TILES = 8     # Field resolution
+WEATHER_PERIOD_S = 300     # A new sky is rolled every 5 sim minutes
+WEATHER_DAY_S = 1200       # Length of a day/night temperature cycle
+WEATHER_KINDS = {"clear": 0.45, "cloudy": 0.3, "rain": 0.25} # Relative odds per period
+WEATHER_BASE_C = 15.0
+WEATHER_DAY_SWING_C = 8.0
+WEATHER_PERIOD_SWING_C = 5.0
+WEATHER_RAIN_COOLING_C = 4.0
+WEATHER_SHELTER_C = 12.0   # Caves and alcoves sit near this whatever the sky does
+WEATHER_SHELTER_WALLS = 5  # An open tile with this many wall neighbors (of 8) is sheltered
+WEATHER_RELAX_RATE = 0.02  # Per second; field temperature toward the air/shelter target
+WEATHER_DIFFUSION = 0.1    # Per second; exchange between neighboring cells
+WEATHER_RAIN_WET = 0.01    # Ground wetness per second of rain, unsheltered
+WEATHER_EVAPORATION = 0.0005 # Per second, per degree above 0C, times wetness
+
+# --- SIMULATION: FIRE ---
+FIRE_RATE_HZ = 4             # Flames don't need every tick
+FIRE_GROUND_FUEL = 8.0       # Seconds of burning in the brush of an open tile
+FIRE_GROUND_FLAMMABILITY = 0.5
+FIRE_SPREAD_RATE = 0.6       # Per second, times flammability, times dryness (1 - wetness)
+FIRE_ENTITY_BURN = 0.1       # Integrity a burning item loses per second
+FIRE_DAMAGE = 5.0            # HP per second for a creature standing in the flames
+FIRE_RAIN_EXTINGUISH = 0.3   # Per second; odds that rain puts out an unsheltered burning tile
+
+# --- SIMULATION: MATERIALS ---
+MATERIAL_DECAY_TYPES = ("none", "rust", "rot", "decompose") # materials.json 'decay_type'
+MATERIAL_AMBIENT_C = 20.0  # Air temperature when there is no weather
+MATERIAL_WET_RATE = 0.1    # Wetness gained per second in rain
+MATERIAL_DRY_RATE = 0.05   # Wetness lost per second otherwise
+MATERIAL_SOAKED = 0.5      # Wetness above which rust and rot speed up
+MATERIAL_RUST_RATE = 0.001 # Integrity lost per second while soaked
+MATERIAL_ROT_RATE = 0.001  # Integrity lost per second (x2 when hot, x2 when soaked)
+MATERIAL_HOT_C = 30.0
+MATERIAL_HEAT_RATE = 0.01  # Per second; how fast items settle to air temperature
+
+# --- SIMULATION: INJURY ---
+INJURY_RATE_HZ = 10          # Bleeding is slow; no need to run every tick
+INJURY_PART_SIZE = {         # Relative hit area by part tag (the largest tag wins, default 1)
+    "torso": 20, "core": 20, "leg": 8, "hindleg": 8, "foreleg": 8, "limb": 8,
+    "arm": 6, "head": 6, "wing": 6, "fin": 3, "face": 3, "connector": 3, "flesh": 3,
+    "skin": 2, "organ": 2, "joint": 2, "digit": 0.5, "toe": 0.5, "claw": 0.3, "keratin": 0.2,
+}
+INJURY_UNHITTABLE_TAGS = ("cosmetic", "hair") # Never picked as a hit location
+INJURY_INSIDE_EXPOSURE = 0.2 # Hit weight multiplier per level a part sits 'inside' another
+INJURY_HP_PER_SIZE = 2.0     # Part max HP = size * this (at least 1)
+INJURY_BLEED_TAGS = {        # Bleed factor by part tag (the largest tag wins, default 0.3)
+    "circulatory": 3.0, "vital": 1.5, "organ": 1.5, "flesh": 1.0, "limb": 0.8, "skin": 0.5,
+}
+INJURY_NO_BLEED_TAGS = ("keratin", "hair", "cosmetic", "cartilage")
+INJURY_BLEED_PER_DAMAGE = 0.01 # Blood fraction lost per second, per damage point * bleed factor
+INJURY_CLOT_RATE = 0.1         # Per second; open wounds slow down exponentially
+INJURY_BLEED_STOP = 0.0005     # Wounds bleeding less than this are closed
+INJURY_BLOOD_FATAL = 0.4       # Dies below this fraction of blood
+
+# --- SIMULATION: INVENTORY ---
+CONTAINER_MAX_WEIGHT = 50.0 # kg a container takes unless items.json says 'container_weight'
+
+# --- SIMULATION: POOLING ---
+POOL_MAX_RETAINED = 256 # Dead entities kept for reuse, per archetype (e.g. per mob type)
+
+# --- DEBUG ---
+EVENT_TRACE_SIZE = 0 # EventBus ring buffer length; 0 disables tracing
+# Hot-reload of data/*.json is off unless settings.json turns it on (see HOTRELOAD_POLL_S below)
 
 # --- UI SETTINGS ---
 UI_FONT = 'arial'
 UI_FONT_SIZE = 20
+# Built in the background at startup (engine.ui.get_font); (name, size[, bold])
+UI_FONTS = (("arial", 16), ("arial", 18, True), ("arial", 20),
+            ("arial", 24), ("arial", 60, True), ("consolas", 14))
 
 import os
 import json
@@ -81,7 +175,8 @@ def _deep_merge(base: dict, update: dict) -> dict:
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSET_DIR = os.path.join(BASE_DIR, "assets")
 DATA_DIR = os.path.join(BASE_DIR, "data")
-SAVE_FILE = os.path.join(DATA_DIR, "saves", "savegame.json")
+SAVE_FILE = os.path.join(DATA_DIR, "saves", "savegame.sav")
+SAVE_VERSION = 4 # Bump when the binary layout changes (see game/persist.py)
 
 # --- 1. The Hardcoded Defaults (Safety Net) ---
 # Use these if settings.json is missing or broken
@@ -93,50 +188,89 @@ _DEFAULT_SHOW_FPS = False
 _DEFAULT_SHOW_TPS = False
 _DEFAULT_VOLUME = 1.0
 _DEFAULT_THEME = "default"
+_DEFAULT_HOTRELOAD_POLL_S = 0 # Off; dev setups set "debug": {"hotreload_poll_s": 0.5}
 
-# --- 2. Load the User Settings ---
-# Load right here at the module level. 
-# When main.py imports 'constants', this code runs immediately.
-_user_settings = load_settings()
-_window_prefs = _user_settings.get("window", {})
-_perf_prefs = _user_settings.get("performance", {})
-_audio_prefs = _user_settings.get("audio", {})
-_color_prefs = _user_settings.get("colors", {})
-_log_prefs = _user_settings.get("logging", {})
-
-# Window settings
-WIDTH = _window_prefs.get("width", _DEFAULT_WIDTH)
-HEIGHT = _window_prefs.get("height", _DEFAULT_HEIGHT)
-
-# Logging settings
-LOG_CONFIG = {
-    "level": _log_prefs.get("level", "INFO"),
-    "file": os.path.join(DATA_DIR, "logs", _log_prefs.get("filename", "blayd.log")),
-    "format": _log_prefs.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-}
+# --- 2. The User Settings (read on first use) ---
+# Nothing is read at import, so tools and scripts that only want paths or
+# simulation constants never touch settings.json. The constants below are
+# worked out the first time one of them is asked for (module __getattr__),
+# or all at once by configure().
+_user_settings = None
+
+def settings() -> dict:
+    """settings.json, read once on first use."""
+    global _user_settings
+    if _user_settings is None:
+        _user_settings = load_settings()
+    return _user_settings
 
-# Performance settings
-TPS = _perf_prefs.get("tps", _DEFAULT_TPS)
-FPS = _perf_prefs.get("fps", _DEFAULT_FPS)
-SHOW_FPS = _perf_prefs.get("show_fps", _DEFAULT_SHOW_FPS)
-SHOW_TPS = _perf_prefs.get("show_tps", _DEFAULT_SHOW_TPS)
-
-# Audio settings
-MASTER_VOLUME = _audio_prefs.get("master_volume", _DEFAULT_VOLUME)
-MUSIC_VOLUME = _audio_prefs.get("music_volume", _DEFAULT_VOLUME)
-SFX_VOLUME = _audio_prefs.get("sfx_volume", _DEFAULT_VOLUME)
-AMBIENT_VOLUME = _audio_prefs.get("ambient_volume", _DEFAULT_VOLUME)
-VOICE_VOLUME = _audio_prefs.get("voice_volume", _DEFAULT_VOLUME)
-
-# Theme settings
-THEME = _color_prefs.get("theme", _DEFAULT_THEME)
-
-# CALCULATED VALUES
-GRID_WIDTH = WIDTH // TILESIZE
-GRID_HEIGHT = HEIGHT // TILESIZE
-SCREEN_CENTER_X = WIDTH / 2
-SCREEN_CENTER_Y = HEIGHT / 2
-SCREEN_CENTER = (SCREEN_CENTER_X, SCREEN_CENTER_Y)
+def _from_settings(user_settings: dict) -> dict:
+    window_prefs = user_settings.get("window", {})
+    perf_prefs = user_settings.get("performance", {})
+    audio_prefs = user_settings.get("audio", {})
+    color_prefs = user_settings.get("colors", {})
+    log_prefs = user_settings.get("logging", {})
+    debug_prefs = user_settings.get("debug", {})
+    v = {}
+
+    # Window settings
+    v["WIDTH"] = window_prefs.get("width", _DEFAULT_WIDTH)
+    v["HEIGHT"] = window_prefs.get("height", _DEFAULT_HEIGHT)
+
+    # Logging settings
+    v["LOG_CONFIG"] = {
+        "level": log_prefs.get("level", "INFO"),
+        "file": os.path.join(DATA_DIR, "logs", log_prefs.get("filename", "blayd.log")),
+        "format": log_prefs.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    }
+
+    # Performance settings
+    v["TPS"] = perf_prefs.get("tps", _DEFAULT_TPS)
+    v["FPS"] = perf_prefs.get("fps", _DEFAULT_FPS)
+    v["SHOW_FPS"] = perf_prefs.get("show_fps", _DEFAULT_SHOW_FPS)
+    v["SHOW_TPS"] = perf_prefs.get("show_tps", _DEFAULT_SHOW_TPS)
+
+    # Audio settings
+    v["MASTER_VOLUME"] = audio_prefs.get("master_volume", _DEFAULT_VOLUME)
+    v["MUSIC_VOLUME"] = audio_prefs.get("music_volume", _DEFAULT_VOLUME)
+    v["SFX_VOLUME"] = audio_prefs.get("sfx_volume", _DEFAULT_VOLUME)
+    v["AMBIENT_VOLUME"] = audio_prefs.get("ambient_volume", _DEFAULT_VOLUME)
+    v["VOICE_VOLUME"] = audio_prefs.get("voice_volume", _DEFAULT_VOLUME)
+
+    # Theme settings
+    v["THEME"] = color_prefs.get("theme", _DEFAULT_THEME)
+
+    # Debug settings
+    # Seconds between checks of data/*.json for edits; 0 disables hot-reload
+    v["HOTRELOAD_POLL_S"] = debug_prefs.get("hotreload_poll_s", _DEFAULT_HOTRELOAD_POLL_S)
+
+    # CALCULATED VALUES
+    v["GRID_WIDTH"] = v["WIDTH"] // TILESIZE
+    v["GRID_HEIGHT"] = v["HEIGHT"] // TILESIZE
+    v["SCREEN_CENTER_X"] = v["WIDTH"] / 2
+    v["SCREEN_CENTER_Y"] = v["HEIGHT"] / 2
+    v["SCREEN_CENTER"] = (v["SCREEN_CENTER_X"], v["SCREEN_CENTER_Y"])
+    return v
+
+_SETTINGS_NAMES = tuple(_from_settings({}))
+
+def configure(user_settings: dict = None):
+    """
+    Works out every settings-based constant now, from 'user_settings' if
+    given (otherwise settings.json). Call before anything copies them
+    (from game.deebee import WIDTH) if they should come from elsewhere.
+    """
+    global _user_settings
+    if user_settings is not None:
+        _user_settings = user_settings
+    globals().update(_from_settings(settings()))
+
+def __getattr__(name):
+    # Only reached while a settings constant hasn't been worked out yet
+    if name in _SETTINGS_NAMES:
+        configure()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- INPUT BINDINGS ---
 KEY_BINDINGS = {
@@ -185,3 +319,7 @@ KEY_BINDINGS = {
     "QUIT":     [pygame.K_q],
     "DEBUG_CONSOLE": [pygame.K_BACKQUOTE],
 }
+
+# The settings constants are left out on purpose: a star import would ask
+# for them and read settings.json at import. Use db.WIDTH etc. instead.
+__all__ = [name for name in globals() if not name.startswith("_")]
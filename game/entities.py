@@ -6,15 +6,16 @@ from game.components import (
     PlayerControlComponent, 
     StatsComponent, 
     BodyComponent,
-    AIControlComponent,
     PickupComponent
 )
 from game.deebee import *
 from game.loader import create_item
+from game.injury import InjuryComponent
 
 def create_player(game, x=None, y=None, loadout_key="default"):
     """
     Creates the Player Entity.
+    loadout_key=None gives a bare player (e.g. a loaded save brings its own gear).
     """
     # 1. SPAWN LOGIC (Safety First)
     if x is None or y is None:
@@ -32,11 +33,19 @@ def create_player(game, x=None, y=None, loadout_key="default"):
     })
     
     # 3. ANATOMY SETUP
-    humanoid_data = game.body_plans.get("humanoid", [{"name": "chest", "tags": ["torso", "wear"]}])
-    e.body = BodyComponent(humanoid_data)
+    humanoid = game.body_templates.get("humanoid")
+    if humanoid is None:
+        humanoid = [{"name": "chest", "tags": ["torso", "wear"]}]
+    e.body = BodyComponent(humanoid)
+    parts = getattr(game, "part_tables", {}).get("humanoid")
+    if parts is not None:
+        e.injury = InjuryComponent(parts)
     
     # 3. LOADOUT
-    gear_list = game.loadouts.get(loadout_key, [])
+    if loadout_key is None:
+        e.refresh_visuals()
+        return e
+    gear_list = game.loadout_defs.get(loadout_key, [])
     
     if not gear_list:
         print(f"Warning: Loadout '{loadout_key}' is empty or missing.")
@@ -45,7 +54,7 @@ def create_player(game, x=None, y=None, loadout_key="default"):
     
     # A. Instantiate Items
     for item_id in gear_list:
-        item = create_item(game, item_id, game.item_defs)
+        item = create_item(game, item_id, game.item_protos)
         if item:
             created_items.append(item)
         else:
@@ -64,112 +73,114 @@ def create_player(game, x=None, y=None, loadout_key="default"):
 
         for slot_name, equipped_item in e.body.slots.items():
             if equipped_item and hasattr(equipped_item, 'container') and equipped_item.container:
-                if equipped_item.container.capacity > max_capacity:
-                    max_capacity = equipped_item.container.capacity
+                if equipped_item.container.capacity_vol > max_capacity:
+                    max_capacity = equipped_item.container.capacity_vol
                     best_container = equipped_item
 
+        dropped = leftovers
         if best_container:
-            for item in leftovers:
-                best_container.container.items.append(item)
-        else:
-            print(f"Dropped {len(leftovers)} items (No container space)")
+            dropped = [item for item in leftovers if not best_container.container.add_item(item)[0]]
+        if dropped:
+            print(f"Dropped {len(dropped)} items (No container space)")
 
     e.refresh_visuals()
     return e
 
-def create_mob(game, mob_id, x=None, y=None):
+def create_mob(game, mob_id, x=None, y=None, loadout=True):
     """
-    Creates a mob based on a mob_id string found in game.mob_defs.
+    Creates a mob from its compiled prototype in game.mob_protos.
+    loadout=False leaves it bare (e.g. a loaded save brings its own gear).
     """
     # 1. Look up Data
-    if mob_id not in game.mob_defs:
+    proto = game.mob_protos.get(mob_id)
+    if proto is None:
         print(f"Error: Mob ID '{mob_id}' not found.")
         return None
-        
-    data = game.mob_defs[mob_id]
 
     # 2. SPAWN LOGIC
     if x is None or y is None:
         x, y = game.map.find_open_space(radius=1, bias="bottom_right")
-    
-    e = Entity(game, x, y)
-    
-    # 3. VISUALS & PHYSICS (From Data)
-    color = data.get("color", [255, 0, 0])
-    speed = data.get("speed", 1.0)
-    
-    e.visual = VisualComponent(pygame.Color(*color)) 
-    e.physics = PhysicsComponent(x, y, speed_mps=speed)
-    
-    # 4. CONTROLLER (Simple AI toggle)
-    ai_type = data.get("ai", "player_chase")
-    if ai_type == "player_chase":
-        e.control = AIControlComponent(target_name="player")
-    
-    # 5. STATS
-    hp = data.get("hp", 10)
-    e.stats = StatsComponent(hp=hp, max_hp=hp, equipment={
-        "weapon": {"name": "Natural", "atk": 1}, # Fallback
-        "armor": {"name": "Skin", "def": 0}
-    })
 
-    # 6. ANATOMY SETUP
-    bp_key = data.get("body_plan", "humanoid")
-    mob_plan = game.body_plans.get(bp_key, game.body_plans.get("humanoid", []))
-    e.body = BodyComponent(mob_plan)
-    
-    # 7. MOB LOADOUT
-    gear_list = data.get("loadout", [])
-    
-    for item_id in gear_list:
-        item = create_item(game, item_id, game.item_defs)
-        if item:
-            if not e.body.equip(item):
-                print(f"Mob {mob_id} failed to equip {item_id}")
-                item.kill()
+    # Recycled mob? Only per-life state needs resetting; surfaces and
+    # component instances are kept from its previous life.
+    pool = getattr(game, "entity_pool", None)
+    e = pool.acquire(("mob", mob_id)) if pool is not None else None
+    if e is not None:
+        e.place(x, y)
+        e.visual.set_color(proto.color)
+        e.physics.reset(x, y, speed_mps=proto.speed)
+        e.stats.reset(proto.hp)
+        if not loadout:
+            _strip(e) # Came back dressed in its stock gear (see BodyComponent.recycle)
+    else:
+        # 3. COMPONENTS (visuals, physics, AI, stats, anatomy) from the prototype
+        e = proto.instantiate(game, x, y)
+        if pool is not None:
+            pool.register(e, ("mob", mob_id))
+    
+    # 4. MOB LOADOUT (a recycled mob may still wear it)
+    if loadout and not e.body.stock:
+        _equip_mob_loadout(game, e, proto)
 
     e.refresh_visuals()
     return e
 
-def create_world_item(game, item_id, x, y):
+def _equip_mob_loadout(game, e, proto):
+    stock = []
+    for item_proto in proto.loadout:
+        item = create_item(game, item_proto.item_id, game.item_protos)
+        if not e.body.equip(item):
+            print(f"Mob {proto.mob_id} failed to equip {item_proto.item_id}")
+            item.despawn()
+        else:
+            stock.append(item)
+    e.body.stock = tuple(stock)
+
+def _strip(e):
+    body = e.body
+    for item in list(body._worn):
+        body.unequip(item)
+        item.despawn()
+    body.stock = ()
+
+def create_world_item(game, item_id, x, y, count=1):
     """
     Spawns an item on the ground at specific coordinates.
+    The item entity itself goes on the ground (no wrapper), so picking it up
+    and dropping it again moves the same pooled object around.
+    'count' only applies to stackable items (one entity for the whole pile).
     """
-    # 1. Create the Base Entity
-    e = Entity(game, x, y)
-    
-    # 2. Physics (Items are usually static unless you have gravity/throwing)
-    # We set is_static=True so they don't slide around, or False if you want them to be pushed.
-    e.physics = PhysicsComponent(x, y, is_static=True)
+    # 1. The Item Data (The "Soul" of the item)
+    # Pooled: a recycled item keeps its world components from its last drop
+    e = create_item(game, item_id, game.item_protos)
     
-    # 3. The Item Data (The "Soul" of the item)
-    # We use your existing loader to fetch the raw data stats
-    item_component = create_item(game, item_id, game.item_defs)
-    
-    if not item_component:
+    if not e:
         print(f"ERROR: Could not spawn {item_id} - definition not found.")
-        e.kill()
         return None
+    if getattr(e, 'stack', None) is not None:
+        e.stack.count = max(1, min(count, e.stack.max_stack))
+
+    e.place(x, y)
 
-    # Attach the data to this world entity
-    # Note: Depending on your engine, you might attach the components *of* the item 
-    # to this entity, or store the item object inside a wrapper. 
-    # Assuming direct attachment based on your architecture:
-    e.item = item_component.item  # The ItemComponent
-    if hasattr(item_component, 'stack'): e.stack = item_component.stack
-    if hasattr(item_component, 'wearable'): e.wearable = item_component.wearable
-    if hasattr(item_component, 'tool'): e.tool = item_component.tool
-    # ... transfer other components as needed ...
+    # 2. Physics (Items are usually static unless you have gravity/throwing)
+    # We set is_static=True so they don't slide around, or False if you want them to be pushed.
+    if getattr(e, 'physics', None):
+        e.physics.reset(x, y)
+    else:
+        e.physics = PhysicsComponent(x, y, is_static=True)
 
-    # 4. The Pickup Logic
-    e.pickup = PickupComponent()
+    # 3. The Pickup Logic
+    if not hasattr(e, 'pickup'):
+        e.pickup = PickupComponent()
 
-    # 5. Visuals (Placeholder)
+    # 4. Visuals (Placeholder)
     # We use a distinct color (e.g., Gold/Yellow) to differentiate from Mobs (Red)
-    e.visual = VisualComponent(color=pygame.Color("gold"))
+    if getattr(e, 'visual', None) is None:
+        e.visual = VisualComponent(color=pygame.Color("gold"))
     
     # Optional: Scale it down so it looks smaller than a person
     # if hasattr(e.visual, 'rect'):
     #     e.visual.rect.inflate_ip(-10, -10) 
 
-    return e
\ No newline at end of file
+    e.refresh_visuals()
+    return e
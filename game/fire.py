@@ -0,0 +1,175 @@
+import math
+import random
+import logging
+
+import numpy as np
+import pygame
+
+from game.deebee import (
+    TILESIZE,
+    FIRE_GROUND_FUEL,
+    FIRE_GROUND_FLAMMABILITY,
+    FIRE_SPREAD_RATE,
+    FIRE_ENTITY_BURN,
+    FIRE_DAMAGE,
+    FIRE_RAIN_EXTINGUISH,
+)
+
+logger = logging.getLogger(__name__)
+
+NEIGHBORS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class FireSystem:
+    """
+    Fire that only ever looks at what is burning.
+
+    Tiles: open ground carries brush (FIRE_GROUND_FUEL seconds of burning).
+    A burning tile eats its fuel and tries to ignite each neighbor with a
+    probability from the neighbor's flammability and the local ground
+    wetness (weather field). Burnt-out tiles are scorched and never burn
+    again.
+
+    Entities: material entities near a burning tile may catch fire
+    (material flammability, their own wetness). A burning item loses
+    integrity, sets its tile alight, and is gone when nothing is left.
+    Creatures standing in the flames take damage.
+
+    The frontier (burning tiles, burning entities) is the only thing a tick
+    walks, so cost follows the size of the fire, not of the map.
+    """
+    def __init__(self, game_map, spatial, materials, rng=None):
+        grid = np.array(game_map.grid)
+        self.height, self.width = grid.shape
+        self.fuel = np.where(grid == 0, FIRE_GROUND_FUEL, 0.0)
+        self.scorched = np.zeros(grid.shape, dtype=bool)
+        self.spatial = spatial
+        self.materials = materials # MaterialTable, for flammability
+        self.rng = rng or random.Random()
+
+        self.burning = {}              # (x, y) -> None; an ordered set of burning tiles
+        self.burning_entities = set()
+        self._overlay = None           # Scorch marks, drawn as they happen
+        logger.info("FireSystem initialized.")
+
+    # --- IGNITION ---
+
+    def ignite(self, x, y) -> bool:
+        """Sets tile (x, y) alight if it has fuel left."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if (x, y) in self.burning or self.fuel[y, x] <= 0:
+            return False
+        self.burning[(x, y)] = None
+        return True
+
+    def ignite_entity(self, entity) -> bool:
+        material = getattr(entity, 'material', None)
+        if material is None or material.is_burning or self._flammability(material) <= 0:
+            return False
+        material.is_burning = True
+        self.burning_entities.add(entity)
+        return True
+
+    def restore(self, fuel, scorched, burning):
+        """Puts the tile state back from a save: fuel left, scorch marks, burning tiles (in order)."""
+        self.fuel = np.array(fuel, dtype=float)
+        self.scorched = np.zeros(self.fuel.shape, dtype=bool)
+        for y, x in np.argwhere(scorched).tolist():
+            self._scorch(x, y)
+        self.burning = dict.fromkeys(burning)
+
+    def _flammability(self, material):
+        table = self.materials
+        return float(table.flammability[table.lookup(material.material_id)])
+
+    # --- SIMULATION ---
+
+    def update(self, game, dt):
+        if not self.burning and not self.burning_entities:
+            return
+        rng = self.rng
+        weather = getattr(game, 'weather', None)
+        douse = 1.0 - math.exp(-FIRE_RAIN_EXTINGUISH * dt)
+        spread = FIRE_SPREAD_RATE * dt
+        fuel = self.fuel
+        catch = []
+
+        # 1. Burning tiles (local weather looked up for the whole frontier at once)
+        tiles = list(self.burning)
+        if weather is not None:
+            xs = np.fromiter((t[0] for t in tiles), dtype=np.int64, count=len(tiles))
+            ys = np.fromiter((t[1] for t in tiles), dtype=np.int64, count=len(tiles))
+            dryness = (1.0 - weather.wetness_at(xs, ys)).tolist()
+            rained_on = weather.rain_at(xs, ys).tolist()
+        else:
+            dryness, rained_on = [1.0] * len(tiles), [False] * len(tiles)
+
+        for (x, y), dry, rain in zip(tiles, dryness, rained_on):
+            if rain and rng.random() < douse:
+                del self.burning[(x, y)] # Put out; whatever fuel is left can burn later
+                continue
+
+            left = fuel[y, x] - dt
+            fuel[y, x] = max(left, 0.0)
+
+            # Spread to neighboring tiles
+            p = 1.0 - math.exp(-spread * FIRE_GROUND_FLAMMABILITY * dry)
+            for dx, dy in NEIGHBORS:
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < self.width and 0 <= ny < self.height and fuel[ny, nx] > 0
+                        and (nx, ny) not in self.burning and rng.random() < p):
+                    catch.append((nx, ny))
+
+            # Whatever stands in or next to the flames
+            for entity in self.spatial.query_radius(x, y, 1.0):
+                material = getattr(entity, 'material', None)
+                if material is not None:
+                    if not material.is_burning:
+                        p_e = 1.0 - math.exp(-spread * self._flammability(material) * (1.0 - material.wetness))
+                        if rng.random() < p_e:
+                            self.ignite_entity(entity)
+                elif getattr(entity, 'stats', None) is not None and int(entity.pos_x) // TILESIZE == x \
+                        and int(entity.pos_y) // TILESIZE == y:
+                    self._burn_creature(game, entity, dt)
+
+            if left <= 0:
+                del self.burning[(x, y)]
+                self._scorch(x, y)
+
+        # 2. Burning entities
+        for entity in list(self.burning_entities):
+            material = entity.material
+            if not entity.alive() or not material.is_burning:
+                self.burning_entities.discard(entity) # Picked up / doused / recycled
+                continue
+            material.integrity = max(0.0, material.integrity - FIRE_ENTITY_BURN * dt)
+            catch.append((int(entity.pos_x) // TILESIZE, int(entity.pos_y) // TILESIZE))
+            if material.integrity <= 0:
+                self.burning_entities.discard(entity)
+                material.is_burning = False
+                if game.bus:
+                    game.bus.emit("entity_burnt", {"entity": entity})
+                entity.despawn()
+
+        for x, y in catch:
+            self.ignite(x, y)
+
+    def _burn_creature(self, game, entity, dt):
+        entity.stats.hp -= FIRE_DAMAGE * dt
+        if entity.stats.hp <= 0 and entity is not game.player:
+            entity.despawn()
+
+    def _scorch(self, x, y):
+        self.scorched[y, x] = True
+        if self._overlay is None:
+            self._overlay = pygame.Surface((self.width * TILESIZE, self.height * TILESIZE), pygame.SRCALPHA)
+        self._overlay.fill((40, 30, 25, 160), (x * TILESIZE, y * TILESIZE, TILESIZE, TILESIZE))
+
+    # --- RENDERING ---
+
+    def draw(self, surface):
+        if self._overlay is not None:
+            surface.blit(self._overlay, (0, 0))
+        for x, y in self.burning:
+            surface.fill((255, 120, 20), (x * TILESIZE + 2, y * TILESIZE + 2, TILESIZE - 4, TILESIZE - 4))
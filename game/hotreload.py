@@ -0,0 +1,218 @@
+import os
+import json
+import time
+import logging
+
+from game.deebee import DATA_DIR
+from game.loader import (
+    load_items, load_loadouts, validate_loadouts, load_materials, load_mobs,
+    BODY_PLAN_FILES,
+)
+from game.prototypes import ItemPrototype, compile_mobs
+from game.materials import compile_materials
+
+logger = logging.getLogger(__name__)
+
+# --- DATA HOT-RELOAD ---
+# Edit data/*.json while the game runs: the watcher notices (mtime poll),
+# re-reads only that file, works out which definitions actually changed,
+# re-checks only what depends on them, and patches the prototypes in place.
+# Mob loadouts and anything else holding a prototype see the new values
+# without a restart. Creatures and items already in the world keep the
+# values they were built with; new spawns use the new ones.
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+def _diff(old: dict, new: dict) -> set:
+    """Keys added, removed or changed between two definition dicts."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+def _replace(target: dict, source: dict):
+    # In place: the game (and its systems) hold on to these dicts
+    target.clear()
+    target.update(source)
+
+
+class DataWatcher:
+    """
+    Polls the data files every 'interval' seconds (real time) and reloads
+    the ones that changed. Order matters: materials feed items, items feed
+    loadouts and mobs, so files are handled in that order and mobs are
+    recompiled once at the end.
+    """
+    def __init__(self, game, interval):
+        self.game = game
+        self.interval = interval
+        self._next = 0.0
+        self._handlers = {
+            os.path.join(DATA_DIR, "materials.json"): self._reload_materials,
+            os.path.join(DATA_DIR, "items.json"): self._reload_items,
+            os.path.join(DATA_DIR, "loadouts.json"): self._reload_loadouts,
+            **{path: self._reload_body_plans for path in BODY_PLAN_FILES},
+            os.path.join(DATA_DIR, "mobs.json"): self._reload_mobs,
+        }
+        self._stamps = {path: _stamp(path) for path in self._handlers}
+        # game.loadout_defs is already validated (unknown items dropped);
+        # the raw lists are kept so an item coming back restores its entries
+        self._raw_loadouts = load_loadouts()
+        self._dirty_mobs = set()
+        logger.info(f"DataWatcher watching {len(self._handlers)} files.")
+
+    def poll(self, now=None):
+        """Cheap when nothing changed: one stat() per file, at most every 'interval'."""
+        now = time.monotonic() if now is None else now
+        if now < self._next:
+            return None
+        self._next = now + self.interval
+        changed = [path for path in self._handlers if _stamp(path) != self._stamps[path]]
+        return self.reload(changed) if changed else None
+
+    def reload(self, paths):
+        """Reloads 'paths' (in dependency order) and returns what changed."""
+        start = time.perf_counter()
+        report = {"files": [], "materials": set(), "items": set(), "loadouts": set(),
+                  "body_plans": set(), "mobs": set()}
+        for path, handler in self._handlers.items():
+            if path not in paths:
+                continue
+            self._stamps[path] = _stamp(path)
+            name = os.path.basename(path)
+
+            # A half-saved or broken file must not wipe the live definitions
+            # (the loaders return {} on errors)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Hot-reload: {name} is unreadable ({e}). Keeping the current definitions.")
+                continue
+            handler(path, report)
+            report["files"].append(name)
+
+        self._recompile_mobs(report)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        summary = ", ".join(f"{len(v)} {k}" for k, v in report.items() if k != "files" and v)
+        logger.info(f"Hot-reloaded {report['files']} in {elapsed:.1f} ms ({summary or 'no definition changed'}).")
+        bus = getattr(self.game, "bus", None)
+        if bus and report["files"]:
+            bus.emit("data_reloaded", report)
+        return report
+
+    # --- PER FILE ---
+
+    def _reload_materials(self, path, report):
+        game = self.game
+        new_defs = load_materials()
+        changed = _diff(game.material_defs, new_defs)
+        if not changed:
+            return
+        table = game.material_table
+        old_ids = table.ids
+        table.__dict__.update(compile_materials(new_defs).__dict__) # Systems hold this table
+        _replace(game.material_defs, new_defs)
+        if getattr(game, "material_system", None) is not None:
+            game.material_system.remap(old_ids)
+        report["materials"] |= changed
+
+        # Item prototypes resolve their material's decay type at compile time
+        self._recompile_items({item_id for item_id, proto in game.item_protos.items()
+                               if proto.material in changed}, report)
+
+    def _reload_items(self, path, report):
+        game = self.game
+        new_defs = load_items()
+        changed = _diff(game.item_defs, new_defs)
+        _replace(game.item_defs, new_defs)
+        self._recompile_items(changed, report)
+
+    def _reload_loadouts(self, path, report):
+        game = self.game
+        raw = load_loadouts()
+        changed = _diff(self._raw_loadouts, raw)
+        self._raw_loadouts = raw
+        for name in changed - raw.keys():
+            game.loadout_defs.pop(name, None)
+        self._revalidate_loadouts(changed & raw.keys(), report)
+
+    def _reload_body_plans(self, path, report):
+        game = self.game
+        species = game.body_plans.reload_file(path)
+        report["body_plans"] |= species
+        self._dirty_mobs |= {mob_id for mob_id, data in game.mob_defs.items()
+                             if data.get("body_plan", "humanoid") in species}
+
+    def _reload_mobs(self, path, report):
+        game = self.game
+        new_defs = load_mobs()
+        self._dirty_mobs |= _diff(game.mob_defs, new_defs)
+        _replace(game.mob_defs, new_defs)
+
+    # --- DEPENDENTS ---
+
+    def _recompile_items(self, item_ids, report):
+        game = self.game
+        protos = game.item_protos
+        appeared_or_gone = set()
+        for item_id in item_ids:
+            data = game.item_defs.get(item_id)
+            old = protos.get(item_id)
+            if data is None:
+                if old is not None:
+                    del protos[item_id]
+                    appeared_or_gone.add(item_id)
+            else:
+                try:
+                    new = ItemPrototype(item_id, data, game.material_table)
+                except (TypeError, ValueError) as e:
+                    logger.error(f"Item '{item_id}' is malformed ({e}). Keeping the old version.")
+                    continue
+                if old is None:
+                    protos[item_id] = new
+                    appeared_or_gone.add(item_id)
+                else:
+                    old.__dict__.update(new.__dict__) # Same object: mob loadouts point at it
+            game.entity_pool.retire(("item", item_id)) # Pooled copies were built from the old one
+            report["items"].add(item_id)
+
+        # Existence is all loadouts check, so only the ones naming an item
+        # that appeared or went away need validating again
+        if appeared_or_gone:
+            self._revalidate_loadouts({name for name, gear in self._raw_loadouts.items()
+                                       if appeared_or_gone.intersection(gear)}, report)
+            self._dirty_mobs |= {mob_id for mob_id, data in game.mob_defs.items()
+                                 if appeared_or_gone.intersection(data.get("loadout", []))}
+
+    def _revalidate_loadouts(self, names, report):
+        if not names:
+            return
+        raw = {name: self._raw_loadouts[name] for name in names}
+        self.game.loadout_defs.update(validate_loadouts(raw, self.game.item_defs))
+        report["loadouts"] |= names
+
+    def _recompile_mobs(self, report):
+        if not self._dirty_mobs:
+            return
+        game = self.game
+        dirty, self._dirty_mobs = self._dirty_mobs, set()
+        fresh = compile_mobs({mob_id: game.mob_defs[mob_id] for mob_id in dirty if mob_id in game.mob_defs},
+                             game.body_templates, game.item_protos, game.part_tables)
+        for mob_id in dirty:
+            new = fresh.get(mob_id)
+            if new is None:
+                if mob_id in game.mob_defs:
+                    continue # Malformed (already logged); the old prototype stays
+                game.mob_protos.pop(mob_id, None)
+            elif mob_id in game.mob_protos:
+                game.mob_protos[mob_id].__dict__.update(new.__dict__)
+            else:
+                game.mob_protos[mob_id] = new
+            # Recycled mobs keep their components (AI, body, senses), so
+            # they must not come back from the pool
+            game.entity_pool.retire(("mob", mob_id))
+            report["mobs"].add(mob_id)
@@ -1,13 +1,15 @@
 import pygame
 import logging
 from game.deebee import *
+from game import deebee as db # Window size is read from settings on first use
 from engine import colors as cn
+from engine.ui import get_font
 
 logger = logging.getLogger(__name__)
 
 class HUD:
     def __init__(self):
-        self.font = pygame.font.SysFont("arial", 20)
+        self.font = get_font("arial", 20)
         self.bar_length = 200
         self.bar_height = 10
         logger.info("HUD initialized.")
@@ -25,17 +27,9 @@ class HUD:
         weapon_name = "Unarmed"
         
         # A. Try to find what is actually held in hands (Body System)
-        if hasattr(player, "body") and player.body:
-            for slot_name, item_entity in player.body.slots.items():
-                if item_entity:
-                    # Check if the slot is meant for grasping (hands)
-                    # We check the tags associated with this specific body part
-                    slot_tags = player.body.slot_tags.get(slot_name, [])
-                    if "grasp" in slot_tags:
-                        # Found an item in a hand, use its name
-                        if hasattr(item_entity, "item"):
-                            weapon_name = item_entity.item.name
-                            break
+        # (BodyComponent keeps this indexed, no need to walk the slots)
+        if hasattr(player, "body") and player.body and player.body.active_weapon:
+            weapon_name = player.body.active_weapon.item.name
 
         # B. Fallback to stats default (Legacy System) if still unarmed
         if weapon_name == "Unarmed" and hasattr(player.stats, "base_equipment_data"):
@@ -62,13 +56,20 @@ class HUD:
         # 4. Draw Text
         self.draw_text(surface, f"{hp:.0f}/{max_hp:.0f}", 220, 10)
         self.draw_text(surface, f"Wpn: {weapon_name}", 10, 40)
-        self.draw_text(surface, "WASD to Move | S to Save | ESC for Menu | I for Inventory", 10, HEIGHT - 30)
+
+        # Local conditions (looked up from the weather fields at the player's tile)
+        weather = getattr(player.game, 'weather', None)
+        if weather is not None and player.physics:
+            px, py = int(player.physics.x), int(player.physics.y)
+            sky = "sheltered" if weather.sheltered_at(px, py) else weather.current
+            self.draw_text(surface, f"{sky}, {float(weather.temperature_at(px, py)):.0f}C", 10, 70)
+        self.draw_text(surface, "WASD to Move | S to Save | ESC for Menu | I for Inventory", 10, db.HEIGHT - 30)
 
         # Draw Seed (Bottom Right)
         if hasattr(player.game.map, 'seed'):
             seed_text = f"Seed: {player.game.map.seed}"
             text_surf = self.font.render(seed_text, True, cn.get("springgreen"))
-            rect = text_surf.get_rect(bottomright=(WIDTH - 10, HEIGHT - 10))
+            rect = text_surf.get_rect(bottomright=(db.WIDTH - 10, db.HEIGHT - 10))
             surface.blit(text_surf, rect)
 
     def draw_text(self, surface, text, x, y):
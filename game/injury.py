@@ -0,0 +1,217 @@
+import math
+import random
+import logging
+from array import array
+from typing import Dict, List
+
+from game.components import Component
+from game.deebee import (
+    INJURY_PART_SIZE,
+    INJURY_UNHITTABLE_TAGS,
+    INJURY_INSIDE_EXPOSURE,
+    INJURY_HP_PER_SIZE,
+    INJURY_BLEED_TAGS,
+    INJURY_NO_BLEED_TAGS,
+    INJURY_BLEED_PER_DAMAGE,
+    INJURY_CLOT_RATE,
+    INJURY_BLEED_STOP,
+    INJURY_BLOOD_FATAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# --- PART TABLES ---
+# One table per species, built once from the flattened body plan and shared
+# by every creature of that species. Per-creature state is just a couple of
+# flat arrays indexed by part number, so a hit is a table lookup plus a
+# few array writes, with no walk over the nested plan.
+
+def _build_alias(weights):
+    """
+    Walker/Vose alias table: after this, sampling a weighted index costs
+    one random number and one comparison, whatever the number of parts.
+    """
+    n = len(weights)
+    total = sum(weights)
+    if total <= 0:
+        return array('d', [1.0] * n), array('l', range(n))
+
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, s in enumerate(scaled) if s < 1.0]
+    large = [i for i, s in enumerate(scaled) if s >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Leftovers are 1.0 up to float error
+    return array('d', prob), array('l', alias)
+
+
+class PartTable:
+    """
+    Read-only per-species part data: names, max HP, bleed factors,
+    which parts are vital, and the hit-location alias table.
+    Hit weight = size (from tags) * exposure (less for parts 'inside' others).
+    """
+    def __init__(self, key: str, flat_plan: List[dict]):
+        self.key = key
+        names, tags_of, depth_of = [], {}, {}
+        for part in flat_plan:
+            name = part.get("name", "unknown")
+            if name not in tags_of:
+                names.append(name)
+            tags_of[name] = part.get("tags", [])
+            depth_of[name] = part.get("depth", 0)
+
+        self.names = tuple(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.n = len(names)
+
+        weights, max_hp, bleed, vital = [], [], [], []
+        for name in names:
+            tags = tags_of[name]
+            size = part_size(tags)
+            hittable = not any(t in INJURY_UNHITTABLE_TAGS for t in tags)
+            weights.append(size * INJURY_INSIDE_EXPOSURE ** depth_of[name] if hittable else 0.0)
+            max_hp.append(max(1.0, size * INJURY_HP_PER_SIZE))
+            bleed.append(bleed_factor(tags))
+            vital.append(1 if "vital" in tags else 0)
+
+        self.max_hp = array('f', max_hp)
+        self.bleed_factor = array('f', bleed)
+        self.vital = array('b', vital)
+        self.zeros = array('f', bytes(4 * self.n))
+        self.prob, self.alias = _build_alias(weights)
+
+    def sample(self, rng=random) -> int:
+        """Random hit location (part index), weighted by size and exposure."""
+        r = rng.random() * self.n
+        i = int(r)
+        return i if r - i < self.prob[i] else self.alias[i]
+
+
+def part_size(tags) -> float:
+    sizes = [INJURY_PART_SIZE[t] for t in tags if t in INJURY_PART_SIZE]
+    return max(sizes) if sizes else 1.0
+
+def bleed_factor(tags) -> float:
+    if any(t in INJURY_NO_BLEED_TAGS for t in tags):
+        return 0.0
+    factors = [INJURY_BLEED_TAGS[t] for t in tags if t in INJURY_BLEED_TAGS]
+    return max(factors) if factors else 0.3
+
+# --- COMPONENT ---
+
+class InjuryComponent(Component):
+    """
+    Per-part health and wounds for one creature. StatsComponent.hp stays the
+    overall pool; this adds where the damage landed, blood loss, and death
+    from a destroyed vital part.
+    """
+    def __init__(self, table: PartTable):
+        self.table = table
+        self.hp = array('f', table.max_hp)
+        self.bleed = array('f', table.zeros) # Blood fraction per second, per part
+        self.recycle(None)
+
+    def recycle(self, owner):
+        self.hp[:] = self.table.max_hp
+        self.bleed[:] = self.table.zeros
+        self._open = []  # Indices of parts with a nonzero bleed rate
+        self.blood = 1.0 # Fraction of full blood volume
+        self.dead = False
+
+    @property
+    def bleeding(self) -> bool:
+        return bool(self._open)
+
+    def hit(self, amount: float, rng=random) -> int:
+        """Damage at a random hit location. Returns the part index."""
+        part = self.table.sample(rng)
+        self.wound(part, amount)
+        return part
+
+    def wound(self, part: int, amount: float):
+        hp = self.hp[part] - amount
+        self.hp[part] = hp
+        rate = amount * self.table.bleed_factor[part] * INJURY_BLEED_PER_DAMAGE
+        if rate > 0:
+            if self.bleed[part] == 0:
+                self._open.append(part)
+            self.bleed[part] += rate
+        if hp <= 0 and self.table.vital[part]:
+            self.dead = True
+
+    def bleed_out(self, dt: float) -> bool:
+        """Loses blood for dt seconds and clots the open wounds. Returns True while still bleeding."""
+        bleed = self.bleed
+        clot = math.exp(-INJURY_CLOT_RATE * dt)
+        loss = 0.0
+        still_open = []
+        for i in self._open:
+            rate = bleed[i]
+            loss += rate
+            rate *= clot
+            if rate < INJURY_BLEED_STOP:
+                rate = 0.0
+            else:
+                still_open.append(i)
+            bleed[i] = rate
+        self._open = still_open
+
+        self.blood -= loss * dt
+        if self.blood <= INJURY_BLOOD_FATAL:
+            self.dead = True
+        return bool(still_open)
+
+    def part_name(self, part: int) -> str:
+        return self.table.names[part]
+
+    def condition(self, name: str) -> float:
+        """Remaining HP fraction of a part by name (1.0 = unhurt)."""
+        i = self.table.index[name]
+        return self.hp[i] / self.table.max_hp[i]
+
+# --- SYSTEM ---
+
+class InjurySystem:
+    """
+    Applies hits and runs blood loss. Only creatures with open wounds are
+    visited, so an unhurt crowd costs nothing.
+    """
+    def __init__(self):
+        self._bleeding = set()
+        logger.info("InjurySystem initialized.")
+
+    def hit(self, entity, amount: float, rng=random) -> int:
+        injury = entity.injury
+        part = injury.hit(amount, rng)
+        self.track(entity)
+        logger.debug(f"Hit {injury.part_name(part)} for {amount} (blood {injury.blood:.2f})")
+        return part
+
+    def track(self, entity):
+        """Starts running blood loss for 'entity' if it has open wounds (e.g. restored from a save)."""
+        if entity.injury.bleeding:
+            self._bleeding.add(entity)
+
+    def update(self, game, dt):
+        for entity in list(self._bleeding):
+            injury = getattr(entity, 'injury', None)
+            # Gone, or recycled by the pool since it was hit
+            if injury is None or not entity.alive() or not injury.bleeding:
+                self._bleeding.discard(entity)
+                continue
+            if not injury.bleed_out(dt):
+                self._bleeding.discard(entity)
+            if injury.dead:
+                self._bleeding.discard(entity)
+                if entity is game.player:
+                    logger.info("Player bled out.")
+                else:
+                    logger.debug(f"{entity} bled out.")
+                    entity.despawn()
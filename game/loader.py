@@ -1,9 +1,13 @@
 import json
 import os
+import sys
+import bisect
 import logging
 from game.deebee import DATA_DIR
 from engine.base_entity import Entity
 from game.components import *
+from game.prototypes import get_item_prototype
+from game.injury import PartTable
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,8 @@ def load_items():
 def create_item(game, item_id, definitions):
     """
     Factory to create an item entity from a definition ID.
+    'definitions' is normally game.item_protos (compiled once at load);
+    raw item dicts are still accepted and compiled on the fly.
     """
     if definitions is None:
         logger.error("Item definitions are None")
@@ -44,36 +50,17 @@ def create_item(game, item_id, definitions):
     if item_id not in definitions:
         logger.warning(f"Item ID '{item_id}' not defined.")
         return None
-    
-    data = definitions[item_id]
-    
-    # Create Entity (let game decide where to put it)
-    e = Entity(game)
-    
-    # 1. Item Metadata
-    e.item = ItemComponent(
-        name=data.get("name", "Unknown"),
-        weight=data.get("weight", 0.1),
-        volume=data.get("volume", 0.1),
-        value=data.get("value", 0),
-        material=data.get("material", None)
-    )
-    
-    # 2. Wearable Logic
-    slots = data.get("slots", [])
-    layer = data.get("layer", None)
-    
-    if slots or layer is not None:
-        # Default layer to 1 (Outer) if unspecified but slots exist
-        if layer is None: layer = 1 
-        e.wearable = WearableComponent(layer=layer, slots=slots)
-
-    # 3. Container Logic
-    tags = data.get("tags", [])
-    if "container" in tags or "container_capacity" in data:
-        cap_vol = data.get("container_capacity", 10)
-        e.container = ContainerComponent(capacity_vol=cap_vol)
-        
+
+    # Recycled entity? Its components were already reset on release.
+    pool = getattr(game, "entity_pool", None)
+    if pool is not None:
+        e = pool.acquire(("item", item_id))
+        if e is not None:
+            return e
+
+    e = get_item_prototype(item_id, definitions).instantiate(game)
+    if pool is not None:
+        pool.register(e, ("item", item_id))
     return e
 
 # --- 2. LOADOUT SYSTEMS ---
@@ -112,7 +99,8 @@ def validate_loadouts(loadouts, item_defs):
     return sanitized
 
 # --- 3. ANATOMY SYSTEMS ---
-def flatten_body_plan(node, parent_tags=None):
+def flatten_body_plan(node, parent_tags=None, depth=0):
+    # depth: how many parts this one sits 'inside' (organs are deeper than skin)
     if parent_tags is None: parent_tags = []
     
     inheritable = {"left", "right", "front", "back"}
@@ -127,41 +115,217 @@ def flatten_body_plan(node, parent_tags=None):
     
     flat_list = [{
         "name": unique_name,
-        "tags": list(set(current_tags)), 
-        "base_name": base_name
+        "tags": list(dict.fromkeys(current_tags)), # Deduped, order kept (stable bundles/masks)
+        "base_name": base_name,
+        "depth": depth
     }]
     
     for child in node.get("inside", []):
-        flat_list.extend(flatten_body_plan(child, current_tags))
+        flat_list.extend(flatten_body_plan(child, current_tags, depth + 1))
     for child in node.get("subparts", []):
-        flat_list.extend(flatten_body_plan(child, current_tags))
+        flat_list.extend(flatten_body_plan(child, current_tags, depth))
             
     return flat_list
 
+BODY_PLAN_FILES = (
+    os.path.join(DATA_DIR, "body_plan_fantasy.json"),
+    os.path.join(DATA_DIR, "body_plan_animals.json"),
+    os.path.join(DATA_DIR, "body_plan_livestock.json"),
+    os.path.join(DATA_DIR, "body_plan_pet.json"),
+)
+
+def _index_body_plan_file(path):
+    """
+    { species: (start, end) } byte spans of each species' entry in a body
+    plan file ([{species: [...]}, ...]), so one species can be parsed later
+    without parsing the rest of the file. Nothing is decoded here: the file
+    is only scanned for its top-level structure (brackets outside strings).
+    A broken entry shows up when that species is first parsed.
+    """
+    # Only needed on a cold start (the data bundle keeps the index)
+    import numpy as np
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    raw = np.frombuffer(data, dtype=np.uint8)
+
+    # 1. Strings: a quote after an odd run of backslashes is part of one
+    quotes = np.flatnonzero(raw == 0x22)
+    escaped = [k for k, q in enumerate(quotes.tolist())
+               if q and data[q - 1] == 0x5C and (q - len(data[:q].rstrip(b'\\'))) % 2]
+    quotes = np.delete(quotes, escaped)
+    in_string = np.zeros(len(raw), dtype=np.uint8)
+    in_string[quotes] = 1
+    in_string = (np.cumsum(in_string, dtype=np.uint32) & 1).astype(bool)
+
+    # 2. Nesting depth after each byte ('[' and '{' both open, ']' and '}' both close)
+    folded = np.where(in_string, 0, raw | 0x20)
+    step = (folded == 0x7B).astype(np.int8) - (folded == 0x7D).astype(np.int8)
+    depth = np.cumsum(step, dtype=np.int32)
+    if len(depth) and depth[-1] != 0:
+        raise ValueError("Unbalanced brackets")
+
+    # 3. Entries are the objects at depth 2; their keys are the strings
+    # right before a colon at that depth
+    opens = np.flatnonzero((step == 1) & (depth == 2)).tolist()
+    closes = np.flatnonzero((step == -1) & (depth == 1)).tolist()
+    colons = np.flatnonzero((raw == 0x3A) & ~in_string & (depth == 2)).tolist()
+    quotes = quotes.tolist()
+    spans = {}
+    for start, end in zip(opens, closes):
+        for c in colons[bisect.bisect_left(colons, start):bisect.bisect_left(colons, end)]:
+            q = bisect.bisect_left(quotes, c) - 1
+            spans[json.loads(data[quotes[q - 1]:quotes[q] + 1])] = (start, end + 1)
+    return spans
+
+def _deep_size(obj, seen=None):
+    """Rough memory footprint of plain data (dicts, lists, arrays, strings...)."""
+    if seen is None: seen = set()
+    if id(obj) in seen: return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(v, seen) for v in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _deep_size(vars(obj), seen)
+    elif hasattr(obj, '__slots__'):
+        size += sum(_deep_size(getattr(obj, n), seen) for n in obj.__slots__ if hasattr(obj, n))
+    return size
+
+class _LazyView:
+    """Read-only dict-like view whose values are built on first access."""
+    def __init__(self, registry, build):
+        self._registry = registry
+        self._build = build
+    def __contains__(self, species):
+        return species in self._registry
+    def __getitem__(self, species):
+        if species not in self._registry:
+            raise KeyError(species)
+        return self._build(species)
+    def get(self, species, default=None):
+        return self._build(species) if species in self._registry else default
+    def keys(self):
+        return self._registry.species()
+
+class BodyPlanRegistry:
+    """
+    Every species in every body plan file, indexed up front (which file,
+    which bytes of it) but only parsed and flattened the first time
+    something asks for it. BodyTemplates and injury PartTables are built from the
+    flattened plan on demand and cached the same way.
+
+    'plans', 'templates' and 'part_tables' are dict-like views, so code
+    that used the old eager dicts (game.body_templates.get("humanoid"))
+    works unchanged.
+    """
+    def __init__(self, paths=BODY_PLAN_FILES):
+        self.index = {} # species -> (path, start, end)
+        for path in paths:
+            if not os.path.exists(path):
+                logger.warning(f"Body Plan file missing: {path}")
+                continue
+            try:
+                for species, (start, end) in _index_body_plan_file(path).items():
+                    if species in self.index:
+                        logger.warning(f"Body plan '{species}' defined twice; using {os.path.basename(path)}.")
+                    self.index[species] = (path, start, end)
+            except (ValueError, json.JSONDecodeError) as e:
+                logger.error(f"Body Plan Error in {path}: {e}")
+        self._reset_caches()
+        logger.info(f"Indexed {len(self.index)} body plans: {self.species()}")
+
+    def _reset_caches(self):
+        self._plans = {}
+        self._templates = {}
+        self._part_tables = {}
+        self.plans = _LazyView(self, self.plan)
+        self.templates = _LazyView(self, self.template)
+        self.part_tables = _LazyView(self, self.part_table)
+
+    # Only the index goes into the data bundle; caches fill up per run
+    def __getstate__(self):
+        return {"index": self.index}
+
+    def __setstate__(self, state):
+        self.index = state["index"]
+        self._reset_caches()
+
+    def __contains__(self, species):
+        return species in self.index
+
+    def species(self):
+        return list(self.index)
+
+    def loaded(self):
+        return list(self._plans)
+
+    def plan(self, species):
+        """Flattened part list for 'species' (parsed on first use)."""
+        flat = self._plans.get(species)
+        if flat is None:
+            path, start, end = self.index[species]
+            with open(path, 'rb') as f:
+                f.seek(start)
+                entry = json.loads(f.read(end - start))
+            flat = []
+            for root_node in entry[species]:
+                flat.extend(flatten_body_plan(root_node))
+            self._plans[species] = flat
+            logger.info(f"Loaded body plan '{species}' from {os.path.basename(path)} ({len(flat)} parts).")
+        return flat
+
+    def template(self, species):
+        template = self._templates.get(species)
+        if template is None:
+            template = self._templates[species] = BodyTemplate(species, self.plan(species))
+        return template
+
+    def part_table(self, species):
+        table = self._part_tables.get(species)
+        if table is None:
+            table = self._part_tables[species] = PartTable(species, self.plan(species))
+        return table
+
+    def reload_file(self, path):
+        """
+        Re-indexes one edited body plan file. Species already loaded are
+        parsed again and their template/injury table rebuilt if the plan
+        changed; the rest just get their new spans.
+        Returns the species that changed, appeared or went away.
+        """
+        spans = _index_body_plan_file(path) # Raises on bad JSON; the old index stays
+        before = {s for s, (p, _, _) in self.index.items() if p == path}
+        changed = before ^ set(spans)
+        for species in before - set(spans):
+            del self.index[species]
+            for cache in (self._plans, self._templates, self._part_tables):
+                cache.pop(species, None)
+
+        for species, (start, end) in spans.items():
+            self.index[species] = (path, start, end)
+            old = self._plans.pop(species, None)
+            if old is not None and self.plan(species) != old:
+                self._templates.pop(species, None)
+                self._part_tables.pop(species, None)
+                changed.add(species)
+        return changed
+
+    def memory_report(self):
+        """Approximate bytes held per loaded species (plan + template + injury table)."""
+        return {
+            species: _deep_size(self._plans[species])
+                     + _deep_size(self._templates.get(species))
+                     + _deep_size(self._part_tables.get(species))
+            for species in self._plans
+        }
+
 def load_body_plans():
+    """Indexes every body plan file; species are parsed when first used."""
     logger.debug("Loading body plans...")
-    path = os.path.join(DATA_DIR, "body_plan_fantasy.json")
-    if not os.path.exists(path):
-        logger.warning("Body Plan file missing")
-        return {}
-    
-    try:
-        with open(path, 'r') as f:
-            raw = json.load(f)
-        
-        parsed = {}
-        for entry in raw:
-            for race, root_list in entry.items():
-                flattened = []
-                for root_node in root_list:
-                    flattened.extend(flatten_body_plan(root_node))
-                parsed[race] = flattened
-        logger.info(f"Loaded body plans for: {list(parsed.keys())}")
-        return parsed
-        
-    except Exception as e:
-        logger.error(f"Body Plan Error: {e}")
-        return {}
+    return BodyPlanRegistry(BODY_PLAN_FILES)
 
 # --- 4. MATERIAL SYSTEMS ---
 def load_materials():
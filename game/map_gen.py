@@ -6,18 +6,22 @@ from game import deebee as db
 logger = logging.getLogger(__name__)
 
 class Map:
-    def __init__(self, width=db.GRID_WIDTH, height=db.GRID_HEIGHT, seed=None):
-        self.width = width
-        self.height = height
+    def __init__(self, width=None, height=None, seed=None, grid=None):
+        # Screen-sized by default (settings are only read when needed)
+        self.width = db.GRID_WIDTH if width is None else width
+        self.height = db.GRID_HEIGHT if height is None else height
         self.grid = []
         if seed is None:
             self.seed = str(int(time.time()))
         else:
             self.seed = str(seed)
         
-        logger.info(f"Initializing Map {width}x{height} with seed: {self.seed}")
+        logger.info(f"Initializing Map {self.width}x{self.height} with seed: {self.seed}")
         self.rng = random.Random(self.seed)
-        self.generate()
+        if grid is None:
+            self.generate()
+        else:
+            self.grid = grid # From a save: the tiles as they were, digging and all
 
     def generate(self):
         # Step 1: Random Fill (Simulation Seed)
@@ -81,6 +85,30 @@ class Map:
             return True
         return False
     
+    def line_of_sight(self, x0, y0, x1, y1):
+        """
+        True if no wall lies strictly between tiles (x0, y0) and (x1, y1).
+        Walks the tiles on the line with Bresenham's algorithm.
+        """
+        x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        grid = self.grid
+        while True:
+            if x0 == x1 and y0 == y1:
+                return True
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+            if (x0 != x1 or y0 != y1) and self.is_blocked(x0, y0):
+                return False
+
     def get_traversable_point(self, bias="top_left"):
         """
         Finds the nearest valid floor tile to the desired corner 
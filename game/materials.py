@@ -0,0 +1,193 @@
+import math
+import logging
+from typing import Dict
+
+import numpy as np
+
+from game.deebee import TILESIZE
+from game.components import MaterialComponent
+from game.deebee import (
+    MATERIAL_DECAY_TYPES,
+    MATERIAL_AMBIENT_C,
+    MATERIAL_WET_RATE,
+    MATERIAL_DRY_RATE,
+    MATERIAL_SOAKED,
+    MATERIAL_RUST_RATE,
+    MATERIAL_ROT_RATE,
+    MATERIAL_HOT_C,
+    MATERIAL_HEAT_RATE,
+)
+
+logger = logging.getLogger(__name__)
+
+DECAY_TYPES = MATERIAL_DECAY_TYPES
+DECAY_IDS = {name: i for i, name in enumerate(DECAY_TYPES)}
+D_NONE, D_RUST, D_ROT, D_DECOMPOSE = range(len(DECAY_TYPES))
+
+# --- PROPERTY TABLES ---
+
+class MaterialTable:
+    """
+    materials.json compiled into columns indexed by material number, so the
+    MaterialSystem can look up a property for every entity in one fancy-index.
+    """
+    def __init__(self, material_defs: dict):
+        self.ids = tuple(material_defs.keys())
+        self.index: Dict[str, int] = {mat_id: i for i, mat_id in enumerate(self.ids)}
+        self.default = self.index.get("default", 0)
+
+        decay = []
+        for mat_id, props in material_defs.items():
+            kind = props.get("decay_type", "none")
+            if kind not in DECAY_IDS:
+                logger.warning(f"Material '{mat_id}' has unknown decay_type '{kind}'. Using 'none'.")
+                kind = "none"
+            decay.append(DECAY_IDS[kind])
+
+        def column(key, default):
+            return np.array([float(p.get(key, default)) for p in material_defs.values()])
+
+        self.names = tuple(p.get("name", mat_id) for mat_id, p in material_defs.items())
+        self.density = column("density", 1.0)
+        self.hardness = column("hardness", 1)
+        self.flammability = column("flammability", 0.0)
+        self.conductive = np.array([bool(p.get("conductive", False)) for p in material_defs.values()])
+        self.decay = np.array(decay, dtype=np.int8)
+
+    def lookup(self, material_id) -> int:
+        return self.index.get(material_id, self.default)
+
+def compile_materials(material_defs: dict) -> MaterialTable:
+    table = MaterialTable(material_defs or {"default": {}})
+    logger.info(f"Compiled {len(table.ids)} materials.")
+    return table
+
+# --- SYSTEM ---
+
+class MaterialSystem:
+    """
+    Wetness, temperature and decay (rust, rot) for every material entity in
+    the world. Each entity owns one slot of the state arrays while it is in
+    all_sprites (TrackedGroup listener); MaterialComponent reads and writes
+    through to its slot, and gets the values back when it leaves.
+    A tick is a handful of whole-array NumPy expressions.
+
+    Entities that leave the world are stamped with the clock's time and
+    decay lazily from there (MaterialComponent.settle).
+    """
+    def __init__(self, table: MaterialTable, clock=None, capacity=256):
+        self.table = table
+        self.clock = clock
+        self.capacity = 0
+        self.mat = np.zeros(0, dtype=np.int32)
+        for name in MaterialComponent.STATE:
+            setattr(self, name, np.zeros(0))
+        self.active = np.zeros(0, dtype=bool)
+        self.x = np.zeros(0, dtype=np.int32) # Tile the entity sits on (items don't move)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.air = np.zeros(0)               # Local air temperature on the last update
+        self._free = []
+        self._top = 0 # Slots at or above this were never used
+        self._grow(capacity)
+        logger.info("MaterialSystem initialized.")
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.mat = np.concatenate([self.mat, np.zeros(extra, dtype=np.int32)])
+        for name in MaterialComponent.STATE:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra)]))
+        self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+        self.x = np.concatenate([self.x, np.zeros(extra, dtype=np.int32)])
+        self.y = np.concatenate([self.y, np.zeros(extra, dtype=np.int32)])
+        self.air = np.concatenate([self.air, np.full(extra, MATERIAL_AMBIENT_C)])
+        self.capacity = capacity
+
+    def in_world(self) -> int:
+        return self._top - len(self._free)
+
+    # --- MEMBERSHIP (TrackedGroup listener) ---
+    def on_add(self, entity):
+        comp = getattr(entity, 'material', None)
+        if not isinstance(comp, MaterialComponent) or comp.store is not None:
+            return
+        if self._free:
+            i = self._free.pop()
+        else:
+            if self._top == self.capacity:
+                self._grow(self.capacity * 2)
+            i = self._top
+            self._top += 1
+
+        values = [getattr(comp, name) for name in MaterialComponent.STATE] # Settled up to now
+        self.mat[i] = self.table.lookup(comp.material_id)
+        self.active[i] = True
+        self.x[i] = int(entity.pos_x) // TILESIZE
+        self.y[i] = int(entity.pos_y) // TILESIZE
+        self.air[i] = comp._air
+        comp.store, comp.slot = self, i
+        for name, value in zip(MaterialComponent.STATE, values):
+            setattr(comp, name, value)
+
+    def on_remove(self, entity):
+        comp = getattr(entity, 'material', None)
+        if not isinstance(comp, MaterialComponent) or comp.store is not self:
+            return
+        values = [getattr(comp, name) for name in MaterialComponent.STATE]
+        i = comp.slot
+        comp.store, comp.slot = None, -1
+        if comp.clock is None:
+            comp.clock = self.clock
+        comp.stamp(float(self.air[i]))
+        for name, value in zip(MaterialComponent.STATE, values):
+            setattr(comp, name, value)
+        self.active[i] = False
+        self._free.append(i)
+
+    def remap(self, old_ids):
+        """
+        The table was rebuilt (data hot-reload): material numbers may have
+        moved, so every slot is pointed at its material's new number.
+        """
+        lookup = np.array([self.table.lookup(mat_id) for mat_id in old_ids], dtype=np.int32)
+        n = self._top
+        self.mat[:n] = lookup[self.mat[:n]]
+
+    # --- SIMULATION ---
+    def update(self, game_context, dt):
+        n = self._top
+        if n == len(self._free):
+            return # Nothing in the world is made of anything
+
+        # 1. Local conditions, looked up from the weather fields (weather is optional)
+        weather = getattr(game_context, "weather", None)
+        if weather is not None:
+            xs, ys = self.x[:n], self.y[:n]
+            raining = weather.rain_at(xs, ys)
+            self.air[:n] = weather.temperature_at(xs, ys)
+        else:
+            raining = False
+            self.air[:n] = MATERIAL_AMBIENT_C
+        air = self.air[:n]
+
+        # Free slots are updated too; they are overwritten when reused
+        wet = self.wetness[:n]
+        integrity = self.integrity[:n]
+        decay = self.table.decay[self.mat[:n]]
+
+        # --- PHASE A: IMMEDIATE PHYSICS ---
+        wet += np.where(raining, MATERIAL_WET_RATE, -MATERIAL_DRY_RATE) * dt
+        np.clip(wet, 0.0, 1.0, out=wet)
+        temperature = self.temperature[:n]
+        temperature += (air - temperature) * (1.0 - math.exp(-MATERIAL_HEAT_RATE * dt))
+
+        # --- PHASE B: REACTIONS ---
+        soaked = wet > MATERIAL_SOAKED
+        rot = MATERIAL_ROT_RATE * np.where(air > MATERIAL_HOT_C, 2.0, 1.0) * np.where(soaked, 2.0, 1.0)
+        rate = np.where((decay == D_ROT) | (decay == D_DECOMPOSE), rot,
+                        np.where((decay == D_RUST) & soaked, MATERIAL_RUST_RATE, 0.0))
+        loss = rate * dt
+        integrity -= loss
+        np.maximum(integrity, 0.0, out=integrity)
+        corrosion = self.corrosion[:n]
+        corrosion += loss
+        np.minimum(corrosion, 1.0, out=corrosion)
@@ -0,0 +1,171 @@
+import math
+import logging
+
+from game.components import Component
+from game.deebee import (
+    PERCEPTION_MAX_SIGHT,
+    PERCEPTION_LOSE_TRACK_S,
+    PLAYER_STEP_NOISE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def worn_stealth_penalty(entity):
+    """Sum of stealth penalties of everything the entity wears (noisy armor etc.)."""
+    body = getattr(entity, 'body', None)
+    return body.stealth_penalty if body is not None else 0
+
+
+class PerceptionComponent(Component):
+    """
+    What a mob knows about the player. Written only by the PerceptionSystem;
+    the AI reads 'aware', 'can_see' and 'last_known' instead of game.player.
+    """
+    def __init__(self, sight=10.0, hearing=1.0):
+        self.sight = sight       # Tiles
+        self.hearing = hearing   # Multiplier on the radius of sounds it can hear
+        self.recycle(None)
+
+    def recycle(self, owner):
+        self.aware = False
+        self.can_see = False
+        self.senses = False      # Saw or heard the player on the last evaluation
+        self.last_known = None   # (x, y) in tiles
+        self.last_contact = 0.0
+        self._stamp = None       # Inputs of the last evaluation
+
+
+class PerceptionSystem:
+    """
+    Sight (radius + line of sight) and hearing (noise radius) for mobs.
+
+    Event-driven: a mob is only re-evaluated when its inputs changed (the
+    player's tile or noise level, its own tile, a nearby noise event) or
+    while it is tracking the player. Unaware mobs out of range cost nothing.
+    State changes are published on the bus as "mob_noticed" and
+    "mob_lost_track" with {"mob": entity, "pos": (x, y)}. A mob the player
+    shoots (the "projectile_hit" event) knows where the shot came from.
+    """
+    def __init__(self, spatial, lod=None):
+        self.spatial = spatial
+        self.lod = lod
+        self.time = 0.0
+        self._player_key = None
+        self._noises = []     # (x, y, radius) emitted since the last update
+        self._shots = []      # (mob, shooter, (x, y)) hits delivered since the last update
+        self._sensing = set() # Mobs that saw/heard the player last evaluation
+        self._aware = set()
+        logger.info("PerceptionSystem initialized.")
+
+    def emit_noise(self, x, y, radius):
+        """A sound at tile (x, y) audible within 'radius' tiles (gunshot, bowstring...)."""
+        self._noises.append((x, y, radius))
+
+    def on_projectile_hit(self, data):
+        """Bus subscriber (queued, so it runs after the tick): remembered until the next update."""
+        owner, target = data["owner"], data["target"]
+        if getattr(target, 'perception', None) is not None and getattr(owner, 'physics', None) is not None:
+            self._shots.append((target, owner, (owner.physics.x, owner.physics.y)))
+
+    def update(self, game, dt):
+        self.time += dt
+        player = game.player
+        if player is None or getattr(player, 'physics', None) is None:
+            return
+
+        # 1. Active entities may have moved; dormant ones (LOD) cannot
+        if self.lod is not None:
+            for entity in self.lod.full:
+                self.spatial.move(entity)
+            for entity in self.lod.coarse:
+                self.spatial.move(entity)
+
+        # 2. Player inputs
+        px, py = player.physics.x, player.physics.y
+        moving = player.physics.vx != 0 or player.physics.vy != 0
+        noise = PLAYER_STEP_NOISE + worn_stealth_penalty(player) if moving else 0.0
+        player_key = (int(px), int(py), noise)
+        player_changed = player_key != self._player_key
+        self._player_key = player_key
+
+        # 3. Who needs a look: mobs in range of the player (if anything changed
+        #    for them), mobs that were sensing the player, mobs near a noise
+        todo = set()
+        reach = max(PERCEPTION_MAX_SIGHT, noise * 2)
+        in_range = self.spatial.query_radius(px, py, reach)
+        for mob in in_range:
+            perception = getattr(mob, 'perception', None)
+            if perception is None:
+                continue
+            stamp = (player_key, int(mob.physics.x), int(mob.physics.y))
+            if player_changed or stamp != perception._stamp:
+                perception._stamp = stamp
+                todo.add(mob)
+        # Walked out of range: one last look so they stop sensing the player
+        todo |= self._sensing.difference(in_range)
+
+        heard = {}
+        for nx, ny, radius in self._noises:
+            for mob in self.spatial.query_radius(nx, ny, radius * 2):
+                perception = getattr(mob, 'perception', None)
+                if perception is not None and math.hypot(mob.physics.x - nx, mob.physics.y - ny) <= radius * perception.hearing:
+                    heard[mob] = (nx, ny)
+        self._noises.clear()
+        for mob, shooter, pos in self._shots:
+            if shooter is player:
+                heard[mob] = pos
+        self._shots.clear()
+
+        # 4. Evaluate
+        for mob in todo:
+            if not mob.alive():
+                self._forget(mob)
+                continue
+            self._evaluate(game, mob, px, py, noise)
+        for mob, pos in heard.items():
+            if mob.alive():
+                self._contact(game, mob, pos)
+
+        # 5. Keep contact fresh / time out lost trails
+        for mob in list(self._aware):
+            perception = mob.perception
+            if not mob.alive() or not perception.aware:
+                self._forget(mob) # Died (or was recycled) while tracking
+            elif perception.senses:
+                perception.last_contact = self.time
+            elif self.time - perception.last_contact > PERCEPTION_LOSE_TRACK_S:
+                perception.aware = False
+                self._aware.discard(mob)
+                if game.bus:
+                    game.bus.emit("mob_lost_track", {"mob": mob, "pos": perception.last_known})
+
+    def _evaluate(self, game, mob, px, py, noise):
+        perception = mob.perception
+        mx, my = mob.physics.x, mob.physics.y
+        dist = math.hypot(px - mx, py - my)
+
+        see = dist <= perception.sight and game.map.line_of_sight(mx, my, px, py)
+        hear = dist <= noise * perception.hearing
+
+        perception.can_see = see
+        perception.senses = see or hear
+        if perception.senses:
+            self._sensing.add(mob)
+            self._contact(game, mob, (px, py))
+        else:
+            self._sensing.discard(mob)
+
+    def _contact(self, game, mob, pos):
+        perception = mob.perception
+        perception.last_known = pos
+        perception.last_contact = self.time
+        if not perception.aware:
+            perception.aware = True
+            self._aware.add(mob)
+            if game.bus:
+                game.bus.emit("mob_noticed", {"mob": mob, "pos": pos})
+
+    def _forget(self, mob):
+        self._sensing.discard(mob)
+        self._aware.discard(mob)
@@ -1,105 +1,525 @@
-import json
 import os
-import pygame
-from game.deebee import SAVE_FILE, TILESIZE, GRID_WIDTH, GRID_HEIGHT
+import time
+import struct
+import logging
+import traceback
+
+import numpy as np
+
+from game.deebee import SAVE_FILE, SAVE_VERSION
 from game.map_gen import Map
-from game.entities import create_player, create_mob
+from game.entities import create_player, create_mob, create_world_item
+from game.loader import create_item
+
+logger = logging.getLogger(__name__)
+
+# --- SAVE FORMAT ---
+# Little-endian binary, written and read as a stream (never built whole in memory):
+#
+#   header     MAGIC, version (SAVE_VERSION), flags
+#   meta       map seed, sim time, entity count, player index
+#   strings    every id / part / tag name used below, once; records refer to them by index
+#   grid       width, height, then RLE runs of (tile value, run length)
+#   weather    present?, its clock, then the temperature and wetness fields
+#   fire       present?, tile fuel, scorched tiles (bit-packed), burning tiles in order
+#   entities   one record each: kind, archetype (string index), component flags,
+#              then one block per flag, in flag order
+#
+# The hierarchy is stored as entity indices, not nesting: a body lists the
+# items it wears and the parts each one covers, a container lists its
+# contents. Loading creates every entity first and links them afterwards,
+# so a record may point at one further down the file.
+
+MAGIC = b"BLAYDSAV"
+
+_HEADER = struct.Struct("<8sHH")  # magic, version, flags
+_META = struct.Struct("<dII")     # sim time, entity count, player index
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_RUN = struct.Struct("<BH")       # tile value, run length
+_WEATHER = struct.Struct("<BdHH") # present, time, field rows, field columns
+_FIRE = struct.Struct("<BHHI")    # present, height, width, burning tile count
+_RECORD = struct.Struct("<BHH")   # kind, archetype, component flags
+
+# Entity kinds
+K_PLAYER, K_MOB, K_GROUND, K_CARRIED = range(4)
+
+# Component flags, and the block each one adds to a record (in this order)
+F_PLACE     = 1 << 0 # pos_x, pos_y (px), physics x, y (tiles), vx, vy
+F_STATS     = 1 << 1 # hp, max_hp
+F_INJURY    = 1 << 2 # blood, dead, part count, then (part, hp, bleed) per hurt part
+F_BODY      = 1 << 3 # worn (item index, parts) and changed slot tags
+F_ITEM      = 1 << 4 # condition
+F_STACK     = 1 << 5 # count
+F_CONTAINER = 1 << 6 # locked, content indices
+F_MATERIAL  = 1 << 7 # temperature, wetness, corrosion, integrity, burning (back in the FireSystem on load)
+F_RANGED    = 1 << 8 # ammo, seconds until the next shot (the projectile clock restarts on load)
+F_BEHAVIOR  = 1 << 9 # home
+
+_PLACE = struct.Struct("<ffffff")
+_STATS = struct.Struct("<ff")
+_INJURY = struct.Struct("<fBHH")   # blood, dead, part count, hurt count
+_WOUND = struct.Struct("<Hff")     # part, hp, bleed
+_BODY = struct.Struct("<HH")      # worn count, changed slot count
+_WORN = struct.Struct("<IB")      # item index, part count
+_SLOT = struct.Struct("<HB")      # slot name, tag count
+_ITEM = struct.Struct("<f")
+_STACK = struct.Struct("<I")
+_CONTAINER = struct.Struct("<BI") # locked, content count
+_MATERIAL = struct.Struct("<ffffB")
+_RANGED = struct.Struct("<Hd")
+_HOME = struct.Struct("<ff")
+
+def _read(f, st):
+    data = f.read(st.size)
+    if len(data) != st.size:
+        raise ValueError("Save file is truncated")
+    return st.unpack(data)
+
+def _read_bytes(f, n):
+    data = f.read(n)
+    if len(data) != n:
+        raise ValueError("Save file is truncated")
+    return data
+
+def _read_indices(f, n):
+    return struct.unpack(f"<{n}I", _read_bytes(f, 4 * n))
+
+def _read_strings(f, n):
+    return struct.unpack(f"<{n}H", _read_bytes(f, 2 * n))
+
+# --- WRITING ---
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+    def __call__(self, s):
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.index)
+        return i
+
+def _carried(entity):
+    """Items an entity holds directly: worn/held ones, or a container's contents."""
+    body = getattr(entity, 'body', None)
+    if body is not None:
+        yield from body._worn
+    container = getattr(entity, 'container', None)
+    if container is not None:
+        yield from container.content
+
+def _collect(game, strings):
+    """
+    Entities to save, in file order: player, mobs, items on the ground,
+    then everything carried (worn, held, bagged, at any depth).
+    Returns [(kind, entity, archetype)].
+    """
+    entries = [(K_PLAYER, game.player, "player")]
+    for mob in game.mobs:
+        archetype = getattr(mob, 'archetype', None)
+        if archetype is None:
+            logger.warning(f"Mob {mob} has no archetype; not saved.")
+            continue
+        entries.append((K_MOB, mob, archetype[1]))
+    for sprite in game.all_sprites:
+        if getattr(sprite, 'item', None) is not None:
+            entries.append((K_GROUND, sprite, sprite.item.item_id))
+
+    i = 0
+    while i < len(entries): # Grows as it goes: breadth-first down the hierarchy
+        for item in _carried(entries[i][1]):
+            entries.append((K_CARRIED, item, item.item.item_id))
+        i += 1
+
+    for _, entity, archetype in entries:
+        strings(archetype)
+        body = getattr(entity, 'body', None)
+        if body is not None:
+            for parts in body._worn.values():
+                for p in parts: strings(p)
+            for slot, tags in _changed_slots(body):
+                strings(slot)
+                for t in tags: strings(t)
+    return entries
+
+def _changed_slots(body):
+    """Slots whose tags differ from the body's template (severed hands and such)."""
+    if not body._owns_layout:
+        return []
+    template = body._template.slot_tags
+    return [(slot, tags) for slot, tags in body.slot_tags.items() if template.get(slot) != tags]
+
+def _write_grid(f, grid):
+    runs = bytearray()
+    value, length = None, 0
+    for row in grid:
+        for tile in row:
+            if tile == value and length < 0xFFFF:
+                length += 1
+            else:
+                if length: runs += _RUN.pack(value, length)
+                value, length = tile, 1
+    if length: runs += _RUN.pack(value, length)
+    f.write(_U16.pack(len(grid[0]) if grid else 0))
+    f.write(_U16.pack(len(grid)))
+    f.write(_U32.pack(len(runs) // _RUN.size))
+    f.write(runs)
+
+def _write_weather(f, weather):
+    if weather is None:
+        f.write(_WEATHER.pack(0, 0.0, 0, 0))
+        return
+    rows, cols = weather.temp_field.shape
+    f.write(_WEATHER.pack(1, weather.time, rows, cols))
+    f.write(weather.temp_field.astype('<f4').tobytes())
+    f.write(weather.wet_field.astype('<f4').tobytes())
+
+def _write_fire(f, fire):
+    if fire is None:
+        f.write(_FIRE.pack(0, 0, 0, 0))
+        return
+    f.write(_FIRE.pack(1, fire.height, fire.width, len(fire.burning)))
+    f.write(fire.fuel.astype('<f4').tobytes())
+    f.write(np.packbits(fire.scorched).tobytes())
+    f.write(np.array(list(fire.burning), dtype='<u2').tobytes())
+
+def _write_entity(f, kind, entity, archetype, index, strings, shot_clock):
+    physics = getattr(entity, 'physics', None)
+    stats = getattr(entity, 'stats', None)
+    injury = getattr(entity, 'injury', None)
+    body = getattr(entity, 'body', None)
+    item = getattr(entity, 'item', None)
+    stack = getattr(entity, 'stack', None)
+    container = getattr(entity, 'container', None)
+    material = getattr(entity, 'material', None)
+    ranged = getattr(entity, 'ranged', None)
+    control = getattr(entity, 'control', None)
+    home = getattr(control, 'home', None)
+
+    flags = ((F_PLACE if physics is not None and kind != K_CARRIED else 0)
+             | (F_STATS if stats is not None else 0)
+             | (F_INJURY if injury is not None else 0)
+             | (F_BODY if body is not None else 0)
+             | (F_ITEM if item is not None else 0)
+             | (F_STACK if stack is not None else 0)
+             | (F_CONTAINER if container is not None else 0)
+             | (F_MATERIAL if material is not None else 0)
+             | (F_RANGED if ranged is not None else 0)
+             | (F_BEHAVIOR if home is not None else 0))
+    f.write(_RECORD.pack(kind, strings(archetype), flags))
 
-from game.systems import CombatSystem
+    if flags & F_PLACE:
+        f.write(_PLACE.pack(entity.pos_x, entity.pos_y, physics.x, physics.y, physics.vx, physics.vy))
+    if flags & F_STATS:
+        f.write(_STATS.pack(stats.hp, stats.max_hp))
+    if flags & F_INJURY:
+        # Only the hurt parts: most creatures are unhurt, most parts of the rest too
+        max_hp, hp, bleed = injury.table.max_hp, injury.hp, injury.bleed
+        hurt = [i for i in range(len(hp)) if hp[i] != max_hp[i] or bleed[i]]
+        f.write(_INJURY.pack(injury.blood, injury.dead, len(hp), len(hurt)))
+        for i in hurt:
+            f.write(_WOUND.pack(i, hp[i], bleed[i]))
+    if flags & F_BODY:
+        changed = _changed_slots(body)
+        f.write(_BODY.pack(len(body._worn), len(changed)))
+        for worn, parts in body._worn.items():
+            f.write(_WORN.pack(index[worn], len(parts)))
+            f.write(struct.pack(f"<{len(parts)}H", *map(strings, parts)))
+        for slot, tags in changed:
+            f.write(_SLOT.pack(strings(slot), len(tags)))
+            f.write(struct.pack(f"<{len(tags)}H", *map(strings, tags)))
+    if flags & F_ITEM:
+        f.write(_ITEM.pack(item.condition))
+    if flags & F_STACK:
+        f.write(_STACK.pack(stack.count))
+    if flags & F_CONTAINER:
+        f.write(_CONTAINER.pack(container.is_locked, len(container.content)))
+        f.write(struct.pack(f"<{len(container.content)}I", *(index[e] for e in container.content)))
+    if flags & F_MATERIAL:
+        f.write(_MATERIAL.pack(material.temperature, material.wetness, material.corrosion,
+                               material.integrity, material.is_burning))
+    if flags & F_RANGED:
+        f.write(_RANGED.pack(ranged.current_ammo, max(0.0, ranged.next_shot - shot_clock)))
+    if flags & F_BEHAVIOR:
+        f.write(_HOME.pack(*home))
 
 def save_game_state(game):
     """
-    Serializes the current game state to a JSON file.
-    Returns True if successful, False if failed.
+    Writes the whole world (map, player, mobs, ground items and everything
+    they carry) to SAVE_FILE. Returns True if successful, False if failed.
     """
     if not game.player or not game.map:
         print("Error: Cannot save, game state is invalid.")
         return False
 
-    # 1. Gather Data
-    data = {
-        "seed": game.map.seed,
-        "player": {
-            # Save Grid Coords (Float -> Int/Grid)
-            "x": game.player.physics.x / TILESIZE, 
-            "y": game.player.physics.y / TILESIZE,
-            "hp": game.player.stats.hp,
-            "equipment": game.player.stats.equipment
-            # TODO: Future - Serialize BodyComponent/Inventory Hierarchy here
-        },
-        "map_grid": game.map.grid, 
-        "mobs": [
-            {
-                "x": m.physics.x / TILESIZE, 
-                "y": m.physics.y / TILESIZE, 
-                "hp": m.stats.hp
-            } for m in game.mobs
-        ]
-    }
-    
-    # 2. Write File
+    start = time.perf_counter()
+    # 1. Gather: file order and string table (the records themselves are streamed)
+    strings = _StringTable()
+    seed = strings(str(game.map.seed))
+    entries = _collect(game, strings)
+    index = {entity: i for i, (_, entity, _) in enumerate(entries)}
+    projectiles = getattr(game, 'projectile_system', None)
+    shot_clock = projectiles.time if projectiles is not None else 0.0
+
+    # 2. Write to a temp file first, so a failed save leaves the last good one
+    tmp = SAVE_FILE + ".tmp"
     try:
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(data, f)
-        print(f"Game Saved to {SAVE_FILE}")
-        return True
+        os.makedirs(os.path.dirname(SAVE_FILE), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, SAVE_VERSION, 0))
+            f.write(_U16.pack(seed))
+            f.write(_META.pack(game.scheduler.time, len(entries), 0))
+            f.write(_U32.pack(len(strings.index)))
+            for s in strings.index:
+                data = s.encode('utf-8')
+                f.write(_U16.pack(len(data)))
+                f.write(data)
+            _write_grid(f, game.map.grid)
+            _write_weather(f, getattr(game, 'weather', None))
+            _write_fire(f, getattr(game, 'fire_system', None))
+            for kind, entity, archetype in entries:
+                _write_entity(f, kind, entity, archetype, index, strings, shot_clock)
+        os.replace(tmp, SAVE_FILE)
     except Exception as e:
         print(f"Error saving game: {e}")
+        traceback.print_exc()
         return False
 
+    elapsed = (time.perf_counter() - start) * 1000
+    logger.info(f"Saved {len(entries)} entities ({os.path.getsize(SAVE_FILE)} bytes) in {elapsed:.1f} ms.")
+    print(f"Game Saved to {SAVE_FILE}")
+    return True
+
+# --- READING ---
+# Loading happens in two passes. The whole file is first decoded into plain
+# records and checked against the current definitions, while the running
+# world is left alone. Only a save that passes is then built, so a bad or
+# outdated file can't leave a wiped, half-built world behind.
+
+def _read_grid(f):
+    width, = _read(f, _U16)
+    height, = _read(f, _U16)
+    n, = _read(f, _U32)
+    tiles = []
+    for value, length in _RUN.iter_unpack(_read_bytes(f, n * _RUN.size)):
+        tiles.extend([value] * length)
+    if len(tiles) != width * height:
+        raise ValueError(f"Map grid has {len(tiles)} tiles, expected {width}x{height}")
+    return [tiles[y * width:(y + 1) * width] for y in range(height)], width, height
+
+def _read_weather(f):
+    """(time, temp_field, wet_field), or None if the save had no weather."""
+    present, weather_time, rows, cols = _read(f, _WEATHER)
+    if not present:
+        return None
+    n = rows * cols * 4
+    temp = np.frombuffer(_read_bytes(f, n), dtype='<f4').reshape(rows, cols)
+    wet = np.frombuffer(_read_bytes(f, n), dtype='<f4').reshape(rows, cols)
+    return weather_time, temp, wet
+
+def _read_fire(f):
+    """(fuel, scorched, burning tiles), or None if the save had no fire system."""
+    present, rows, cols, n = _read(f, _FIRE)
+    if not present:
+        return None
+    fuel = np.frombuffer(_read_bytes(f, rows * cols * 4), dtype='<f4').reshape(rows, cols)
+    bits = np.frombuffer(_read_bytes(f, (rows * cols + 7) // 8), dtype=np.uint8)
+    scorched = np.unpackbits(bits, count=rows * cols).astype(bool).reshape(rows, cols)
+    burning = np.frombuffer(_read_bytes(f, n * 4), dtype='<u2').reshape(n, 2).tolist()
+    return fuel, scorched, [tuple(t) for t in burning]
+
+def _read_record(f, strings):
+    """Decodes one entity record into a dict of its blocks (nothing is built yet)."""
+    kind, archetype, flags = _read(f, _RECORD)
+    r = {"kind": kind, "archetype": strings[archetype]}
+    if flags & F_PLACE:
+        r["place"] = _read(f, _PLACE)
+    if flags & F_STATS:
+        r["stats"] = _read(f, _STATS)
+    if flags & F_INJURY:
+        blood, dead, n, n_hurt = _read(f, _INJURY)
+        wounds = list(_WOUND.iter_unpack(_read_bytes(f, n_hurt * _WOUND.size)))
+        r["injury"] = (blood, bool(dead), n, wounds)
+    if flags & F_BODY:
+        n_worn, n_changed = _read(f, _BODY)
+        worn = []
+        for _ in range(n_worn):
+            item, n_parts = _read(f, _WORN)
+            worn.append((item, tuple(strings[p] for p in _read_strings(f, n_parts))))
+        changed = []
+        for _ in range(n_changed):
+            slot, n_tags = _read(f, _SLOT)
+            changed.append((strings[slot], [strings[t] for t in _read_strings(f, n_tags)]))
+        r["worn"], r["changed"] = worn, changed
+    if flags & F_ITEM:
+        r["condition"], = _read(f, _ITEM)
+    if flags & F_STACK:
+        r["count"], = _read(f, _STACK)
+    if flags & F_CONTAINER:
+        locked, n = _read(f, _CONTAINER)
+        r["content"], r["locked"] = _read_indices(f, n), bool(locked)
+    if flags & F_MATERIAL:
+        r["material"] = _read(f, _MATERIAL)
+    if flags & F_RANGED:
+        r["ranged"] = _read(f, _RANGED)
+    if flags & F_BEHAVIOR:
+        r["home"] = _read(f, _HOME)
+    return r
+
+def _check_records(game, records, player_index):
+    """Raises ValueError if the records can't be built with the current definitions."""
+    count = len(records)
+    if player_index >= count or records[player_index]["kind"] != K_PLAYER:
+        raise ValueError("Save has no player")
+    for r in records:
+        kind, archetype = r["kind"], r["archetype"]
+        if kind == K_MOB and archetype not in game.mob_protos:
+            raise ValueError(f"Mob '{archetype}' is no longer defined")
+        if kind in (K_GROUND, K_CARRIED) and archetype not in game.item_protos:
+            raise ValueError(f"Item '{archetype}' is no longer defined")
+        refs = [i for i, _ in r.get("worn", ())] + list(r.get("content", ()))
+        if any(i >= count or records[i]["kind"] != K_CARRIED for i in refs):
+            raise ValueError(f"'{archetype}' refers to an entity that isn't a carried item")
+
+def _build_entity(game, r):
+    """Creates the entity for a checked record and restores its component state."""
+    kind, archetype = r["kind"], r["archetype"]
+    place = r.get("place")
+    x, y = (place[2], place[3]) if place else (0, 0)
+
+    # 1. Bare entity from its factory (gear comes from the save, not a loadout)
+    if kind == K_PLAYER:
+        e = create_player(game, x, y, loadout_key=None)
+    elif kind == K_MOB:
+        e = create_mob(game, archetype, x, y, loadout=False)
+    elif kind == K_GROUND:
+        e = create_world_item(game, archetype, x, y)
+    else:
+        e = create_item(game, archetype, game.item_protos)
+    if e is None:
+        raise ValueError(f"Can't recreate '{archetype}'")
+
+    if place:
+        e.pos_x, e.pos_y = place[0], place[1]
+        e.physics.vx, e.physics.vy = place[4], place[5]
+
+    # 2. Component state, block by block
+    if "stats" in r:
+        e.stats.hp, e.stats.max_hp = r["stats"]
+    if "injury" in r:
+        blood, dead, n, wounds = r["injury"]
+        injury = getattr(e, 'injury', None)
+        if injury is not None and len(injury.hp) == n: # Same body plan as when saved
+            for i, hp, bleed in wounds:
+                injury.hp[i] = hp
+                injury.bleed[i] = bleed
+            injury._open = [i for i, _, bleed in wounds if bleed > 0]
+            injury.blood = blood
+            injury.dead = dead
+    for slot, tags in r.get("changed", ()):
+        e.body.set_slot_tags(slot, tags)
+    if "condition" in r:
+        e.item.condition = r["condition"]
+    if "count" in r:
+        e.stack.count = r["count"]
+    if "material" in r:
+        temperature, wetness, corrosion, integrity, _ = r["material"]
+        m = e.material
+        m.temperature, m.wetness, m.corrosion, m.integrity = temperature, wetness, corrosion, integrity
+        m.is_burning = False # The FireSystem sets it again once the entity is in the world
+    if "ranged" in r:
+        ammo, cooldown = r["ranged"]
+        e.ranged.current_ammo = ammo
+        e.ranged.next_shot = game.projectile_system.time + cooldown
+    if "home" in r:
+        e.control.home = r["home"]
+    return e
+
 def load_game_state(game):
     """
-    Reads the JSON file and reconstructs the Game object's state in-place.
-    Returns True if successful, False if failed.
+    Reads SAVE_FILE and rebuilds the world in-place.
+    Returns True if successful, False if failed (the current world is kept
+    if the file can't be read or no longer matches the definitions).
     """
     if not os.path.exists(SAVE_FILE):
         print("No save file found.")
         return False
-    
+
+    start = time.perf_counter()
     try:
-        with open(SAVE_FILE, 'r') as f:
-            data = json.load(f)
-
-        # 1. Restore Map
-        # We prefer the seed to regenerate the exact same map, 
-        # but we overwrite with the saved grid in case the map was modified (digging/destruction)
-        seed = data.get("seed", None)
-        game.map = Map(GRID_WIDTH, GRID_HEIGHT, seed=seed)
-        if "map_grid" in data:
-            game.map.grid = data["map_grid"]
-        
-        # 2. Reset Sprite Groups
-        game.all_sprites = pygame.sprite.Group()
-        game.mobs = pygame.sprite.Group()
-
-        # 3. Restore Player
-        p_data = data["player"]
-        # We explicitly pass X and Y to prevent the factory from auto-spawning
-        game.player = create_player(game, game.item_defs, x=p_data["x"], y=p_data["y"])
-        
-        # Restore Stats
-        game.player.stats.hp = p_data["hp"]
-        game.player.stats.equipment = p_data["equipment"]
-        
-        game.all_sprites.add(game.player)
-
-        # 4. Restore Mobs
-        for m_data in data["mobs"]:
-            m = create_mob(game, x=m_data["x"], y=m_data["y"])
-            m.stats.hp = m_data["hp"]
-            game.all_sprites.add(m)
-            game.mobs.add(m)
-
-        # 5. Re-Initialize Systems
-        # The Inventory UI must be relinked to the new Player entity
-        game.combat_system = CombatSystem()
-
-        print("Game Loaded Successfully!")
-        return True
-        
+        # 1. Decode and check everything; the running world is untouched
+        with open(SAVE_FILE, 'rb') as f:
+            # Header (refuse anything we can't read rather than guess)
+            magic, version, _ = _read(f, _HEADER)
+            if magic != MAGIC:
+                raise ValueError("Not a save file")
+            if version != SAVE_VERSION:
+                raise ValueError(f"Save version {version} is not supported (expected {SAVE_VERSION})")
+            seed, = _read(f, _U16)
+            sim_time, count, player_index = _read(f, _META)
+            strings = []
+            for _ in range(_read(f, _U32)[0]):
+                strings.append(_read_bytes(f, _read(f, _U16)[0]).decode('utf-8'))
+
+            grid, width, height = _read_grid(f)
+            weather = _read_weather(f)
+            fire = _read_fire(f)
+            records = [_read_record(f, strings) for _ in range(count)]
+        _check_records(game, records, player_index)
+        if fire is not None and fire[0].shape != (height, width):
+            raise ValueError("Fire state doesn't match the map size")
     except Exception as e:
         print(f"Error loading save: {e}")
-        # Consider printing full traceback here for debugging
-        import traceback
         traceback.print_exc()
-        return False
\ No newline at end of file
+        return False
+
+    try:
+        # 2. Map: the saved tiles, no regeneration
+        game.map = Map(width, height, seed=strings[seed], grid=grid)
+
+        # 3. The clock first (lazy material state counts from it), then
+        # fresh systems, with the weather back where it was
+        game.scheduler.time = sim_time
+        game.reset_world()
+        if weather is not None and game.weather is not None:
+            game.weather.restore(*weather)
+        if fire is not None and game.fire_system is not None:
+            game.fire_system.restore(*fire)
+
+        # 4. Entities
+        entities = [_build_entity(game, r) for r in records]
+
+        # 5. Hierarchy: fill bags before locking them, dress bodies, then
+        # enter the world (material state moves into the system's arrays)
+        for r, e in zip(records, entities):
+            if "content" in r:
+                for i in r["content"]:
+                    e.container.restore(entities[i])
+                e.container.is_locked = r["locked"]
+            for i, parts in r.get("worn", ()):
+                e.body._occupy(entities[i], parts)
+        for r, e in zip(records, entities):
+            kind = r["kind"]
+            if kind == K_CARRIED:
+                continue
+            e.refresh_visuals()
+            game.all_sprites.add(e)
+            if kind == K_MOB:
+                game.mobs.add(e)
+            if getattr(e, 'injury', None) is not None:
+                game.injury_system.track(e) # Open wounds keep bleeding
+            material = r.get("material")
+            if material and material[4] and game.fire_system is not None:
+                game.fire_system.ignite_entity(e)
+        game.player = entities[player_index]
+
+    except Exception as e:
+        # Checked above, so this is a bug rather than a bad file
+        print(f"Error loading save: {e}")
+        traceback.print_exc()
+        return False
+
+    elapsed = (time.perf_counter() - start) * 1000
+    logger.info(f"Loaded {count} entities in {elapsed:.1f} ms.")
+    print("Game Loaded Successfully!")
+    return True
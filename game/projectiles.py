@@ -0,0 +1,332 @@
+import math
+import random
+import logging
+
+import numpy as np
+import pygame
+
+from game.deebee import (
+    TILESIZE,
+    TILES_PER_METER,
+    METERS_PER_TILE,
+    GRAVITY,
+    PROJECTILE_CAPACITY,
+    PROJECTILE_LAUNCH_HEIGHT,
+    PROJECTILE_TARGET_HEIGHT,
+    PROJECTILE_ENTITY_HEIGHT,
+    PROJECTILE_HIT_RADIUS,
+    PROJECTILE_SPREAD,
+    PROJECTILE_IMPACT_NOISE,
+    PROJECTILE_MAX_FLIGHT_S,
+)
+
+logger = logging.getLogger(__name__)
+
+G_TILES = GRAVITY * TILES_PER_METER # tiles / s^2
+
+# Per-step outcomes
+HIT_NONE, HIT_WALL, HIT_GROUND, HIT_ENTITY = range(4)
+
+
+class ProjectileSystem:
+    """
+    Every arrow and bullet in flight lives in one slot of preallocated NumPy
+    arrays (structure of arrays), and the whole batch is integrated together:
+    quadratic drag plus gravity, wall hits by a DDA walk of the map grid run
+    in lockstep for all projectiles, creature hits through the spatial hash.
+    Python only loops over the handful of projectiles that hit something.
+
+    Positions are in tiles (x, y on the map, z above the ground), matching
+    PhysicsComponent. Firing makes noise through the PerceptionSystem and
+    hits are published on the bus as "projectile_hit". Incendiary shots
+    (fire arrows, flares) set their impact point alight through the FireSystem.
+    """
+    def __init__(self, spatial, capacity=PROJECTILE_CAPACITY):
+        self.spatial = spatial
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))  # tiles
+        self.vel = np.zeros((capacity, 2))  # tiles / s
+        self.z = np.zeros(capacity)         # height above ground, tiles
+        self.vz = np.zeros(capacity)
+        self.drag = np.zeros(capacity)      # per tile
+        self.damage = np.zeros(capacity)
+        self.incendiary = np.zeros(capacity, dtype=bool)
+        self.age = np.zeros(capacity)
+        self.owner_id = np.zeros(capacity, dtype=np.int64) # id() of the shooter, never hits itself
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.owner = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+
+        self.time = 0.0
+        self.blocked = None # bool grid [y, x] of the map it was built from
+        self._map = None
+        self.fired = self.hits = self.dropped = 0
+        logger.info("ProjectileSystem initialized.")
+
+    def in_flight(self) -> int:
+        return self.capacity - len(self._free)
+
+    def set_map(self, game_map):
+        self._map = game_map
+        self.blocked = np.array(game_map.grid, dtype=bool)
+
+    # --- FIRING ---
+
+    def fire(self, game, owner, ranged, tx, ty) -> bool:
+        """
+        'owner' shoots its RangedComponent at tile (tx, ty) if the weapon is
+        ready and the target is in range. Aims on a flat trajectory that
+        ignores drag (long shots fall a little short, as they should).
+        """
+        if self.time < ranged.next_shot:
+            return False
+        ox, oy = owner.physics.x + 0.5, owner.physics.y + 0.5 # Tile centers
+        tx, ty = tx + 0.5, ty + 0.5
+        dist = math.hypot(tx - ox, ty - oy)
+        if dist <= 0 or dist > ranged.range * TILES_PER_METER:
+            return False
+        if not self._free:
+            self.dropped += 1
+            return False
+
+        # Weapon cycles (or reloads when the clip runs dry)
+        ranged.current_ammo -= 1
+        if ranged.current_ammo <= 0:
+            ranged.current_ammo = ranged.clip_size
+            ranged.next_shot = self.time + ranged.reload_s
+        else:
+            ranged.next_shot = self.time + ranged.cycle_s
+
+        speed = ranged.speed_mps * TILES_PER_METER
+        angle = math.atan2(ty - oy, tx - ox) + math.radians(random.gauss(0.0, PROJECTILE_SPREAD))
+        t = dist / speed
+        z0 = PROJECTILE_LAUNCH_HEIGHT * TILES_PER_METER
+        zt = PROJECTILE_TARGET_HEIGHT * TILES_PER_METER
+
+        i = self._free.pop()
+        self.pos[i] = (ox, oy)
+        self.vel[i] = (math.cos(angle) * speed, math.sin(angle) * speed)
+        self.z[i] = z0
+        self.vz[i] = (zt - z0 + 0.5 * G_TILES * t * t) / t
+        self.drag[i] = ranged.drag * METERS_PER_TILE
+        self.damage[i] = ranged.damage
+        self.incendiary[i] = ranged.incendiary
+        self.age[i] = 0.0
+        self.owner_id[i] = id(owner)
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.fired += 1
+
+        perception = getattr(game, 'perception_system', None)
+        if perception is not None:
+            perception.emit_noise(ox, oy, ranged.noise_radius)
+        return True
+
+    # --- SIMULATION ---
+
+    def update(self, game, dt):
+        self.time += dt
+        if game.map is not self._map:
+            self.set_map(game.map)
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return
+
+        # 1. Integrate: implicit quadratic drag (stable at any dt), then gravity
+        p0, v = self.pos[idx], self.vel[idx]
+        z0, vz = self.z[idx], self.vz[idx]
+        speed = np.sqrt(v[:, 0] ** 2 + v[:, 1] ** 2 + vz ** 2)
+        damp = 1.0 / (1.0 + self.drag[idx] * speed * dt)
+        v = v * damp[:, None]
+        vz = vz * damp - G_TILES * dt
+        p1 = p0 + v * dt
+        z1 = z0 + vz * dt
+
+        # 2. Earliest event along each segment, as a fraction t of the step
+        t_hit = np.full(idx.size, np.inf)
+        kind = np.full(idx.size, HIT_NONE)
+
+        t_wall = self._dda(p0, p1)
+        wall = t_wall < t_hit
+        t_hit[wall], kind[wall] = t_wall[wall], HIT_WALL
+
+        falling = z1 <= 0.0
+        t_ground = np.full(idx.size, np.inf)
+        t_ground[falling] = z0[falling] / (z0[falling] - z1[falling])
+        ground = t_ground < t_hit
+        t_hit[ground], kind[ground] = t_ground[ground], HIT_GROUND
+
+        t_ent, targets = self._entity_hits(idx, p0, p1, z0, z1)
+        ent = t_ent < t_hit
+        t_hit[ent], kind[ent] = t_ent[ent], HIT_ENTITY
+
+        # 3. Write back survivors
+        self.pos[idx], self.vel[idx] = p1, v
+        self.z[idx], self.vz[idx] = z1, vz
+        self.age[idx] += dt
+        expired = self.age[idx] > PROJECTILE_MAX_FLIGHT_S
+
+        # 4. Resolve the few that stopped this step
+        done = np.flatnonzero((kind != HIT_NONE) | expired)
+        for j in done:
+            i = idx[j]
+            t = min(t_hit[j], 1.0)
+            x, y = p0[j] + (p1[j] - p0[j]) * t
+            if kind[j] == HIT_ENTITY:
+                self._strike(game, targets[j], i)
+            elif kind[j] != HIT_NONE:
+                perception = getattr(game, 'perception_system', None)
+                if perception is not None:
+                    perception.emit_noise(x, y, PROJECTILE_IMPACT_NOISE)
+            if self.incendiary[i] and kind[j] != HIT_NONE:
+                # Just short of the impact, so a wall hit lights the tile in front of it
+                bx, by = p0[j] + (p1[j] - p0[j]) * max(t - 1e-3, 0.0)
+                self._ignite(game, int(bx), int(by), targets[j] if kind[j] == HIT_ENTITY else None)
+            self._release(i)
+
+    def _dda(self, p0, p1):
+        """
+        Grid traversal (Amanatides & Woo) of every segment at once. Each pass
+        steps all still-walking projectiles into their next tile, so the loop
+        runs as many times as the longest segment crosses tiles, not once per
+        projectile. Returns t of the first wall entered (inf for none).
+        Off-map counts as wall.
+        """
+        blocked = self.blocked
+        h, w = blocked.shape
+        n = len(p0)
+        d = p1 - p0
+        cx = np.floor(p0[:, 0]).astype(np.int64)
+        cy = np.floor(p0[:, 1]).astype(np.int64)
+        step_x = np.where(d[:, 0] > 0, 1, -1)
+        step_y = np.where(d[:, 1] > 0, 1, -1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_x = np.where(d[:, 0] != 0, 1.0 / d[:, 0], np.inf)
+            inv_y = np.where(d[:, 1] != 0, 1.0 / d[:, 1], np.inf)
+            t_max_x = np.where(d[:, 0] != 0, (np.where(d[:, 0] > 0, cx + 1, cx) - p0[:, 0]) * inv_x, np.inf)
+            t_max_y = np.where(d[:, 1] != 0, (np.where(d[:, 1] > 0, cy + 1, cy) - p0[:, 1]) * inv_y, np.inf)
+        t_delta_x, t_delta_y = np.abs(inv_x), np.abs(inv_y)
+
+        t_hit = np.full(n, np.inf)
+        walking = np.arange(n)
+        max_steps = int(np.abs(d).sum(axis=1).max()) + 2
+        for _ in range(max_steps):
+            if not walking.size:
+                break
+            tx, ty = t_max_x[walking], t_max_y[walking]
+            use_x = tx < ty
+            t = np.where(use_x, tx, ty)
+            go = t <= 1.0
+            walking, use_x, t = walking[go], use_x[go], t[go]
+
+            wx, wy = walking[use_x], walking[~use_x]
+            cx[wx] += step_x[wx]
+            t_max_x[wx] += t_delta_x[wx]
+            cy[wy] += step_y[wy]
+            t_max_y[wy] += t_delta_y[wy]
+
+            x, y = cx[walking], cy[walking]
+            inside = (x >= 0) & (x < w) & (y >= 0) & (y < h)
+            solid = ~inside
+            solid[inside] = blocked[y[inside], x[inside]]
+            t_hit[walking[solid]] = t[solid]
+            walking = walking[~solid]
+        return t_hit
+
+    def _entity_hits(self, idx, p0, p1, z0, z1):
+        """
+        Closest creature each segment passes within PROJECTILE_HIT_RADIUS of,
+        low enough to strike it. Projectiles are grouped by the spatial-hash
+        cells their segment covers, so empty cells cost one bucket lookup.
+        """
+        n = idx.size
+        t_hit = np.full(n, np.inf)
+        targets = [None] * n
+
+        ct = self.spatial.cell_tiles
+        r = PROJECTILE_HIT_RADIUS
+        lo = np.floor((np.minimum(p0, p1) - 1.0 - r) / ct).astype(np.int64) # Entity pos is its top-left
+        hi = np.floor((np.maximum(p0, p1) + r) / ct).astype(np.int64)
+        boxes = np.concatenate([lo, hi], axis=1)
+        keys, group = np.unique(boxes, axis=0, return_inverse=True)
+        group = group.reshape(-1)
+
+        max_z = PROJECTILE_ENTITY_HEIGHT * TILES_PER_METER
+        for g, (cx0, cy0, cx1, cy1) in enumerate(keys):
+            ents = [e for e in self.spatial.in_cells(cx0, cy0, cx1, cy1)
+                    if getattr(e, 'stats', None) is not None]
+            if not ents:
+                continue
+            rows = np.flatnonzero(group == g)
+            centers = np.array([(e.pos_x / TILESIZE + 0.5, e.pos_y / TILESIZE + 0.5) for e in ents])
+            ids = np.array([id(e) for e in ents], dtype=np.int64)
+
+            a, d = p0[rows], p1[rows] - p0[rows]                      # (P, 2)
+            rel = centers[None, :, :] - a[:, None, :]                 # (P, E, 2)
+            dd = np.maximum((d * d).sum(axis=1), 1e-12)[:, None]
+            t = np.clip((rel * d[:, None, :]).sum(axis=2) / dd, 0.0, 1.0)
+            gap = rel - t[:, :, None] * d[:, None, :]
+            near = (gap * gap).sum(axis=2) <= r * r
+            z_at = z0[rows][:, None] + (z1[rows] - z0[rows])[:, None] * t
+            ok = near & (z_at < max_z) & (ids[None, :] != self.owner_id[idx[rows]][:, None])
+            t = np.where(ok, t, np.inf)
+
+            best = t.argmin(axis=1)
+            best_t = t[np.arange(rows.size), best]
+            for k in np.flatnonzero(np.isfinite(best_t)):
+                t_hit[rows[k]] = best_t[k]
+                targets[rows[k]] = ents[best[k]]
+        return t_hit, targets
+
+    def _strike(self, game, target, i):
+        if not target.alive():
+            return # Killed by an earlier hit this step, the shot is spent on the body
+        damage = float(self.damage[i])
+        owner = self.owner[i]
+        self.hits += 1
+
+        stats = getattr(target, 'stats', None)
+        if stats is not None:
+            stats.hp -= damage
+        injury = getattr(target, 'injury', None)
+        injury_system = getattr(game, 'injury_system', None)
+        if injury is not None and injury_system is not None:
+            injury_system.hit(target, damage)
+        logger.debug(f"Projectile hit {target} for {damage}")
+
+        if game.bus:
+            game.bus.emit("projectile_hit", {"target": target, "owner": owner, "damage": damage})
+        dead = (stats is not None and stats.hp <= 0) or (injury is not None and injury.dead)
+        if dead and target is not game.player:
+            target.despawn()
+
+    def _ignite(self, game, x, y, target):
+        fire = getattr(game, 'fire_system', None)
+        if fire is None:
+            return
+        if target is not None and target.alive() and getattr(target, 'material', None) is not None:
+            fire.ignite_entity(target)
+        fire.ignite(x, y) # Creatures burn by standing in it
+
+    def _release(self, i):
+        self.alive[i] = False
+        self.owner[i] = None
+        self.owner_id[i] = 0
+        self._free.append(i)
+
+    def clear(self):
+        for i in np.flatnonzero(self.alive):
+            self._release(i)
+
+    # --- RENDERING ---
+
+    def draw(self, surface, color=(230, 230, 200)):
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return
+        # Short streak behind each projectile, in pixels
+        head = self.pos[idx] * TILESIZE
+        speed = np.maximum(np.hypot(self.vel[idx, 0], self.vel[idx, 1]), 1e-6)
+        tail = head - self.vel[idx] / speed[:, None] * (TILESIZE * 0.75)
+        for (hx, hy), (tx, ty) in zip(head.tolist(), tail.tolist()):
+            pygame.draw.line(surface, color, (tx, ty), (hx, hy), 1)
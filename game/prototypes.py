@@ -0,0 +1,213 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from engine.base_entity import Entity
+from engine.tags import tag_bit, tag_mask
+from game import deebee as db
+from game.components import (
+    VisualComponent,
+    PhysicsComponent,
+    StatsComponent,
+    BodyComponent,
+    BodyTemplate,
+    ItemComponent,
+    WearableComponent,
+    ContainerComponent,
+    StackableComponent,
+    RangedComponent,
+    MaterialComponent,
+    T_CONTAINER,
+)
+
+from game.ai import BehaviorControlComponent, BehaviorError, CompiledBehavior, compile_behavior
+from game.perception import PerceptionComponent
+from game.injury import InjuryComponent, PartTable
+
+logger = logging.getLogger(__name__)
+
+# --- PROTOTYPES ---
+# The JSON definitions are compiled ONCE at load into these objects.
+# Every field is validated and resolved up front, so spawning is a straight
+# copy of ready-made values instead of a pile of dict.get() calls.
+
+class ItemPrototype:
+    """Validated, pre-resolved item definition."""
+    def __init__(self, item_id: str, data: dict, material_table=None):
+        self.item_id = item_id
+        self.name = data.get("name", "Unknown")
+        self.weight = float(data.get("weight", 0.1))
+        self.volume = float(data.get("volume", 0.1))
+        self.value = data.get("value", 0)
+        self.material = data.get("material", None)
+        # Decay type resolved now, so stored items can decay without the table
+        self.decay = 0
+        if self.material is not None and material_table is not None:
+            self.decay = int(material_table.decay[material_table.lookup(self.material)])
+        self.tags: Tuple[str, ...] = tuple(data.get("tags", []))
+        self.tag_mask = tag_mask(self.tags)
+        self.ammo_type: Optional[str] = data.get("ammo_type")
+
+        # Wearable: default layer to 1 (Outer) if unspecified but slots exist
+        self.slots: Tuple[str, ...] = tuple(data.get("slots", []))
+        self.slot_bits: Tuple[int, ...] = tuple(tag_bit(t) for t in self.slots)
+        layer = data.get("layer", None)
+        self.is_wearable = bool(self.slots) or layer is not None
+        self.layer = 1 if layer is None else layer
+        self.warmth = data.get("warmth", 0)
+        self.stealth_penalty = data.get("stealth_penalty", 0)
+
+        # Container
+        self.is_container = bool(self.tag_mask & T_CONTAINER) or "container_capacity" in data
+        self.container_capacity = data.get("container_capacity", 10)
+        self.container_weight = data.get("container_weight", db.CONTAINER_MAX_WEIGHT)
+
+        # Stackable: one entity stands for up to max_stack identical items
+        self.max_stack = int(data.get("max_stack", 1))
+
+        # Ranged weapon: kwargs for RangedComponent, checked here rather than at spawn
+        self.ranged: Optional[dict] = dict(data["ranged"]) if "ranged" in data else None
+        if self.ranged is not None:
+            RangedComponent(**self.ranged)
+
+    def instantiate(self, game) -> Entity:
+        """Builds a fresh entity for this item (no pooling, see create_item)."""
+        e = Entity(game)
+        e.item = ItemComponent(
+            name=self.name,
+            weight=self.weight,
+            volume=self.volume,
+            value=self.value,
+            material=self.material,
+            item_id=self.item_id,
+            tags=self.tags,
+            ammo_type=self.ammo_type,
+            tag_mask_=self.tag_mask
+        )
+        if self.is_wearable:
+            # Slots list is shared: WearableComponent never mutates it
+            e.wearable = WearableComponent(layer=self.layer, slots=self.slots, slot_bits=self.slot_bits,
+                                           warmth=self.warmth, stealth_penalty=self.stealth_penalty)
+        if self.is_container:
+            e.container = ContainerComponent(capacity_vol=self.container_capacity,
+                                             capacity_weight=self.container_weight, owner=e)
+        if self.max_stack > 1:
+            e.stack = StackableComponent(count=1, max_stack=self.max_stack)
+        if self.ranged is not None:
+            e.ranged = RangedComponent(**self.ranged)
+        if self.material is not None:
+            e.material = MaterialComponent(self.material, self.weight, decay=self.decay,
+                                           clock=getattr(game, "scheduler", None))
+        return e
+
+
+# Used when a mob's body plan (and 'humanoid') can't be found at all
+FALLBACK_BODY = BodyTemplate("humanoid", [{"name": "chest", "tags": ["torso", "wear"]}])
+
+class MobPrototype:
+    """
+    Validated, pre-resolved mob definition with its gear looked up.
+    The body plan is only checked to exist here; its template and injury
+    table are fetched from the (lazy) body plan tables on first spawn.
+    """
+    def __init__(self, mob_id: str, data: dict, body_key: str, loadout: List[ItemPrototype],
+                 behavior: CompiledBehavior, body_templates=None, part_tables=None):
+        self.mob_id = mob_id
+        self.name = data.get("name", mob_id)
+        self.hp = data.get("hp", 10)
+        self.speed = float(data.get("speed", 1.0))
+        self.color = pygame.Color(*data.get("color", [255, 0, 0]))
+        self.behavior = behavior
+        self.sight = float(data.get("sight", 10))
+        self.hearing = float(data.get("hearing", 1.0))
+        self.body_key = body_key
+        self._templates = body_templates
+        self._part_tables = part_tables
+        self.loadout: Tuple[ItemPrototype, ...] = tuple(loadout)
+
+    @property
+    def body(self) -> BodyTemplate:
+        template = self._templates.get(self.body_key) if self._templates is not None else None
+        return template if template is not None else FALLBACK_BODY
+
+    @property
+    def parts(self) -> Optional[PartTable]:
+        """Per-species injury table, shared."""
+        if self._part_tables is None:
+            return None
+        return self._part_tables.get(self.body_key)
+
+    def instantiate(self, game, x, y) -> Entity:
+        """Builds a fresh mob entity (no pooling or gear, see create_mob)."""
+        e = Entity(game, x, y)
+        e.visual = VisualComponent(self.color)
+        e.physics = PhysicsComponent(x, y, speed_mps=self.speed)
+        e.control = BehaviorControlComponent(self.behavior)
+        e.perception = PerceptionComponent(sight=self.sight, hearing=self.hearing)
+        e.stats = StatsComponent(hp=self.hp, max_hp=self.hp, equipment={
+            "weapon": {"name": "Natural", "atk": 1}, # Fallback
+            "armor": {"name": "Skin", "def": 0}
+        })
+        e.body = BodyComponent(self.body)
+        if self.parts is not None:
+            e.injury = InjuryComponent(self.parts)
+        return e
+
+# --- COMPILERS ---
+
+def compile_items(item_defs: dict, material_table=None) -> Dict[str, ItemPrototype]:
+    protos = {}
+    for item_id, data in item_defs.items():
+        try:
+            protos[item_id] = ItemPrototype(item_id, data, material_table)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Item '{item_id}' is malformed ({e}). Skipped.")
+    logger.info(f"Compiled {len(protos)} item prototypes.")
+    return protos
+
+def compile_mobs(mob_defs: dict, body_templates: Dict[str, BodyTemplate],
+                 item_protos: Dict[str, ItemPrototype],
+                 part_tables: Optional[Dict[str, PartTable]] = None) -> Dict[str, MobPrototype]:
+    """
+    Checks each mob's body plan, resolves its loadout against the compiled
+    items and compiles its AI definition (see game/ai.py). Body templates
+    and injury tables may be lazy (BodyPlanRegistry views); they are only
+    looked up when the mob first spawns.
+    Unknown body plans fall back to 'humanoid'; unknown items are dropped.
+    """
+    protos = {}
+    for mob_id, data in mob_defs.items():
+        bp_key = data.get("body_plan", "humanoid")
+        if bp_key not in body_templates:
+            logger.warning(f"Mob '{mob_id}' uses unknown body plan '{bp_key}'. Using humanoid.")
+            bp_key = "humanoid"
+
+        loadout = []
+        for item_id in data.get("loadout", []):
+            proto = item_protos.get(item_id)
+            if proto is None:
+                logger.warning(f"Mob '{mob_id}' loadout contains unknown item '{item_id}'. Removed.")
+                continue
+            loadout.append(proto)
+
+        try:
+            behavior = compile_behavior(mob_id, data.get("ai"))
+        except BehaviorError as e:
+            logger.error(f"Bad AI definition {e}. Using player_chase.")
+            behavior = compile_behavior(mob_id, "player_chase")
+
+        try:
+            protos[mob_id] = MobPrototype(mob_id, data, bp_key, loadout, behavior,
+                                          body_templates, part_tables)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Mob '{mob_id}' is malformed ({e}). Skipped.")
+    logger.info(f"Compiled {len(protos)} mob prototypes.")
+    return protos
+
+def get_item_prototype(item_id: str, definitions: dict) -> Optional[ItemPrototype]:
+    """Accepts either compiled prototypes or raw item dicts (compiled on the fly)."""
+    data = definitions.get(item_id)
+    if data is None or isinstance(data, ItemPrototype):
+        return data
+    return ItemPrototype(item_id, data)
@@ -6,11 +6,12 @@ import logging
 from engine.events import GameState
 from engine import colors as cn
 # IMPORT THE NEW UI ELEMENTS
-from engine.ui import Label, Button, VBox, InputBox 
+from engine.ui import Label, Button, VBox, InputBox, ListView, ListModel, get_font
 
 from game.deebee import *
-from game.components import PhysicsComponent, PickupComponent, VisualComponent
-from game.systems import attempt_stash_item
+from game import deebee as db # Window size is read from settings on first use
+from game.components import PhysicsComponent, PickupComponent, VisualComponent, item_weight
+from game.systems import attempt_stash_item, consume_item, reload_weapon
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +30,15 @@ class MainMenuState(GameState):
     def __init__(self, game):
         super().__init__(game)
         logger.info("MainMenuState initialized.")
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_font("arial", 24)
         
         # 1. Title Label
-        self.title = Label(50, 50, TITLE, pygame.font.SysFont("arial", 60, bold=True))
+        self.title = Label(50, 50, TITLE, get_font("arial", 60, bold=True))
         
         # 2. Menu Container (VBox)
         # Center X, Center Y roughly
-        cx = WIDTH // 2 - 100
-        cy = HEIGHT // 2
+        cx = db.WIDTH // 2 - 100
+        cy = db.HEIGHT // 2
         self.menu_box = VBox(cx, cy, 200, padding=10)
         
         # 3. Add Buttons
@@ -71,10 +72,10 @@ class MainMenuState(GameState):
 class PauseState(GameState):
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_font("arial", 24)
         
-        cx = WIDTH // 2 - 100
-        cy = HEIGHT // 2 - 100
+        cx = db.WIDTH // 2 - 100
+        cy = db.HEIGHT // 2 - 100
         
         # Container
         self.menu_box = VBox(cx, cy, 200, padding=10)
@@ -93,7 +94,7 @@ class PauseState(GameState):
 
     def draw(self, screen):
         # Overlay logic
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay = pygame.Surface((db.WIDTH, db.HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
         screen.blit(overlay, (0, 0))
         
@@ -110,10 +111,10 @@ class PauseState(GameState):
 class SeedInputState(GameState):
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_font("arial", 24)
         
-        cx = WIDTH // 2 - 150
-        cy = HEIGHT // 2
+        cx = db.WIDTH // 2 - 150
+        cy = db.HEIGHT // 2
         
         self.label = Label(cx, cy - 40, "Enter Map Seed:", self.font)
         self.input_box = InputBox(cx, cy, 300, 40, self.font)
@@ -135,7 +136,7 @@ class SeedInputState(GameState):
 
     def draw(self, screen):
         # Darken background
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay = pygame.Surface((db.WIDTH, db.HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 200))
         screen.blit(overlay, (0, 0))
         
@@ -143,10 +144,7 @@ class SeedInputState(GameState):
         self.input_box.draw(screen)
 
 
-# --- 4. ROAMING & GAMEPLAY (Unchanged UI logic for now) ---
-# Note: InventoryState is complex data-binding. 
-# TODO:For now, it is okay to keep the specialized render logic in InventoryState 
-# until we build a "DataGrid" or "ListView" widget in engine/ui.py.
+# --- 4. ROAMING & GAMEPLAY ---
 
 class RoamingState(GameState):
     def __init__(self, game):
@@ -158,61 +156,71 @@ class RoamingState(GameState):
             self.game.state_machine.push(PauseState(self.game))
         elif input_mgr.is_just_pressed("INVENTORY"):
             self.game.state_machine.push(InventoryState(self.game))
+
+        # Quick actions, resolved through the player's inventory index
+        player = self.game.player
+        if player:
+            if input_mgr.is_just_pressed("RELOAD"):
+                print(f"Reloaded {reload_weapon(player)} rounds.")
+            elif input_mgr.is_just_pressed("EAT"):
+                name = consume_item(self.game, player, "food")
+                print(f"You eat the {name}." if name else "Nothing to eat.")
+            elif input_mgr.is_just_pressed("QUAFF"):
+                name = consume_item(self.game, player, "drink")
+                print(f"You drink the {name}." if name else "Nothing to drink.")
         
         # 2. Player Movement
         # We can pass the input manager directly to the player control component
         if self.game.player and hasattr(self.game.player, 'control'):
             self.game.player.control.update(self.game.player, self.game, input_mgr)
     def update(self):
-        if self.game.all_sprites:
-            self.game.all_sprites.update(self.game.dt)
-        if self.game.combat_system:
-            self.game.combat_system.update(self.game.player, self.game.mobs)
+        # Entities, combat, materials... (see Game.scheduler for order and rates)
+        self.game.scheduler.update(self.game.dt)
 
     def draw(self, screen):
         screen.fill(self.game.c.get('BG_COLOR', cn.get("BLACK")))
         self.game.draw_grid()
+        if self.game.fire_system:
+            self.game.fire_system.draw(screen) # Ground level, under the sprites
         if self.game.all_sprites:
             self.game.all_sprites.draw(screen)
+        if self.game.projectile_system:
+            self.game.projectile_system.draw(screen)
         if self.game.player:
             self.game.hud.draw(screen, self.game.player)
 
 
-# --- 5. LEGACY STATES (Inventory / Pickup) ---
-# These are preserved as-is from the previous step because they require 
-# highly specific rendering (item lists, status bars) that generic buttons 
-# don't handle well yet without a more advanced "ListView" widget.
+# --- 5. INVENTORY & PICKUP ---
+# The inventory is a ListView over a ListModel of rows: section headers
+# (str) and (entity, where) pairs. Actions edit the model row by row, so
+# nothing is rebuilt or rescanned after equipping or dropping something.
+
+INVENTORY_SECTIONS = ("WORN", "CARRIED", "NEARBY")
 
 class InventoryState(GameState):
-    # ... (Keep the exact code from the previous response for InventoryState) ...
     def __init__(self, game):
         super().__init__(game)
-        self.font_main = pygame.font.SysFont("arial", 16)
-        self.font_header = pygame.font.SysFont("arial", 18, bold=True)
-        self.font_status = pygame.font.SysFont("consolas", 14)
+        self.font_main = get_font("arial", 16)
+        self.font_header = get_font("arial", 18, bold=True)
+        self.font_status = get_font("consolas", 14)
         
         self.current_container = None 
-        self.selection_index = 0
-        self.visible_items = []
+        self.model = ListModel()
+        self.list_view = ListView(0, 90, db.WIDTH, db.HEIGHT - 90 - 30, self.model, self._render_row,
+                                  selectable=lambda row: not isinstance(row, str))
 
     def enter(self):
-        self.rebuild_list()
-        self.selection_index = 0
         self.current_container = None
+        self.rebuild_list()
 
     def rebuild_list(self):
-        # ... (Same logic as before) ...
+        """Full rebuild; only on entering the screen or a container."""
         player = self.game.player
         if self.current_container:
-            if hasattr(self.current_container, 'container') and self.current_container.container:
-                 self.visible_items = list(reversed(self.current_container.container.items))
-            else:
-                 self.visible_items = []
-            if self.visible_items: self.selection_index %= len(self.visible_items)
-            else: self.selection_index = 0
+            content = self.current_container.container.content
+            self.model.reset([(item, None) for item in reversed(content)])
             return
 
-        self.visible_items = []
         worn, carried, nearby = [], [], []
         body = player.body
         seen = set()
@@ -221,82 +229,119 @@ class InventoryState(GameState):
             item = body.slots.get(slot)
             if item and item not in seen:
                 seen.add(item)
-                tags = body.slot_defs.get(slot, [])
-                if "grasp" in tags or "hold" in tags: carried.append((item, slot))
+                if item in body.grasped: carried.append((item, slot))
                 else: worn.append((item, slot))
 
+        # Items on the ground around the player (spatial hash, not a world scan)
         px, py = (int(player.physics.x), int(player.physics.y)) if player.physics else (0,0)
-        for sprite in self.game.all_sprites:
-            if sprite != player and hasattr(sprite, 'item') and sprite.item and hasattr(sprite, 'physics') and sprite.physics:
-                if not sprite.item.is_equipped:
-                    if abs(int(sprite.physics.x) - px) <= 1 and abs(int(sprite.physics.y) - py) <= 1:
-                        nearby.append(sprite)
+        if self.game.spatial:
+            for sprite in self.game.spatial.query_radius(px, py, 1.5):
+                if sprite != player and getattr(sprite, 'item', None) and getattr(sprite, 'physics', None):
+                    if not sprite.item.is_equipped:
+                        if abs(int(sprite.physics.x) - px) <= 1 and abs(int(sprite.physics.y) - py) <= 1:
+                            nearby.append((sprite, "Ground"))
         
         carried.sort(key=lambda x: x[0].item.name)
-        if worn: self.visible_items.append("WORN"); self.visible_items.extend(worn)
-        if carried: self.visible_items.append("CARRIED"); self.visible_items.extend(carried)
-        if nearby: self.visible_items.append("NEARBY"); self.visible_items.extend([(x, "Ground") for x in nearby])
-
-        if not self.visible_items: self.selection_index = 0
-        elif self.selection_index >= len(self.visible_items): self.selection_index = len(self.visible_items) - 1
+        rows = []
+        for header, section in zip(INVENTORY_SECTIONS, (worn, carried, nearby)):
+            if section: rows.append(header); rows.extend(section)
+        self.model.reset(rows)
+
+    # --- INCREMENTAL MODEL EDITS ---
+
+    def _find_row(self, entity):
+        for i, row in enumerate(self.model.rows):
+            if not isinstance(row, str) and row[0] is entity:
+                return i
+        return -1
+
+    def _remove_row(self, entity):
+        i = self._find_row(entity)
+        if i < 0: return
+        self.model.remove(i)
+        # Drop the section header if that was its last row
+        rows = self.model.rows
+        if i > 0 and isinstance(rows[i - 1], str) and (i == len(rows) or isinstance(rows[i], str)):
+            self.model.remove(i - 1)
+
+    def _add_row(self, section, row):
+        rows = self.model.rows
+        if section not in rows:
+            # New header goes before the first section that comes after it
+            later = INVENTORY_SECTIONS[INVENTORY_SECTIONS.index(section) + 1:]
+            at = next((i for i, r in enumerate(rows) if r in later), len(rows))
+            self.model.insert(at, section)
+        start = rows.index(section) + 1
+        end = next((i for i in range(start, len(rows)) if isinstance(rows[i], str)), len(rows))
+        at = end
+        if section == "CARRIED": # Kept sorted by name
+            at = next((i for i in range(start, end) if rows[i][0].item.name > row[0].item.name), end)
+        self.model.insert(at, row)
+
+    def _placed(self, entity):
+        """Where the body put an item: ('WORN'|'CARRIED', first slot)."""
+        body = self.game.player.body
+        slot = next((s for s in body.slot_order if body.slots.get(s) is entity), None)
+        return ("CARRIED" if entity in body.grasped else "WORN"), slot
+
+    # --- INPUT ---
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_i:
                 self.game.state_machine.pop()
-            elif event.key == pygame.K_UP: self._move(-1)
-            elif event.key == pygame.K_DOWN: self._move(1)
+            elif event.key == pygame.K_UP: self.list_view.move(-1)
+            elif event.key == pygame.K_DOWN: self.list_view.move(1)
+            elif event.key == pygame.K_PAGEUP: self.list_view.move(-self.list_view.page_size)
+            elif event.key == pygame.K_PAGEDOWN: self.list_view.move(self.list_view.page_size)
             elif event.key == pygame.K_RIGHT or event.key == pygame.K_PERIOD: self._enter_c()
             elif event.key == pygame.K_LEFT or event.key == pygame.K_COMMA: self._exit_c()
             elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS: self._exec("+")
             elif event.key == pygame.K_MINUS: self._exec("-")
             elif event.key == pygame.K_d: self._exec("d")
 
-    def _move(self, delta):
-        if not self.visible_items: return
-        count = len(self.visible_items)
-        new_idx = (self.selection_index + delta) % count
-        attempts = 0
-        while isinstance(self.visible_items[new_idx], str) and attempts < count:
-            new_idx = (new_idx + delta) % count
-            attempts += 1
-        self.selection_index = new_idx
-
     def _enter_c(self):
-        if not self.visible_items: return
-        sel = self.visible_items[self.selection_index]
-        if isinstance(sel, str): return
-        entity = sel if self.current_container else sel[0]
-        if hasattr(entity, 'container') and entity.container:
-            self.current_container = entity; self.selection_index = 0; self.rebuild_list()
+        row = self.list_view.selected_row
+        if row is None: return
+        entity = row[0]
+        if getattr(entity, 'container', None):
+            self.current_container = entity; self.rebuild_list()
 
     def _exit_c(self):
         if self.current_container:
-            self.current_container = None; self.selection_index = 0; self.rebuild_list()
+            self.current_container = None; self.rebuild_list()
 
     def _exec(self, code):
-        if not self.visible_items: return
-        sel = self.visible_items[self.selection_index]
-        if isinstance(sel, str): return
-        item = sel if self.current_container else sel[0]
-        changed = False
+        row = self.list_view.selected_row
+        if row is None: return
+        item = row[0]
+        player = self.game.player
 
         if code == "+": # Equip
-            if self.game.player.body.equip(item):
-                if item in self.game.all_sprites: item.kill()
-                if self.current_container and item in self.current_container.container.items:
-                     self.current_container.container.items.remove(item)
-                changed = True
+            # Out of its bag first: remove_item takes it out of the carrier's
+            # index, which equip() has to put it back into
+            inside = item.item.inside
+            where = inside.content.index(item) if inside else None
+            if inside:
+                inside.remove_item(item)
+            if not player.body.equip(item):
+                if inside:
+                    inside.restore(item, where) # Back where it was
+                return
+            if item in self.game.all_sprites: item.kill()
+            self._remove_row(item)
+            if not self.current_container:
+                section, slot = self._placed(item)
+                self._add_row(section, (item, slot))
         elif code == "-" or code == "d": # Remove / Drop
             if item.item.is_equipped:
-                for slot, eq in self.game.player.body.slots.items():
-                    if eq == item: self.game.player.body.slots[slot] = None; item.item.is_equipped = False; break
-            if self.current_container and item in self.current_container.container.items:
-                 self.current_container.container.items.remove(item)
+                player.body.unequip(item)
+            if item.item.inside:
+                 item.item.inside.remove_item(item)
             self._safe_drop(item)
-            changed = True
-        
-        if changed: self.rebuild_list()
+            self._remove_row(item)
+            if not self.current_container:
+                self._add_row("NEARBY", (item, "Ground"))
 
     def _safe_drop(self, item):
         px, py = (self.game.player.physics.x, self.game.player.physics.y) if self.game.player.physics else (1,1)
@@ -326,25 +371,39 @@ class InventoryState(GameState):
         if not hasattr(item, 'pickup'): item.pickup = PickupComponent()
         if item not in self.game.all_sprites: self.game.all_sprites.add(item)
 
+    # --- RENDERING ---
+
+    def _render_row(self, row):
+        """One row's surface; cached by the ListView until the row changes."""
+        surf = pygame.Surface((self.list_view.rect.width, self.list_view.row_height), pygame.SRCALPHA)
+        if isinstance(row, str):
+            surf.blit(self.font_header.render(row, True, cn.get("lightgrey")), (10, 0))
+            return surf
+        entity = row[0]
+        label = entity.item.name
+        if getattr(entity, 'stack', None) is not None and entity.stack.count > 1:
+            label = f"{label} (x{entity.stack.count})"
+        surf.blit(self.font_main.render(label, True, cn.get("white")), (30, 0))
+        return surf
+
     def draw(self, screen):
         screen.fill(cn.get("black"))
-        pygame.draw.rect(screen, cn.get("darkgrey"), (0,0,WIDTH,80))
-        pygame.draw.line(screen, cn.get("white"), (0,80), (WIDTH,80), 2)
+        pygame.draw.rect(screen, cn.get("darkgrey"), (0,0,db.WIDTH,80))
+        pygame.draw.line(screen, cn.get("white"), (0,80), (db.WIDTH,80), 2)
         screen.blit(self.font_status.render("Inventory", True, cn.get("white")), (10, 10))
-        
-        start_y = 90
-        for i, entry in enumerate(self.visible_items):
-            if isinstance(entry, str):
-                screen.blit(self.font_header.render(entry, True, cn.get("lightgrey")), (10, start_y + i*25))
-                continue
-            entity = entry if self.current_container else entry[0]
-            is_sel = (i == self.selection_index)
-            sel_color = cn.get((60, 60, 70))
-            if is_sel: pygame.draw.rect(screen, sel_color, (0, start_y + i*25, WIDTH, 25))
-            screen.blit(self.font_main.render(entity.item.name, True, cn.get("white")), (30, start_y + i*25))
+        # Cached totals, no walk over the bags
+        if self.current_container:
+            c = self.current_container.container
+            load = f"{self.current_container.item.name}: {c.contents_weight:.1f}/{c.capacity_weight:g} kg, {c.contents_volume:g}/{c.capacity_vol:g} vol"
+        else:
+            worn = {item for item in self.game.player.body.slots.values() if item}
+            load = f"Carrying {sum(item_weight(item) for item in worn):.1f} kg"
+        screen.blit(self.font_status.render(load, True, cn.get("silver")), (10, 30))
+
+        self.list_view.draw(screen)
             
-        pygame.draw.rect(screen, cn.get("darkgrey"), (0, HEIGHT-30, WIDTH, 30))
-        screen.blit(self.font_status.render("d:Drop +/-:Wear >:Enter <:Back", True, cn.get("silver")), (10, HEIGHT-22))
+        pygame.draw.rect(screen, cn.get("darkgrey"), (0, db.HEIGHT-30, db.WIDTH, 30))
+        screen.blit(self.font_status.render("d:Drop +/-:Wear >:Enter <:Back", True, cn.get("silver")), (10, db.HEIGHT-22))
 
 class PickupDirectionState(GameState):
     def enter(self):
@@ -371,7 +430,7 @@ class PickupDirectionState(GameState):
         self.game.states['roaming'].draw(screen)
         pygame.draw.rect(screen, (0,0,0), (10, 10, 300, 40))
         pygame.draw.rect(screen, cn.get("white"), (10, 10, 300, 40), 2)
-        screen.blit(pygame.font.SysFont("arial", 20).render("Direction? (Arrows/G)", True, cn.get("white")), (20, 18))
+        screen.blit(get_font("arial", 20).render("Direction? (Arrows/G)", True, cn.get("white")), (20, 18))
 
 class PickupSelectState(GameState):
     def __init__(self, game, tx, ty):
@@ -415,7 +474,7 @@ class PickupSelectState(GameState):
         bg = pygame.Rect(100, 100, 400, 300)
         pygame.draw.rect(screen, (30, 30, 30), bg)
         pygame.draw.rect(screen, (200, 200, 200), bg, 2)
-        font = pygame.font.SysFont("arial", 20)
+        font = get_font("arial", 20)
         for i, item in enumerate(self.items):
             color = cn.get("white")
             prefix = "> " if i == self.cursor else "  "
@@ -3,10 +3,15 @@ import random
 import logging
 from game.deebee import *
 from game.entities import create_player, create_mob, create_world_item
+from game.loader import create_item
+from game.components import set_stack_count
 
 logger = logging.getLogger(__name__)
 
 class CombatSystem:
+    def __init__(self, injury=None):
+        self.injury = injury # InjurySystem; per-part wounds for mobs that have them
+
     def update(self, player, mobs):
         """
         Handles combat interactions between the player and mobs.
@@ -20,19 +25,11 @@ class CombatSystem:
             
             # A. Check New Body System (Prioritize what is effectively held)
             weapon_found = False
-            if hasattr(player, "body") and player.body:
-                for slot_name, item_entity in player.body.slots.items():
-                    if item_entity:
-                        # Check if this slot is a hand (grasping slot)
-                        slot_tags = player.body.slot_tags.get(slot_name, [])
-                        if "grasp" in slot_tags:
-                            # Found an item in hand. 
-                            # Since items.json currently lacks 'atk' stats, we assign generic damage
-                            # based on the fact that they are holding *something*.
-                            # (Future: check item_entity.item.tags for 'weapon')
-                            weapon_dmg = 4 
-                            weapon_found = True
-                            break
+            if hasattr(player, "body") and player.body and player.body.active_weapon:
+                # Since items.json currently lacks 'atk' stats, we assign generic damage
+                # based on the fact that they are holding *something*.
+                weapon_dmg = 4
+                weapon_found = True
             
             # B. Fallback to Legacy Stats System (if no weapon held)
             if not weapon_found and hasattr(player, "stats"):
@@ -45,6 +42,8 @@ class CombatSystem:
             if hasattr(mob, "stats"):
                 mob.stats.hp -= weapon_dmg
                 logger.debug(f"Hit Mob! Damage: {weapon_dmg} | Mob HP: {mob.stats.hp}")
+            if self.injury is not None and getattr(mob, "injury", None):
+                self.injury.hit(mob, weapon_dmg)
             
             # Simulation: Knockback
             # Simple physics bounce: if player moving right, push mob right
@@ -56,79 +55,288 @@ class CombatSystem:
                 mob.physics.vx += push_x
                 mob.physics.vy += push_y
 
-            if hasattr(mob, "stats") and mob.stats.hp <= 0:
-                mob.kill()
+            dead = getattr(mob, "injury", None) is not None and mob.injury.dead
+            if dead or (hasattr(mob, "stats") and mob.stats.hp <= 0):
+                mob.despawn() # Back to the pool, gear included
 
         # 2. Mobs hit Player (Optional: Add this logic here later)
 
-class MaterialSystem:
-    def __init__(self, material_db):
-        self.material_db = material_db
-        logger.info("MaterialSystem initialized.")
-
-    def update(self, game_context, dt):
-        # 1. Get Global Context from the passed 'game_context'
-        # Ensure game_context has a 'weather' attribute (e.g. game.weather)
-        # If 'weather' isn't implemented yet, handle that safety check.
-        weather = getattr(game_context, "weather", None)
-        current_weather = weather.current if weather else "none"
-        temp = weather.temperature if weather else 20
-        
-        # 2. Iterate Entities
-        # We access entities from the game_context
-        for sprite in game_context.all_sprites:
-            if hasattr(sprite, 'material'):
-                mat = sprite.material
-                
-                # Use the injected DB, not a global
-                props = self.material_db.get(mat.material_id, {})
-                
-                # --- PHASE A: IMMEDIATE PHYSICS ---
-                if current_weather == "rain": # and check shelter...
-                     mat.wetness = min(1.0, mat.wetness + dt * 0.1)
-                else:
-                     mat.wetness = max(0.0, mat.wetness - dt * 0.05)
-                
-                # --- PHASE B: REACTIONS ---
-                if props.get("rusts", False) and mat.wetness > 0.5:
-                    damage = 0.001 * dt 
-                    mat.integrity -= damage
+class LODSystem:
+    """
+    Level-of-detail simulation: how often an entity updates depends on how far
+    its chunk is from the player's chunk (Chebyshev distance, in chunks).
+
+    - FULL:    every tick.
+    - COARSE:  every 'coarse_interval' ticks, with the accumulated dt
+               (entities are staggered so the ring's cost is spread out).
+    - DORMANT: not touched at all. Dormant entities are bucketed by chunk and
+               caught up in one step (Entity.catch_up) when the player comes
+               back into range.
+
+    Tiers are recomputed only when the player crosses a chunk border, and only
+    for entities near the old or new position, so world size does not affect
+    per-frame cost. Membership comes from a TrackedGroup (on_add/on_remove).
+    """
+    FULL, COARSE, DORMANT = 0, 1, 2
+
+    def __init__(self, chunk_tiles=LOD_CHUNK_TILES, full_radius=LOD_FULL_RADIUS,
+                 coarse_radius=LOD_COARSE_RADIUS, coarse_interval=LOD_COARSE_INTERVAL):
+        self.chunk_px = chunk_tiles * TILESIZE
+        self.full_radius = full_radius
+        self.coarse_radius = coarse_radius
+        self.coarse_interval = coarse_interval
+
+        self.full = set()
+        self.coarse = {}    # entity -> accumulated dt
+        self.dormant = {}   # chunk -> {entity: time it fell asleep}
+        self._where = {}    # entity -> (tier, chunk)
+        self._phase = {}    # entity -> stagger slot for coarse updates
+        self._next_phase = 0
+
+        self.center = None  # Player's chunk
+        self.time = 0.0
+        self.tick = 0
+        logger.info("LODSystem initialized.")
+
+    # --- MEMBERSHIP (TrackedGroup listener) ---
+    def on_add(self, entity):
+        self._phase[entity] = self._next_phase % self.coarse_interval
+        self._next_phase += 1
+        self._place(entity, self._chunk_of(entity))
+
+    def on_remove(self, entity):
+        self._unplace(entity)
+        self._phase.pop(entity, None)
+
+    # --- TIERS ---
+    def _chunk_of(self, entity):
+        return (int(entity.pos_x) // self.chunk_px, int(entity.pos_y) // self.chunk_px)
+
+    def _tier_of(self, chunk):
+        if self.center is None:
+            return self.FULL
+        d = max(abs(chunk[0] - self.center[0]), abs(chunk[1] - self.center[1]))
+        if d <= self.full_radius:
+            return self.FULL
+        if d <= self.coarse_radius:
+            return self.COARSE
+        return self.DORMANT
+
+    def _place(self, entity, chunk):
+        tier = self._tier_of(chunk)
+        self._where[entity] = (tier, chunk)
+        if tier == self.FULL:
+            self.full.add(entity)
+        elif tier == self.COARSE:
+            self.coarse[entity] = 0.0
+        else:
+            self.dormant.setdefault(chunk, {})[entity] = self.time
+
+    def _unplace(self, entity):
+        where = self._where.pop(entity, None)
+        if where is None:
+            return None
+        tier, chunk = where
+        if tier == self.FULL:
+            self.full.discard(entity)
+            return 0.0
+        if tier == self.COARSE:
+            return self.coarse.pop(entity, 0.0)
+        bucket = self.dormant.get(chunk)
+        asleep_since = bucket.pop(entity, self.time) if bucket else self.time
+        if bucket is not None and not bucket:
+            del self.dormant[chunk]
+        return asleep_since
+
+    def _retier(self, entity):
+        """Re-buckets an active entity whose chunk or tier may have changed."""
+        where = self._where.get(entity)
+        if where is None:
+            return # Left the world during its own update
+        tier, chunk = where
+        new_chunk = self._chunk_of(entity)
+        new_tier = self._tier_of(new_chunk)
+        if new_chunk == chunk and new_tier == tier:
+            return
+        pending = self._unplace(entity)
+        self._place(entity, new_chunk)
+        # Carry unspent coarse time over so nothing is lost on promotion
+        if tier == self.COARSE and pending and new_tier == self.FULL:
+            entity.update(pending)
+
+    def _recenter(self, center):
+        """The player changed chunk: wake what came into range, re-tier the rest."""
+        self.center = center
+        r = self.coarse_radius
+        cx, cy = center
+        for x in range(cx - r, cx + r + 1):
+            for y in range(cy - r, cy + r + 1):
+                bucket = self.dormant.pop((x, y), None)
+                if not bucket:
+                    continue
+                for entity, asleep_since in bucket.items():
+                    del self._where[entity]
+                    self._place(entity, (x, y))
+                    entity.catch_up(self.time - asleep_since)
+
+        for entity in list(self.full) + list(self.coarse):
+            self._retier(entity)
 
-                if props.get("rots", False):
-                    rate = 0.001
-                    if temp > 30: rate *= 2
-                    if mat.wetness > 0.5: rate *= 2
-                    mat.integrity -= rate * dt
+    # --- UPDATE ---
+    def update(self, game, dt):
+        self.time += dt
+        self.tick += 1
+
+        player = game.player
+        if player is not None:
+            center = self._chunk_of(player)
+            if center != self.center:
+                self._recenter(center)
+
+        # 1. Full tier
+        for entity in list(self.full):
+            entity.update(dt)
+            self._retier(entity)
+
+        # 2. Coarse tier (staggered)
+        slot = self.tick % self.coarse_interval
+        phase = self._phase
+        for entity in list(self.coarse):
+            acc = self.coarse[entity] + dt
+            if phase.get(entity, 0) != slot:
+                self.coarse[entity] = acc
+                continue
+            self.coarse[entity] = 0.0
+            entity.update(acc)
+            self._retier(entity)
+
+    def counts(self):
+        """Entities per tier (for debug overlays/profiling)."""
+        return {
+            "full": len(self.full),
+            "coarse": len(self.coarse),
+            "dormant": sum(len(b) for b in self.dormant.values()),
+        }
 
 def attempt_stash_item(player, item_entity):
     """
-    Tries to add item to: 1. Largest worn container, 2. Hands.
+    Tries to add item to: 1. Roomiest carried container, 2. Hands.
     Returns (True, "Reason") or (False, "Reason").
     """
-    # 1. Containers
-    containers = []
+    # 1. Containers (any bag on the player, from the inventory index)
     if player.body:
-        for slot, equipped in player.body.slots.items():
-            if equipped and hasattr(equipped, 'container'):
-                containers.append(equipped.container)
-    
-    # Sort largest capacity first
-    containers.sort(key=lambda c: c.capacity_vol, reverse=True)
-    
-    for c in containers:
-        success, msg = c.add_item(item_entity)
-        if success: return True, f"Stored in {c.owner.item.name}"
+        containers = [bag.container for bag in player.body.inventory.with_component("container")
+                      if bag is not item_entity]
+        # Roomiest first (free volume is cached)
+        containers.sort(key=lambda c: c.free_volume, reverse=True)
+
+        for c in containers:
+            success, msg = c.add_item(item_entity)
+            if success: return True, f"Stored in {c.owner.item.name}"
 
     # 2. Hands
     if player.body:
-        for slot, tags in player.body.slot_tags.items():
-            if "grasp" in tags and player.body.slots[slot] is None:
-                player.body.slots[slot] = item_entity
-                item_entity.item.is_equipped = True
-                return True, "Held in hand"
+        if player.body.hold(item_entity):
+            return True, "Held in hand"
 
     return False, "Inventory full"
 
+def discard_item(carrier, item_entity):
+    """Takes an item off its carrier (bag or body) and removes it from the game."""
+    if item_entity.item.inside is not None:
+        item_entity.item.inside.remove_item(item_entity)
+    elif carrier.body:
+        carrier.body.unequip(item_entity)
+    item_entity.despawn()
+
+def consume_item(game, carrier, tag):
+    """EAT/QUAFF: uses up the first carried item with 'tag'. Returns its name or None."""
+    if not carrier.body:
+        return None
+    item_entity = carrier.body.inventory.first("tag", tag)
+    if item_entity is None:
+        return None
+    name = item_entity.item.name
+    discard_item(carrier, item_entity)
+    if game.bus:
+        game.bus.emit("item_consumed", {"entity": carrier, "item_id": item_entity.item.item_id})
+    return name
+
+def reload_weapon(carrier):
+    """
+    RELOAD: refills the active ranged weapon from carried ammo of its type.
+    Returns the rounds loaded.
+    """
+    body = carrier.body
+    weapon = body.active_weapon if body else None
+    ranged = getattr(weapon, 'ranged', None) if weapon else None
+    if ranged is None:
+        return 0
+    loaded = 0
+    while ranged.current_ammo < ranged.clip_size:
+        ammo = body.inventory.first("ammo", ranged.ammo_type)
+        if ammo is None:
+            break
+        stack = getattr(ammo, 'stack', None)
+        have = stack.count if stack is not None else 1
+        n = min(have, ranged.clip_size - ranged.current_ammo)
+        ranged.current_ammo += n
+        loaded += n
+        if n < have:
+            set_stack_count(ammo, have - n)
+        else:
+            discard_item(carrier, ammo)
+    return loaded
+
+# --- STACKS ---
+# Merging happens on its own in ContainerComponent.add_item; these are the
+# explicit operations (the inventory UI, trading, dropping part of a pile).
+
+def split_stack(game, item_entity, n):
+    """
+    Takes n items off a stack as a new, loose entity (not in any container
+    or group yet). Returns None if there is nothing to split.
+    """
+    stack = getattr(item_entity, 'stack', None)
+    if stack is None or n <= 0 or n >= stack.count:
+        return None
+    part = create_item(game, item_entity.item.item_id, game.item_protos)
+    if part is None:
+        return None
+    set_stack_count(item_entity, stack.count - n)
+    part.stack.count = n
+    return part
+
+def transfer_stack(game, item_entity, container, n=None):
+    """
+    Moves n items (default: the whole stack) into 'container', merging with
+    what is already there. Returns (True/False, reason); a failed move
+    leaves the source stack as it was.
+    """
+    stack = getattr(item_entity, 'stack', None)
+    if stack is None or n is None or n >= stack.count:
+        source = item_entity.item.inside
+        if source is None and item_entity.item.carrier is not None:
+            # Worn or held: it would end up on the body and in the bag at once
+            return False, "Take it off first"
+        where = source.content.index(item_entity) if source is not None else None
+        if source is not None:
+            source.remove_item(item_entity)
+        ok, msg = container.add_item(item_entity)
+        if not ok and source is not None:
+            source.restore(item_entity, where) # Back in its old spot, unmerged
+        return ok, msg
+
+    part = split_stack(game, item_entity, n)
+    if part is None:
+        return False, "Nothing to move"
+    ok, msg = container.add_item(part)
+    if not ok:
+        set_stack_count(item_entity, stack.count + n)
+        part.despawn()
+    return ok, msg
+
+
 class SpawnerSystem:
     def __init__(self):
         logger.info("SpawnerSystem initialized.")
@@ -0,0 +1,170 @@
+import math
+import random
+import logging
+
+import numpy as np
+
+from game.deebee import (
+    WEATHER_CELL_TILES,
+    WEATHER_PERIOD_S,
+    WEATHER_DAY_S,
+    WEATHER_KINDS,
+    WEATHER_BASE_C,
+    WEATHER_DAY_SWING_C,
+    WEATHER_PERIOD_SWING_C,
+    WEATHER_RAIN_COOLING_C,
+    WEATHER_SHELTER_C,
+    WEATHER_SHELTER_WALLS,
+    WEATHER_RELAX_RATE,
+    WEATHER_DIFFUSION,
+    WEATHER_RAIN_WET,
+    WEATHER_EVAPORATION,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _neighbors(grid):
+    """Sum of the 8 neighbors of every cell (out of bounds counts as wall)."""
+    padded = np.pad(grid, 1, mode='constant', constant_values=1)
+    h, w = grid.shape
+    total = np.zeros(grid.shape, dtype=np.int16)
+    for dy in (0, 1, 2):
+        for dx in (0, 1, 2):
+            if dx != 1 or dy != 1:
+                total += padded[dy:dy + h, dx:dx + w]
+    return total
+
+def _laplacian(field):
+    """5-point Laplacian with zero-flux (edge) borders."""
+    p = np.pad(field, 1, mode='edge')
+    return p[:-2, 1:-1] + p[2:, 1:-1] + p[1:-1, :-2] + p[1:-1, 2:] - 4.0 * field
+
+
+class Weather:
+    """
+    Weather for one map, deterministic in (map seed, game time): the same
+    seed at the same time always gives the same sky, whatever happened
+    before. Every WEATHER_PERIOD_S seconds a new period is rolled from a
+    generator seeded with (seed, period).
+
+    On top of the global state ('current', 'temperature') it keeps coarse
+    fields over the map (one cell per WEATHER_CELL_TILES tiles): air
+    temperature and ground wetness, relaxed toward the weather and diffused
+    between neighbors, updated at a low rate (WEATHER_RATE_HZ). Sheltered
+    tiles (open tiles mostly enclosed by walls) stay dry and buffered.
+
+    Everything else samples local conditions by lookup (temperature_at,
+    wetness_at, sheltered_at, rain_at), with scalars or NumPy arrays of
+    tile coordinates.
+    """
+    def __init__(self, game_map, seed=None, time=0.0, cell_tiles=WEATHER_CELL_TILES):
+        self.seed = str(seed if seed is not None else game_map.seed)
+        self.cell_tiles = cell_tiles
+        self.time = time
+        self._period = None
+        self.current = "clear"
+        self._offset = 0.0
+        self.rebuild_shelter(game_map)
+
+        self.temperature = self.air_temperature(time)
+        self.temp_field = np.full(self.shelter_frac.shape, self.temperature)
+        self.wet_field = np.zeros(self.shelter_frac.shape)
+        logger.info(f"Weather initialized ({self.current}, {self.temperature:.1f}C).")
+
+    def rebuild_shelter(self, game_map):
+        """Recompute the shelter masks, e.g. after the map's walls changed."""
+        walls = np.array(game_map.grid, dtype=np.int8)
+        self.height, self.width = walls.shape
+        # Tile level: open and hemmed in by walls (caves, alcoves)
+        self.sheltered = (walls == 0) & (_neighbors(walls) >= WEATHER_SHELTER_WALLS)
+
+        # Cell level: fraction of each cell that is under cover (walls count as cover)
+        c = self.cell_tiles
+        ch, cw = -(-self.height // c), -(-self.width // c)
+        covered = np.ones((ch * c, cw * c), dtype=np.float64)
+        covered[:self.height, :self.width] = self.sheltered | (walls == 1)
+        self.shelter_frac = covered.reshape(ch, c, cw, c).mean(axis=(1, 3))
+
+    # --- DETERMINISTIC SKY ---
+
+    def _roll(self, time):
+        period = int(time // WEATHER_PERIOD_S)
+        if period == self._period:
+            return
+        self._period = period
+        rng = random.Random(f"{self.seed}:{period}")
+        kinds, weights = zip(*WEATHER_KINDS.items())
+        self.current = rng.choices(kinds, weights=weights)[0]
+        self._offset = rng.uniform(-WEATHER_PERIOD_SWING_C, WEATHER_PERIOD_SWING_C)
+
+    def air_temperature(self, time):
+        """Open-air temperature at 'time' (daily cycle, coldest at time 0)."""
+        self._roll(time)
+        day = -math.cos(2.0 * math.pi * time / WEATHER_DAY_S)
+        temp = WEATHER_BASE_C + WEATHER_DAY_SWING_C * day + self._offset
+        if self.current == "rain":
+            temp -= WEATHER_RAIN_COOLING_C
+        return temp
+
+    def restore(self, time, temp_field=None, wet_field=None):
+        """
+        Jumps to 'time' (loading a save): the sky is rolled for that time,
+        and the fields are taken as saved if they still fit this map.
+        """
+        self.time = time
+        self.temperature = self.air_temperature(time)
+        if temp_field is not None and temp_field.shape == self.temp_field.shape:
+            self.temp_field[:] = temp_field
+            self.wet_field[:] = wet_field
+        else:
+            self.temp_field.fill(self.temperature)
+            self.wet_field.fill(0.0)
+
+    @property
+    def raining(self):
+        return self.current == "rain"
+
+    # --- FIELDS ---
+
+    def update(self, game, dt):
+        self.time += dt
+        self.temperature = self.air_temperature(self.time)
+
+        target = self.temperature * (1.0 - self.shelter_frac) + WEATHER_SHELTER_C * self.shelter_frac
+        rain = WEATHER_RAIN_WET * (1.0 - self.shelter_frac) if self.raining else 0.0
+
+        # Explicit steps of at most 1 s keep the diffusion stable after a long deferral
+        steps = max(1, int(math.ceil(dt)))
+        h = dt / steps
+        temp, wet = self.temp_field, self.wet_field
+        for _ in range(steps):
+            temp += h * (WEATHER_RELAX_RATE * (target - temp) + WEATHER_DIFFUSION * _laplacian(temp))
+            evaporation = WEATHER_EVAPORATION * np.maximum(temp, 0.0) * wet
+            wet += h * (rain - evaporation + WEATHER_DIFFUSION * _laplacian(wet))
+            np.clip(wet, 0.0, 1.0, out=wet)
+
+    # --- LOOKUPS (tile coordinates; scalars or arrays) ---
+
+    def _cell(self, x, y):
+        c = self.cell_tiles
+        cy = np.clip(np.asarray(y, dtype=np.int64) // c, 0, self.temp_field.shape[0] - 1)
+        cx = np.clip(np.asarray(x, dtype=np.int64) // c, 0, self.temp_field.shape[1] - 1)
+        return cy, cx
+
+    def temperature_at(self, x, y):
+        return self.temp_field[self._cell(x, y)]
+
+    def wetness_at(self, x, y):
+        return self.wet_field[self._cell(x, y)]
+
+    def sheltered_at(self, x, y):
+        ty = np.clip(np.asarray(y, dtype=np.int64), 0, self.height - 1)
+        tx = np.clip(np.asarray(x, dtype=np.int64), 0, self.width - 1)
+        return self.sheltered[ty, tx]
+
+    def rain_at(self, x, y):
+        """True where rain is actually falling on the tile."""
+        if not self.raining:
+            return np.zeros(np.shape(x), dtype=bool)
+        return ~self.sheltered_at(x, y)
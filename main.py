@@ -1,3 +1,5 @@
+import time
+_PROCESS_START = time.perf_counter() # Startup timeline origin: imports count too
 import sys
 import os
 from types import SimpleNamespace
@@ -9,12 +11,27 @@ import pygame
 from engine.events import StateManager, EventBus
 from engine import colors as cn
 from engine.input import InputManager
+from engine.pool import EntityPool
+from engine.base_entity import TrackedGroup
+from engine.spatial import SpatialHash
+from engine.scheduler import SystemScheduler
+from engine.startup import StartupTimeline, StartupGraph
+from engine.ui import preload_fonts
 from game.logger import init_logger
 # Game Logic
 import game.deebee as db
 
 from game.map_gen import Map
 from game.loader import *
+from game.bundle import load_game_data
+from game.hotreload import DataWatcher
+from game.ai import Blackboard
+from game.perception import PerceptionSystem
+from game.injury import InjurySystem
+from game.projectiles import ProjectileSystem
+from game.materials import MaterialSystem
+from game.weather import Weather
+from game.fire import FireSystem
 from game.systems import *
 # UI & States
 from game.hud import HUD
@@ -22,24 +39,25 @@ from game.states import MainMenuState, RoamingState
 # Persistence
 from game.persist import save_game_state, load_game_state
 
-# Redirects stdout and stderr to a file
-sys.stdout = open('output.log', 'w')
-sys.stderr = sys.stdout
+def redirect_output(path='output.log'):
+    """Redirects stdout and stderr to a file (only when the game itself runs)."""
+    sys.stdout = open(path, 'w')
+    sys.stderr = sys.stdout
 
 class Game:
     def __init__(self):
+        self.timeline = StartupTimeline(origin=_PROCESS_START)
+        self.timeline.record("imports", 0.0, self.timeline.now_ms())
+
         # 1. Setup Logging
-        init_logger(db.LOG_CONFIG)
+        self.timeline.phase("logger", init_logger, db.LOG_CONFIG)
         self.logger = logging.getLogger("Main")
         self.logger.info("--- Game Init Start ---")
 
         if not os.path.exists(DATA_DIR): os.makedirs(DATA_DIR)
-        pygame.init()
-        self.logger.info("Pygame Initialized")
-        pygame.display.set_caption(db.TITLE)
         
-        # Settings & Config
-        self.c = db.load_settings() # Assign settings to self.c for consistency
+        # Settings & Config (settings.json is read here, on first use)
+        self.c = db.settings() # Assign settings to self.c for consistency
         self.logger.info(f"Settings Loaded: {list(self.c.keys())}")
         self.cfg = SimpleNamespace(
             WIDTH = self.c["window"]["width"],
@@ -48,24 +66,102 @@ class Game:
             FPS =  self.c["performance"]["fps"]
         )
         self.logger.info(f"Config: {self.cfg}")
+        cn.configure(self.c) # UI theme / colorblind mode
+        self.running = True
+        self.dt = 0
+        self._next_map = None
+
+        # 2. Startup graph: data, fonts and the first map don't need the
+        # window, so they build on worker threads while pygame and the
+        # display come up here on the main thread
+        graph = StartupGraph(self.timeline, workers=db.STARTUP_WORKERS)
+        graph.add("pygame", self._init_pygame, main_thread=True)
+        graph.add("display", self._init_display, after=("pygame",), main_thread=True)
+        graph.add("data", self._load_data)
+        graph.add("fonts", lambda: preload_fonts(db.UI_FONTS), after=("pygame",))
+        graph.add("map", self._pregenerate_map)
+        graph.add("palette", cn.warm) # Imports spectra, builds the color scales
+        graph.add("states", self._init_states, after=("display", "fonts", "data", "palette"),
+                  main_thread=True)
+        graph.run()
+
+        # Game Objects (Initialized later)
+        self.map = None
+        self.weather = None
+        self.fire_system = None
+        self.bus = None
+        self.player = None
+        self.all_sprites = None
+        self.mobs = None
+        self.lod_system = None
+        self.spatial = None
+        self.perception_system = None
+        self.injury_system = None
+        self.projectile_system = None
+        self.combat_system = None
+        self.material_system = None
+        self.spawner_system = None
+
+        # Simulation schedule (driven by RoamingState.update)
+        self.blackboard = Blackboard()
+        self.scheduler = SystemScheduler(budget_ms=db.SIM_BUDGET_MS)
+        self.scheduler.add("blackboard", self._update_blackboard, order=0)
+        self.scheduler.add("perception", self._update_perception, order=5,
+                           rate_hz=db.PERCEPTION_RATE_HZ)
+        self.scheduler.add("entities", self._update_entities, order=10)
+        self.scheduler.add("projectiles", self._update_projectiles, order=15)
+        self.scheduler.add("combat", self._update_combat, order=20)
+        self.scheduler.add("injury", self._update_injury, order=25,
+                           rate_hz=db.INJURY_RATE_HZ)
+        self.scheduler.add("weather", self._update_weather, order=28,
+                           rate_hz=db.WEATHER_RATE_HZ, deferrable=True)
+        self.scheduler.add("fire", self._update_fire, order=29,
+                           rate_hz=db.FIRE_RATE_HZ)
+        self.scheduler.add("materials", self._update_materials, order=30,
+                           rate_hz=db.MATERIAL_RATE_HZ, deferrable=True)
+        self.logger.info(f"Init Complete ({self.timeline.now_ms():.1f} ms since start)")
+
+    # --- STARTUP TASKS (see StartupGraph in __init__) ---
+    def _init_pygame(self):
+        pygame.init()
+        self.logger.info("Pygame Initialized")
         self.input = InputManager(db.KEY_BINDINGS) # <--- Initialize Input
+        self.clock = pygame.time.Clock()
+
+    def _init_display(self):
+        pygame.display.set_caption(db.TITLE)
         self.screen = pygame.display.set_mode((db.WIDTH, db.HEIGHT))
         self.logger.info(f"Screen Created {db.WIDTH}x{db.HEIGHT}")
-        self.clock = pygame.time.Clock()
-        self.running = True
-        self.dt = 0
-        
-        # Data Loading
+
+    def _load_data(self):
+        # Data Loading: one precompiled bundle, rebuilt from JSON when a source changed
         self.logger.info("Loading Data...")
-        self.item_defs = load_items()
-        self.body_plans = load_body_plans()
-        self.loadout_defs = validate_loadouts(load_loadouts(), self.item_defs)
-        self.material_defs = load_materials()
-        self.mob_defs = load_mobs()
-        self.logger.info("Data Loaded")
+        data = load_game_data()
+        self.item_defs = data.item_defs
+        self.body_plans = data.body_plans
+        self.loadout_defs = data.loadout_defs
+        self.material_defs = data.material_defs
+        self.mob_defs = data.mob_defs
         
+        # Compiled once into prototypes so spawning never re-parses the dicts
+        self.material_table = data.material_table
+        self.item_protos = data.item_protos
+        self.body_templates = data.body_templates
+        self.part_tables = data.part_tables
+        self.mob_protos = data.mob_protos
+        self.logger.info("Data Loaded")
+
+    def _pregenerate_map(self):
+        # The first "New Game" (no custom seed) takes this instead of waiting
+        self._next_map = Map(db.GRID_WIDTH, db.GRID_HEIGHT)
+
+    def _init_states(self):
         self.hud = HUD()
         self.custom_seed = None
+        self.entity_pool = EntityPool(max_retained=db.POOL_MAX_RETAINED)
+        # Dev: edits to data/*.json are picked up while the game runs
+        # (off unless settings.json sets "debug": {"hotreload_poll_s": ...})
+        self.data_watcher = DataWatcher(self, db.HOTRELOAD_POLL_S) if db.HOTRELOAD_POLL_S > 0 else None
         
         # State Machine Initialization
         self.state_machine = StateManager(self)
@@ -78,30 +174,52 @@ class Game:
         self.logger.info("Pushing Main Menu")
         self.state_machine.push(self.states['menu'])
 
-        # Game Objects (Initialized later)
-        self.map = None
-        self.player = None
-        self.all_sprites = None
-        self.mobs = None
-        self.combat_system = None
-        self.material_system = None
-        self.spawner_system = None
-        self.logger.info("Init Complete")
+    # --- SCHEDULED SYSTEMS ---
+    # Resolved through self at call time, so new_game/load_game can swap
+    # the sprite groups and system instances underneath the scheduler.
+    def _update_blackboard(self, dt):
+        self.blackboard.refresh(self) # Shared AI facts, before any mob thinks
+
+    def _update_perception(self, dt):
+        if self.perception_system:
+            self.perception_system.update(self, dt)
+
+    def _update_entities(self, dt):
+        if self.lod_system:
+            self.lod_system.update(self, dt)
+
+    def _update_projectiles(self, dt):
+        if self.projectile_system:
+            self.projectile_system.update(self, dt)
+
+    def _update_combat(self, dt):
+        if self.combat_system:
+            self.combat_system.update(self.player, self.mobs)
+
+    def _update_injury(self, dt):
+        if self.injury_system:
+            self.injury_system.update(self, dt)
+
+    def _update_weather(self, dt):
+        if self.weather:
+            self.weather.update(self, dt)
+
+    def _update_fire(self, dt):
+        if self.fire_system:
+            self.fire_system.update(self, dt)
+
+    def _update_materials(self, dt):
+        if self.material_system:
+            self.material_system.update(self, dt) # Pass 'self' as game_context
 
 
     def new_game(self):
-        self.map = Map(db.GRID_WIDTH, db.GRID_HEIGHT, seed=self.custom_seed)
+        if self.custom_seed is None and self._next_map is not None:
+            self.map, self._next_map = self._next_map, None # Generated during startup
+        else:
+            self.map = Map(db.GRID_WIDTH, db.GRID_HEIGHT, seed=self.custom_seed)
         self.custom_seed = None
-
-        self.bus = EventBus()
-        
-        self.all_sprites = pygame.sprite.Group()
-        self.mobs = pygame.sprite.Group()
-        
-        # Initialize systems BEFORE using them
-        self.combat_system = CombatSystem()
-        self.material_system = MaterialSystem(self.material_defs)
-        self.spawner_system = SpawnerSystem()
+        self.reset_world()
         
         # Now it is safe to spawn entities
         self.spawner_system.spawn_player(self)
@@ -110,6 +228,41 @@ class Game:
 
         self.state_machine.set(self.states['roaming'])
 
+    def reset_world(self):
+        """
+        Fresh bus, pool, systems and groups around self.map, ready for
+        entities (a new game spawns them, a loaded save restores them).
+        """
+        # Queued: subscribers run at the end of the tick, not mid-iteration
+        self.bus = EventBus(queued=True, trace_size=db.EVENT_TRACE_SIZE)
+        
+        self.entity_pool.clear()
+        
+        # Initialize systems BEFORE using them
+        self.reset_world_groups()
+        self.combat_system = CombatSystem(self.injury_system)
+        self.spawner_system = SpawnerSystem()
+
+        # Weak: drops out with this world's perception system
+        self.bus.subscribe("projectile_hit", self.perception_system.on_projectile_hit, weak=True)
+
+    def reset_world_groups(self):
+        """
+        Fresh sprite groups. all_sprites feeds the LOD tiers, the spatial
+        hash and the material state arrays as entities come and go.
+        """
+        self.weather = Weather(self.map) if self.map else None # Deterministic from the map seed
+        self.lod_system = LODSystem()
+        self.spatial = SpatialHash(cell_tiles=db.LOD_CHUNK_TILES)
+        self.perception_system = PerceptionSystem(self.spatial, self.lod_system)
+        self.injury_system = InjurySystem()
+        self.projectile_system = ProjectileSystem(self.spatial)
+        self.material_system = MaterialSystem(self.material_table, clock=self.scheduler)
+        self.fire_system = FireSystem(self.map, self.spatial, self.material_table) if self.map else None
+        self.all_sprites = TrackedGroup(listeners=(self.lod_system, self.spatial,
+                                                   self.material_system))
+        self.mobs = pygame.sprite.Group()
+
     def save_game(self):
         save_game_state(self)
 
@@ -127,34 +280,44 @@ class Game:
     def run(self):
         self.logger.info("Entering Run Loop")
         while self.running:
-            self.dt = self.clock.tick(self.cfg.FPS) / 1000.0
-            
-            # 1. Poll Inputs
-            self.input.update() # <--- Translate Keys to Actions
-            
-            # 2. Handle Events (Quit, Typing)
-            # We still need this for window events and text typing
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                
-                # Pass RAW events to state machine (for typing)
-                self.state_machine.handle_event(event)
-            
-            # 3. Handle Actions (Gameplay / Menu Nav)
-            # Pass PROCESSED actions to state machine
-            self.state_machine.handle_input(self.input)
-            
-            self.state_machine.update()
-            
-            # System Updates (Run these regardless of State, or inside RoamingState)
-            if self.state_machine.stack and isinstance(self.state_machine.stack[-1], self.states['roaming'].__class__):
-                 self.material_system.update(self, self.dt) # Pass 'self' as game_context
+            self.step()
+
+    def step(self):
+        """One frame: input, simulation, drawing."""
+        self.dt = self.clock.tick(self.cfg.FPS) / 1000.0
+        if self.data_watcher:
+            self.data_watcher.poll()
+        
+        # 1. Poll Inputs
+        self.input.update() # <--- Translate Keys to Actions
+        
+        # 2. Handle Events (Quit, Typing)
+        # We still need this for window events and text typing
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
             
-            self.state_machine.draw(self.screen)
-            pygame.display.flip()
+            # Pass RAW events to state machine (for typing)
+            self.state_machine.handle_event(event)
+        
+        # 3. Handle Actions (Gameplay / Menu Nav)
+        # Pass PROCESSED actions to state machine
+        self.state_machine.handle_input(self.input)
+        
+        # Simulation systems run inside RoamingState.update via self.scheduler
+        self.state_machine.update()
+
+        # Deliver this tick's events now that every system is done iterating
+        if self.bus:
+            self.bus.flush()
+        
+        self.state_machine.draw(self.screen)
+        pygame.display.flip()
+        if self.timeline.first_frame_ms is None:
+            self.timeline.first_frame() # Logs the startup timeline
 
 if __name__ == "__main__":
+    redirect_output()
     g = Game()
     g.run()
     pygame.quit()
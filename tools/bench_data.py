@@ -0,0 +1,70 @@
+"""
+Data loading benchmark: JSON parse + compile vs. the precompiled bundle.
+
+Usage:
+    python tools/bench_data.py [runs]
+
+Runs headless (dummy SDL driver). Builds a bundle in a temp directory
+(the game's own data/cache is left alone), then times both paths and
+the staleness check on its own. Then loads every body plan species
+(lazy registry) and reports what each one cost.
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.bundle import compile_game_data, write_bundle, read_bundle, BUNDLE_SOURCES, _fresh, _read_header
+from game.loader import BodyPlanRegistry
+
+
+def timed(fn, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logging.disable(logging.WARNING) # Loader chatter would swamp the report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "defs.bundle")
+        write_bundle(compile_game_data(), path)
+        size = os.path.getsize(path)
+
+        def check():
+            with open(path, 'rb') as f:
+                assert _fresh(_read_header(f), BUNDLE_SOURCES)[0]
+
+        json_ms = timed(compile_game_data, runs)
+        bundle_ms = timed(lambda: read_bundle(path), runs)
+        check_ms = timed(check, runs)
+
+    print(f"Best of {runs} runs:")
+    print(f"  JSON + compile:   {json_ms:8.2f} ms")
+    print(f"  Bundle load:      {bundle_ms:8.2f} ms  ({size / 1024:.1f} KB, {json_ms / bundle_ms:.1f}x faster)")
+    print(f"    staleness check {check_ms:8.2f} ms  ({len(BUNDLE_SOURCES)} sources)")
+
+    # Body plans: what each species costs the first time it is spawned
+    start = time.perf_counter()
+    registry = BodyPlanRegistry()
+    print(f"\nBody plan index: {len(registry.species())} species in {(time.perf_counter() - start) * 1000:.2f} ms")
+    for species in registry.species():
+        start = time.perf_counter()
+        registry.template(species)
+        registry.part_table(species)
+        ms = (time.perf_counter() - start) * 1000
+        print(f"  {species:<10} {len(registry.plan(species)):4d} parts  {ms:6.2f} ms  "
+              f"{registry.memory_report()[species] / 1024:7.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Save/load benchmark for the binary save format (game/persist.py).
+
+Usage:
+    python tools/bench_save.py [mobs] [runs]
+
+Runs headless (dummy SDL driver) on a temp save file. Starts a new game,
+adds 'mobs' geared goblins, then times save and load (median of 'runs')
+and reports the file size. For scale it also prints the size of the old
+JSON layout (seed, grid, positions and hp only; no gear or containers).
+"""
+import os
+import sys
+import json
+import time
+import runpy
+import logging
+import statistics
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import game.persist as persist
+
+
+def legacy_json_size(game):
+    data = {
+        "seed": game.map.seed,
+        "player": {"x": game.player.physics.x, "y": game.player.physics.y, "hp": game.player.stats.hp},
+        "map_grid": game.map.grid,
+        "mobs": [{"x": m.physics.x, "y": m.physics.y, "hp": m.stats.hp} for m in game.mobs],
+    }
+    return len(json.dumps(data))
+
+
+def timed(fn, game):
+    start = time.perf_counter()
+    if not fn(game):
+        sys.exit(f"{fn.__name__} failed")
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    mobs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    ns = runpy.run_path(os.path.join(ROOT, "main.py"), run_name="bench")
+    sys.stdout = open(os.devnull, "w") # Factories and persist print
+    logging.disable(logging.WARNING)
+    game = ns["Game"]()
+    game.new_game()
+    game.spawner_system.spawn_mob(game, "goblin", count=mobs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        persist.SAVE_FILE = os.path.join(tmp, "bench.sav")
+        saves, loads = [], []
+        for _ in range(runs):
+            saves.append(timed(persist.save_game_state, game))
+            loads.append(timed(persist.load_game_state, game))
+        size = os.path.getsize(persist.SAVE_FILE)
+    entities = 1 + len(game.mobs) + sum(len(e.body._worn) for e in game.all_sprites
+                                        if getattr(e, 'body', None) is not None)
+    legacy = legacy_json_size(game)
+
+    sys.stdout = sys.__stdout__
+    print(f"{len(game.mobs)} mobs, ~{entities} entities, grid {game.map.width}x{game.map.height}")
+    print(f"  binary save: {size:8} bytes  save {statistics.median(saves):7.1f} ms  load {statistics.median(loads):7.1f} ms")
+    print(f"  old JSON:    {legacy:8} bytes  (positions and hp only)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Spawn benchmark: instantiates N mobs from their compiled prototypes.
+
+Usage:
+    python tools/bench_spawn.py [mob_id] [count]
+
+Runs headless (dummy SDL driver). Reports a cold pass (empty pool, every mob
+built from its prototype) and a warm pass (pool primed by despawning the
+cold batch).
+"""
+import os
+import sys
+import time
+import logging
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.pool import EntityPool
+from game.loader import load_items, load_body_plans, load_mobs
+from game.prototypes import compile_items, compile_mobs
+from game.entities import create_mob
+
+
+def build_context(pool_size):
+    """Minimal stand-in for the Game object: just the data the factories read."""
+    game = SimpleNamespace()
+    game.item_defs = load_items()
+    game.body_plans = load_body_plans()
+    game.mob_defs = load_mobs()
+    game.item_protos = compile_items(game.item_defs)
+    game.body_templates = game.body_plans.templates # Lazy: built on first spawn
+    game.part_tables = game.body_plans.part_tables
+    game.mob_protos = compile_mobs(game.mob_defs, game.body_templates, game.item_protos,
+                                   game.part_tables)
+    game.entity_pool = EntityPool(max_retained=pool_size)
+    return game
+
+
+def run_pass(game, mob_id, count):
+    start = time.perf_counter()
+    mobs = [create_mob(game, mob_id, x=1, y=1) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    return mobs, elapsed
+
+
+def main():
+    mob_id = sys.argv[1] if len(sys.argv) > 1 else "goblin"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    logging.basicConfig(level=logging.WARNING)
+
+    game = build_context(pool_size=count)
+
+    mobs, cold = run_pass(game, mob_id, count)
+    for mob in mobs:
+        mob.despawn()
+    mobs, warm = run_pass(game, mob_id, count)
+
+    print(f"Spawned {count} x '{mob_id}'")
+    print(f"  cold (prototype clone): {cold * 1000:8.1f} ms  ({cold / count * 1e6:6.1f} us/mob)")
+    print(f"  warm (pool reuse):      {warm * 1000:8.1f} ms  ({warm / count * 1e6:6.1f} us/mob)")
+    for archetype, stats in game.entity_pool.stats().items():
+        print(f"  {archetype}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Startup benchmark: time-to-first-frame and the per-phase timeline.
+
+Usage:
+    python tools/bench_startup.py [runs]
+
+Each run is a fresh interpreter (imports and the first font scan count),
+headless (dummy SDL driver), with its log output discarded. It builds
+Game(), draws one frame and reports the StartupTimeline. Prints the
+median of every phase over the runs, then time-to-first-frame.
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import os, sys, json, runpy
+sys.path.insert(0, {root!r})
+ns = runpy.run_path(os.path.join({root!r}, "main.py"), run_name="bench")
+game = ns["Game"]()
+game.step()
+with open({out!r}, "w") as f:
+    json.dump({{"phases": game.timeline.phases, "first_frame": game.timeline.first_frame_ms}}, f)
+"""
+
+
+def run_once(tmp):
+    out = os.path.join(tmp, "timeline.json")
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    subprocess.run([sys.executable, "-c", CHILD.format(root=ROOT, out=out)],
+                   cwd=tmp, env=env, stdout=subprocess.DEVNULL, check=True)
+    with open(out) as f:
+        return json.load(f)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    durations, starts, frames = {}, {}, []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(runs):
+            result = run_once(tmp)
+            for name, start, end, thread in result["phases"]:
+                durations.setdefault(name, []).append(end - start)
+                starts.setdefault(name, []).append(start)
+            frames.append(result["first_frame"])
+
+    print(f"Median of {runs} runs (ms):")
+    for name in sorted(durations, key=lambda n: statistics.median(starts[n])):
+        print(f"  {name:<12} starts {statistics.median(starts[name]):8.1f}  takes {statistics.median(durations[name]):8.1f}")
+    print(f"  time to first frame: {statistics.median(frames):.1f} ms (best {min(frames):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Import-time regression check for the core modules.
+
+Usage:
+    python tools/check_importtime.py [runs]
+
+Imports each module in a fresh interpreter under 'python -X importtime'
+and checks:
+  - its cost beyond pygame/numpy (which every game module needs, and which
+    we don't control) stays within BUDGET_MS (best of 'runs');
+  - nothing in FORBIDDEN gets imported (heavy, only needed on first use);
+  - importing it has no side effects: settings.json is not read and
+    sys.stdout is left alone.
+
+Exits non-zero on any failure, so it can gate a commit or CI job.
+"""
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cost beyond pygame/numpy, in ms: about 3x what they take today (with some
+# slack for the small ones, which are mostly noise).
+BUDGET_MS = {
+    "engine.tags": 15,
+    "engine.pool": 15,
+    "engine.startup": 40,
+    "engine.colors": 10,
+    "engine.ui": 10,
+    "game.deebee": 10,
+    "game.components": 15,
+    "game.loader": 40,
+    "game.prototypes": 40,
+    "game.materials": 40,
+    "game.bundle": 50,
+    "game.hotreload": 40,
+    "game.systems": 15,
+    "game.entities": 15,
+    "game.states": 30,
+    "game.hud": 15,
+    "game.persist": 40,
+    "main": 70,
+}
+
+# Third-party roots not counted against the budget
+EXCLUDED = ("pygame", "numpy")
+
+# Must only be imported on first use, never by importing a core module
+FORBIDDEN = ("spectra", "hsluv", "colormath2", "networkx")
+
+SIDE_EFFECTS = """
+import sys, {module}
+import game.deebee as db
+problems = []
+if db._user_settings is not None: problems.append("settings.json read at import")
+if sys.stdout is not sys.__stdout__: problems.append("sys.stdout replaced at import")
+sys.exit("; ".join(problems))
+"""
+
+
+def parse_importtime(stderr):
+    """[(depth, name, cumulative_us)] from -X importtime output (children come before parents)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(cumulative)))
+    return rows
+
+def excluded_us(rows):
+    """Time spent in EXCLUDED packages, counting each only where it isn't inside another."""
+    total, stack = 0, []
+    for depth, name, us in reversed(rows): # Parents first
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        if name in EXCLUDED and not any(parent in EXCLUDED for _, parent in stack):
+            total += us
+        stack.append((depth, name))
+    return total
+
+
+def cost_ms(module):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    rows = parse_importtime(result.stderr)
+    total = next(us for _, name, us in rows if name == module)
+    loaded = {name for _, name, _ in rows}
+    return (total - excluded_us(rows)) / 1000, [m for m in FORBIDDEN if m in loaded]
+
+
+def side_effects(module):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-c", SIDE_EFFECTS.format(module=module)],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    return result.stderr.strip() if result.returncode else ""
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    failures = 0
+    print(f"{'module':<18} {'ms':>7} {'budget':>7}")
+    for module, budget in BUDGET_MS.items():
+        best, forbidden = float("inf"), []
+        for _ in range(runs):
+            ms, forbidden = cost_ms(module)
+            best = min(best, ms)
+        problems = []
+        if best > budget:
+            problems.append("over budget")
+        if forbidden:
+            problems.append(f"imports {', '.join(forbidden)}")
+        effect = side_effects(module)
+        if effect:
+            problems.append(effect)
+        failures += bool(problems)
+        print(f"{module:<18} {best:7.1f} {budget:7}  {'; '.join(problems) or 'ok'}")
+
+    print("FAILED" if failures else "All within budget.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
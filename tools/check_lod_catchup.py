@@ -0,0 +1,111 @@
+"""
+LOD catch-up check: a mob that sleeps through a stretch of time in the
+dormant tier must wake up in the same state as one updated all along.
+
+Usage:
+    python tools/check_lod_catchup.py [ticks]
+
+Runs headless (dummy SDL driver). The same scenario is played twice on a
+fresh mob: once with the player next to it (FULL tier every tick), once
+with the player far away while the world changes (the mob is dormant,
+then woken by Entity.catch_up). The woken mob is compared straight after
+catch_up, before its next regular update; exits non-zero if anything differs.
+"""
+import os
+import sys
+import runpy
+import logging
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game.deebee import TILESIZE
+from game.systems import LODSystem
+from game.entities import create_mob
+
+DT = 1 / 60
+
+
+def snapshot(mob):
+    control, phys, stats = mob.control, mob.physics, mob.stats
+    worn = sorted((item.item.item_id, round(item.material.integrity, 6), round(item.material.wetness, 6))
+                  for item in mob.body._worn if getattr(item, 'material', None) is not None)
+    return {
+        "action": control.action,
+        "heading": (round(phys.vx, 6), round(phys.vy, 6)),
+        "home": control.home,
+        "hp": stats.hp,
+        "blood": mob.injury.blood if getattr(mob, 'injury', None) else None,
+        "worn": worn,
+    }
+
+
+def tick(game, lod):
+    game.scheduler.time += DT
+    game.blackboard.refresh(game)
+    lod.update(game, DT)
+
+
+def play(game, ticks, sleep):
+    """Mob chases, loses track of the player and gets hurt; 'sleep' keeps the player away meanwhile."""
+    player = game.player
+    x, y = 10, 10
+    mob = create_mob(game, "goblin", x, y)
+    lod = LODSystem(chunk_tiles=4, full_radius=0, coarse_radius=0)
+    player.pos_x, player.pos_y = x * TILESIZE, y * TILESIZE
+    lod.on_add(mob)
+
+    perception = mob.perception
+    perception.aware, perception.last_known = True, (x + 5, y)
+    for _ in range(ticks):
+        tick(game, lod)
+
+    if sleep:
+        player.pos_x = player.pos_y = 1000 * TILESIZE
+    tick(game, lod)
+    # The world moves on: the trail goes cold and the mob takes a hit
+    perception.aware, perception.last_known = False, None
+    mob.stats.hp -= mob.stats.max_hp / 2
+    for _ in range(ticks):
+        tick(game, lod)
+
+    player.pos_x, player.pos_y = x * TILESIZE, y * TILESIZE
+    if sleep:
+        # Only the wake-up (the start of LODSystem.update): the state must be
+        # right straight after catch_up, before any regular update runs
+        game.scheduler.time += DT
+        game.blackboard.refresh(game)
+        lod.time += DT
+        lod._recenter(lod._chunk_of(player))
+    else:
+        tick(game, lod)
+    return snapshot(mob), sum(len(b) for b in lod.dormant.values())
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    ns = runpy.run_path(os.path.join(ROOT, "main.py"), run_name="check")
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w") # Factories print
+    logging.disable(logging.WARNING)
+    game = ns["Game"]()
+    game.new_game()
+
+    start = game.scheduler.time
+    awake, _ = play(game, ticks, sleep=False)
+    game.scheduler.time = start
+    woken, still_dormant = play(game, ticks, sleep=True)
+    sys.stdout = stdout
+
+    failures = [name for name in awake if awake[name] != woken[name]]
+    for name in awake:
+        print(f"  {name:<8} awake {awake[name]!s:<40} woken {woken[name]!s}")
+    if still_dormant:
+        failures.append("mob never woke up")
+    print("FAILED: " + ", ".join(failures) if failures else "Woken mob matches the one that stayed awake.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()